@@ -0,0 +1,187 @@
+"""
+Analyse des régimes de Brouwer : pentes des courbes log(concentration) par morceaux.
+
+Responsabilités principales :
+- Rééchantillonne toutes les courbes chargées (DataManager.resample) sur une grille commune, en log10(x_DP)
+  et en log10(x_*) (composition) ou mu_* (potentiel chimique)
+- Découpe chaque courbe en régimes linéaires : points où la pente locale est stable, séparés par les zones de
+  transition (pente qui varie de plus de tolerance sur quelques points) ; la pente locale est ajustée sur une
+  fenêtre glissante, et les régimes successifs de même pente (coupés par le bruit) sont fusionnés
+- Ajuste une droite (moindres carrés) par régime et calcule les points de rupture (intersection des droites
+  de deux régimes successifs)
+- Tous les calculs sont vectorisés sur l'ensemble des courbes (tableaux (n_courbes, n_points)), sans boucle
+  Python par courbe ni par régime
+"""
+
+import numpy as np
+import config
+from data_manager import make_grid
+
+
+def local_slope(x, logy, half_width):
+    """
+    Pente locale de chaque courbe : droite des moindres carrés sur une fenêtre glissante de 2 * half_width + 1
+    points centrée sur chaque point (sommes cumulées, vectorisé sur toutes les courbes). Beaucoup moins sensible
+    au bruit que la différence entre points voisins.
+
+    Entrées :
+        x (np.ndarray) : abscisse commune (n_points,).
+        logy (np.ndarray) : ordonnées (n_courbes, n_points) ; NaN hors domaine.
+        half_width (int) : demi-largeur de la fenêtre (en points).
+
+    Sortie :
+        np.ndarray (n_courbes, n_points) : pente locale, NaN si la fenêtre déborde ou contient un NaN.
+    """
+    n_curves, n_points = logy.shape
+    width = 2 * half_width + 1
+    slope = np.full(logy.shape, np.nan)
+    if n_points < width or width < 2:
+        return slope
+    valid = np.isfinite(logy)
+    xc = np.broadcast_to(x - x.mean(), logy.shape)  # Abscisse centrée : sommes mieux conditionnées
+    y = np.where(valid, logy, 0.0)
+    terms = np.stack([valid.astype(float), np.where(valid, xc, 0.0), y, np.where(valid, xc * xc, 0.0), xc * y])
+    cumulative = np.concatenate([np.zeros(terms.shape[:2] + (1,)), np.cumsum(terms, axis=2)], axis=2)
+    n, sx, sy, sxx, sxy = cumulative[:, :, width:] - cumulative[:, :, :-width]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        window = (n * sxy - sx * sy) / (n * sxx - sx * sx)
+    slope[:, half_width:n_points - half_width] = np.where(n == width, window, np.nan)
+    return slope
+
+
+def fit_regimes(x, logy, tolerance=config.SLOPE_TOLERANCE, lag=4, min_points=config.SLOPE_MIN_POINTS):
+    """
+    Découpe des courbes en régimes linéaires et ajustement d'une droite par régime.
+
+    Entrées :
+        x (np.ndarray) : abscisse commune croissante (n_points,), déjà en log10 pour une composition.
+        logy (np.ndarray) : log10 des concentrations (n_courbes, n_points) ; NaN hors domaine.
+        tolerance (float) : variation relative de pente tolérée dans un régime (par rapport à la pente
+                            typique de la courbe, 95e centile de |pente|).
+        lag (int) : écart (en points de grille) sur lequel la variation de pente est mesurée, et demi-largeur
+                    de la fenêtre de la pente locale (voir local_slope).
+        min_points (int) : nombre minimal de points d'un régime (les plus courts sont ignorés).
+
+    Sortie :
+        regimes (dict) de tableaux 1D, un élément par régime, triés par courbe puis par abscisse :
+            'curve' (indice de courbe), 'xstart', 'xstop', 'slope', 'intercept' (log10 y = slope * x + intercept),
+            'npoints'.
+    """
+    n_curves, n_points = logy.shape
+    with np.errstate(invalid="ignore", divide="ignore"):
+        slope = local_slope(x, logy, lag)
+        # Variation de pente sur lag points, en arrière et en avant : les deux bords d'une transition sont exclus
+        change = np.full(logy.shape, np.inf)
+        if n_points > lag:
+            delta = np.abs(slope[:, lag:] - slope[:, :-lag])
+            change[:, lag:] = delta
+            change[:, :-lag] = np.where(np.isfinite(change[:, :-lag]), np.maximum(change[:, :-lag], delta), delta)
+        finite = np.isfinite(slope)
+        scale = np.nanpercentile(np.where(finite, np.abs(slope), np.nan), 95, axis=1, keepdims=True) \
+            if finite.any() else np.ones((n_curves, 1))
+        scale = np.where(np.isfinite(scale) & (scale > 0), scale, 1.0)
+    stable = finite & (change <= tolerance * scale)
+
+    # Numérotation des régimes : un nouveau régime commence à chaque point stable précédé d'un point instable
+    starts = stable & ~np.concatenate([np.zeros((n_curves, 1), dtype=bool), stable[:, :-1]], axis=1)
+    segment = np.cumsum(starts, axis=1)
+    rows, cols = np.nonzero(stable)
+    ids, inverse = np.unique(rows * (n_points + 1) + segment[rows, cols], return_inverse=True)
+    xs, ys = x[cols], logy[rows, cols]
+    # Sommes par régime (bincount) : ajustement par moindres carrés de tous les régimes en une fois
+    n = np.bincount(inverse, minlength=ids.size).astype(float)
+    sx = np.bincount(inverse, xs, minlength=ids.size)
+    sy = np.bincount(inverse, ys, minlength=ids.size)
+    sxx = np.bincount(inverse, xs * xs, minlength=ids.size)
+    sxy = np.bincount(inverse, xs * ys, minlength=ids.size)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        fit_slope = (n * sxy - sx * sy) / (n * sxx - sx * sx)
+        intercept = (sy - fit_slope * sx) / n
+    xstart = np.full(ids.size, np.inf)
+    xstop = np.full(ids.size, -np.inf)
+    np.minimum.at(xstart, inverse, xs)
+    np.maximum.at(xstop, inverse, xs)
+    curve = ids // (n_points + 1)
+    keep = (n >= max(min_points, 2)) & np.isfinite(fit_slope)
+    curve, fit_slope = curve[keep], fit_slope[keep]
+    sums = np.stack([n, sx, sy, sxx, sxy])[:, keep]
+    xstart, xstop = xstart[keep], xstop[keep]
+
+    # Fusion des régimes successifs d'une même courbe dont les pentes ajustées concordent (à tolerance près) :
+    # le bruit coupe un régime en morceaux de même pente, qui ne doivent pas produire de fausses ruptures
+    merge = (curve[1:] == curve[:-1]) & \
+        (np.abs(fit_slope[1:] - fit_slope[:-1]) <= tolerance * scale[curve[1:], 0])
+    group = np.cumsum(np.concatenate(([False], ~merge)))[:curve.size]
+    first = np.flatnonzero(np.concatenate(([True], ~merge))[:curve.size])
+    n, sx, sy, sxx, sxy = (np.bincount(group, row, minlength=first.size) for row in sums)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        fit_slope = (n * sxy - sx * sy) / (n * sxx - sx * sx)
+        intercept = (sy - fit_slope * sx) / n
+    last = np.append(first[1:], curve.size)[:first.size] - 1
+    return {'curve': curve[first], 'xstart': xstart[first], 'xstop': xstop[last],
+            'slope': fit_slope, 'intercept': intercept, 'npoints': n.astype(int)}
+
+def breakpoints(regimes):
+    """
+    Points de rupture entre régimes successifs d'une même courbe : intersection des deux droites ajustées,
+    ou milieu de la zone de transition si l'intersection tombe hors de l'intervalle des deux régimes.
+
+    Sortie :
+        dict de tableaux 1D : 'curve', 'x' (abscisse de rupture), 'slope_before', 'slope_after'.
+    """
+    curve = regimes['curve']
+    same = curve[1:] == curve[:-1]
+    a1, a2 = regimes['slope'][:-1][same], regimes['slope'][1:][same]
+    b1, b2 = regimes['intercept'][:-1][same], regimes['intercept'][1:][same]
+    lo, hi = regimes['xstart'][:-1][same], regimes['xstop'][1:][same]
+    middle = (regimes['xstop'][:-1][same] + regimes['xstart'][1:][same]) / 2
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cross = (b2 - b1) / (a1 - a2)
+    x = np.where(np.isfinite(cross) & (cross >= lo) & (cross <= hi), cross, middle)
+    return {'curve': curve[1:][same], 'x': x, 'slope_before': a1, 'slope_after': a2}
+
+
+def brouwer_analysis(manager, x_label, y_label="x_DP", xmin=None, xmax=None,
+                     n_points=config.SLOPE_GRID_POINTS, tolerance=config.SLOPE_TOLERANCE,
+                     min_points=config.SLOPE_MIN_POINTS):
+    """
+    Analyse des régimes de toutes les courbes chargées dans un DataManager.
+
+    Entrées :
+        manager (DataManager) : données chargées.
+        x_label (str) : abscisse (x_* : analyse en log10(x) ; mu_* : analyse en fonction de mu).
+        y_label (str) : concentration analysée (log10).
+        xmin, xmax (float, optionnel) : intervalle analysé (None = domaine commun des données).
+        n_points (int) : taille de la grille de rééchantillonnage.
+        tolerance, min_points : voir fit_regimes.
+
+    Sortie :
+        dict {'log_x', 'regimes', 'breakpoints'} ; les abscisses des régimes et ruptures sont dans l'espace
+        d'analyse (log10(x) si log_x).
+
+    Exceptions :
+        ValueError si la colonne est inconnue ou si l'intervalle est vide.
+    """
+    columns = manager.get_columns(None, x_label)
+    if isinstance(columns, list):
+        lo_data = min(np.nanmin(c) for c in columns if c.size)
+        hi_data = max(np.nanmax(c) for c in columns if c.size)
+    else:
+        lo_data, hi_data = np.nanmin(columns), np.nanmax(columns)
+    lo = lo_data if xmin is None else max(min(xmin, xmax), lo_data)
+    hi = hi_data if xmax is None else min(max(xmin, xmax), hi_data)
+    log_x = x_label.startswith("x_")
+    if log_x:
+        # Composition en log : on part de la plus petite valeur positive
+        positive = columns[columns > 0] if not isinstance(columns, list) else \
+            np.concatenate([c[c > 0] for c in columns])
+        lo = max(lo, positive.min()) if positive.size else lo
+        log_x = lo > 0
+    if not np.isfinite(lo) or not np.isfinite(hi) or hi <= lo:
+        raise ValueError(f"Intervalle d'analyse vide pour {x_label} : [{lo}, {hi}]")
+    grid = make_grid(lo, hi, n_points, "log" if log_x else "linear")
+    values = manager.resample(x_label, grid, y_label, "log")
+    with np.errstate(invalid="ignore", divide="ignore"):
+        logy = np.log10(np.where(values > 0, values, np.nan))
+    regimes = fit_regimes(np.log10(grid) if log_x else grid, logy, tolerance, min_points=min_points)
+    return {'log_x': log_x, 'regimes': regimes, 'breakpoints': breakpoints(regimes)}
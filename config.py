@@ -12,3 +12,50 @@ DEFAULT_TEMP = "1000"
 
 MAX_SITES = 10
 MAX_ATOMS = 10
+
+# Mode multi-températures : motif remplacé par chaque température dans le nom du système
+# (ex : "TiN_adpi_{T}K" -> "TiN_adpi_800K", "TiN_adpi_1000K", ...)
+TEMPERATURE_PLACEHOLDER = "{T}"
+
+# Export d'animations (balayage en température)
+ANIMATION_FPS = 4
+ANIMATION_DPI = 100
+# Rendu des images de l'animation : processus utilisés à partir de ANIMATION_PARALLEL_MIN températures
+ANIMATION_PROCESSES = 4
+ANIMATION_PARALLEL_MIN = 8
+# Images rendues par tâche du pool (les blocs sont transmis à l'encodeur au fur et à mesure)
+ANIMATION_CHUNK_FRAMES = 4
+
+# Archive binaire regroupant tous les fichiers d'un système (data_loader.pack_system)
+ARCHIVE_EXTENSION = ".adpipack"
+
+# Mode suivi : période de vérification des fichiers en cours d'écriture (ms)
+WATCH_INTERVAL_MS = 1000
+# Fichier qui a grossi : octets du début et de la fin de la partie déjà lue comparés (CRC32) à la dernière lecture
+# pour détecter une réécriture sur place, sans relire tout le fichier
+APPEND_CHECK_BYTES = 4096
+
+# Export multi-formats : processus utilisés à partir de BATCH_EXPORT_PARALLEL_MIN fichiers à écrire
+BATCH_EXPORT_PROCESSES = 4
+BATCH_EXPORT_PARALLEL_MIN = 6
+
+# Rendu des sauvegardes dans un processus persistant (render_worker), matplotlib déjà chargé
+USE_RENDER_WORKER = True
+
+# Cache disque des aperçus PNG (image_cache) : dossier et taille maximale (Mo)
+IMAGE_CACHE_DIR = ".plot_cache"
+IMAGE_CACHE_MAX_MB = 200
+
+# Élagage des défauts invisibles : lignes par zone de la carte min/max et index persistant (un par dossier).
+# Les fichiers ADPI ont souvent quelques centaines de lignes : des zones courtes en donnent plusieurs par fichier
+ZONE_MAP_ROWS = 32
+ZONE_INDEX_NAME = ".adpi_zones.json"
+
+# Inspecteur au survol : délai minimal entre deux mises à jour du tableau (ms, ~ une image à 60 Hz)
+HOVER_REFRESH_MS = 16
+
+# Analyse des régimes de Brouwer (analysis.py) : grille de rééchantillonnage, variation relative de pente
+# tolérée dans un régime, nombre minimal de points d'un régime
+SLOPE_GRID_POINTS = 1000
+SLOPE_TOLERANCE = 0.1
+SLOPE_MIN_POINTS = 20
@@ -10,14 +10,62 @@ Fonctions principales :
     Essaie de lire les noms d'espèces (atome1, atome2, ...) depuis l'entête du fichier (commentaires #), sinon les déduit automatiquement.
 - check_files_exist(file_list) :
     Prend une liste de fichiers et retourne ceux qui sont absents.
+- load_array(filepath) :
+    Chargeur unique (Plotter et DataManager) : lit toutes les colonnes d'un fichier, quel que soit le séparateur
+    (espaces, virgules ou mélange, détecté une fois par fichier par sniff_dialect), avec un cache partagé
+    invalidé si le fichier change sur le disque.
+- load_arrays(file_list, max_workers=None) :
+    Lit en parallèle une liste de fichiers via le cache partagé.
+- file_stats(filepath) :
+    Min, max et plus petite valeur positive de chaque colonne, calculés une fois à la lecture et gardés dans le cache.
+- zone_maps(file_list) / zone_max(zmap, x_col, y_col, xmin, xmax) :
+    Carte min/max par blocs de lignes de chaque fichier, conservée dans un index de métadonnées par dossier
+    (config.ZONE_INDEX_NAME), pour majorer une colonne sur un intervalle de l'abscisse sans relire le fichier.
+- load_shared(file_list, processes=None) :
+    Lit une liste de fichiers dans un pool de processus qui écrivent directement dans un bloc de mémoire partagée
+    (SharedBlock) : seuls de petits descripteurs transitent entre processus, aucune copie par sérialisation.
+- pack_system(base, archive_path=None) :
+    Regroupe tous les fichiers {base}_*_r_* d'un système dans une archive binaire unique.
+- load_archive(archive_path, use_mmap=True) / load_from_archive(archive_path) :
+    Lit une archive en une seule ouverture (projection mémoire optionnelle) et alimente le cache partagé.
 """
 
 import numpy as np
+import glob
+import json
+import mmap
 import os
+import struct
+import threading
+import warnings
+import zlib
+import config
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from io import StringIO
+from multiprocessing import resource_tracker, shared_memory
 
 debug=False  # Mettre à True pour afficher des informations de debug lors de la lecture des fichiers
 
+# Cache partagé des fichiers lus : chemin -> {
+#     'mtime', 'size' : date (ns) et taille du fichier lors de la dernière lecture,
+#     'data' : tableau 2D (vue sur les nrows premières lignes de 'buffer'),
+#     'offset' : octets lus jusqu'à la dernière ligne complète,
+#     'checksum' : CRC32 du début et de la fin de la partie lue (voir _read_signature ; None si inconnu,
+#                  ex : entrée issue d'une archive),
+#     'nrows', 'buffer' : nombre de lignes lues et tampon pré-alloué (capacité doublée quand il est plein),
+#     'appended' : nombre de lignes ajoutées lors de la dernière mise à jour,
+#     'archive' : (entrée issue d'une archive, pas encore lue) vues (colonnes communes, colonnes du défaut)
+#                 assemblées dans 'data' à la première lecture }
+# Partagé par tous les modes de tracé (système unique, multi-systèmes...) : un fichier n'est relu
+# que si sa date de modification ou sa taille a changé, et seulement sa fin s'il a grossi.
+_file_cache = {}
+_cache_lock = threading.Lock()
+
+# Cache des formats de fichiers (séparateur, longueur d'entête, nombre de colonnes) : chemin -> dialect.
+# Le format est détecté une seule fois par fichier, sur ses _SNIFF_SIZE premiers octets.
+_dialect_cache = {}
+_SNIFF_SIZE = 8192
+
 def get_n_species(filepath):
     """
     Détecte automatiquement le nombre d'espèces (atomes réseau + interstitiels) dans le fichier de données.
@@ -34,7 +82,7 @@ def get_n_species(filepath):
         return 0
     with open(filepath, encoding='latin1') as f:
         for line in f:
-            tokens = line.strip().split()
+            tokens = line.replace(",", " ").split()
             if not tokens or tokens[0].startswith("#"):
                 continue  # Ignore les lignes vides ou commentaires
             ncol = len(tokens)
@@ -48,7 +96,7 @@ def get_n_species(filepath):
 def get_colnames(filepath):
     """
     Essaie de lire les noms d'espèces (atome1, atome2, ...) dans l'ordre (réseau puis interstitiel)
-    depuis l'entête du fichier (si présente sous forme de commentaires #).
+    depuis l'entête du fichier (lignes avant les données, commentées par # ou non).
     Retourne une liste de noms, ou ['at1', 'at2', ...] si non trouvé.
 
     Entrée :
@@ -62,8 +110,10 @@ def get_colnames(filepath):
         return []
     with open(filepath, encoding='latin1') as f:
         for line in f:
-            if line.strip().startswith("#"):
-                # Cherche les colonnes mu_<nom>, x_<nom>
+            if _data_tokens(line) is not None:
+                break  # L'entête est terminée
+            if line.strip():
+                # Entête (commentée par # ou non) : cherche les colonnes mu_<nom>, x_<nom>
                 tokens = line.strip("#").replace(",", " ").replace("=", " ").split()
                 names = []
                 for tok in tokens:
@@ -77,6 +127,762 @@ def get_colnames(filepath):
     n = get_n_species(filepath)
     return [f"at{i+1}" for i in range(n)]
 
+def _split_complete(text):
+    """
+    Sépare un texte en (partie terminée par un saut de ligne, fragment final sans saut de ligne).
+    """
+    end = text.rfind("\n") + 1
+    return text[:end], text[end:]
+
+def _fragment_row(fragment, ncol):
+    """
+    Convertit la dernière ligne d'un fichier (sans saut de ligne final) en une ligne de données,
+    seulement si elle est complète (ncol valeurs numériques) ; sinon retourne None (ligne en cours d'écriture).
+    """
+    tokens = fragment.replace(",", " ").split()
+    if not tokens or (ncol is not None and len(tokens) != ncol):
+        return None
+    try:
+        return np.array([float(tok) for tok in tokens], ndmin=2)
+    except ValueError:
+        return None
+
+def _data_tokens(line):
+    """
+    Retourne les valeurs d'une ligne de données (séparateurs : espaces et/ou virgules),
+    ou None s'il s'agit d'une ligne vide, d'un commentaire ou d'une ligne d'entête.
+    """
+    tokens = line.replace(",", " ").split()
+    if not tokens or tokens[0].startswith("#"):
+        return None
+    try:
+        return [float(tok) for tok in tokens]
+    except ValueError:
+        return None
+
+def sniff_dialect(sample):
+    """
+    Détermine le format d'un fichier de données à partir de son début (quelques Ko suffisent).
+
+    Entrée :
+        sample (str) : début du fichier (seules les lignes complètes sont analysées, sauf s'il n'y en a pas).
+
+    Sortie :
+        dialect (dict) ou None si aucune ligne de données n'est trouvée dans l'échantillon :
+            'delimiter' : None (espaces), ',' (virgules) ou 'mixed' (virgules et espaces mélangés)
+            'header_lines' : nombre de lignes (entête, commentaires, lignes vides) avant la première ligne de données
+            'ncol' : nombre de colonnes
+    """
+    body, fragment = _split_complete(sample)
+    lines = body.splitlines() or [fragment]
+    header_lines = None
+    ncol = None
+    delimiters = set()
+    for i, line in enumerate(lines):
+        values = _data_tokens(line)
+        if values is None:
+            if header_lines is None:
+                continue
+            break  # Commentaire après les données : l'échantillon suffit
+        if header_lines is None:
+            header_lines, ncol = i, len(values)
+        if "," not in line:
+            delimiters.add(None)
+        elif all(field.strip() and len(field.split()) == 1 for field in line.split(",")):
+            delimiters.add(",")
+        else:
+            delimiters.add("mixed")
+        if i - header_lines >= 4:
+            break  # Quelques lignes de données suffisent
+    if header_lines is None:
+        return None
+    delimiter = delimiters.pop() if len(delimiters) == 1 else "mixed"
+    return {'delimiter': delimiter, 'header_lines': header_lines, 'ncol': ncol}
+
+def _parse_body(body, dialect):
+    """
+    Convertit le bloc de données d'un fichier (sans entête) en tableau 2D, avec le parseur le plus rapide
+    pour son format : conversion directe (np.fromstring) après remplacement éventuel des virgules,
+    ou np.loadtxt si le bloc contient des commentaires ou des lignes irrégulières.
+    """
+    if dialect['delimiter'] is not None:
+        body = body.replace(",", " ")
+    if not body.strip():
+        return None
+    try:
+        with warnings.catch_warnings():
+            # Anciennes versions de NumPy : lecture partielle signalée par un simple avertissement
+            warnings.simplefilter("error", DeprecationWarning)
+            flat = np.fromstring(body, sep=" ")
+        if flat.size % dialect['ncol'] == 0:
+            return flat.reshape(-1, dialect['ncol'])
+    except (ValueError, DeprecationWarning):
+        pass
+    return np.loadtxt(StringIO(body), ndmin=2)
+
+def _parse_file(filepath):
+    """
+    Lit toutes les colonnes numériques d'un fichier de données, en sautant l'entête et les commentaires.
+    Le format (séparateur, longueur d'entête) est détecté une seule fois par fichier sur les premiers Ko
+    (sniff_dialect) et mémorisé dans le cache des formats.
+
+    Sortie :
+        (data, offset, checksum) :
+            data (np.ndarray) : tableau 2D (n_lignes, n_colonnes), ou None si aucune donnée exploitable.
+            offset (int) : position (octets) juste après la dernière ligne complète lue ; une dernière ligne
+                           incomplète (fichier en cours d'écriture) est ignorée et sera lue avec la fin ajoutée.
+            checksum (int) : signature de la partie lue (voir _read_signature), pour vérifier qu'un fichier
+                             a seulement grossi.
+    """
+    # latin1 + newline='' : un caractère = un octet, les positions dans le texte sont des offsets fichier
+    with open(filepath, encoding='latin1', newline='') as f:
+        text = f.read()
+    body, fragment = _split_complete(text)
+    with _cache_lock:
+        dialect = _dialect_cache.get(filepath)
+    if dialect is None:
+        # Entête plus longue que l'échantillon : analyse du fichier complet
+        dialect = sniff_dialect(text[:_SNIFF_SIZE]) or sniff_dialect(text)
+        if dialect is not None and body:
+            with _cache_lock:
+                _dialect_cache[filepath] = dialect
+    data = None
+    if dialect is not None:
+        start_pos = 0
+        for _ in range(dialect['header_lines']):
+            start_pos = body.find("\n", start_pos) + 1
+            if start_pos == 0:
+                start_pos = len(body)  # Entête pas encore entièrement écrite
+                break
+        data_str = body[start_pos:]
+        if debug:
+            print(f"[DEBUG] Format détecté pour {filepath}: {dialect}")
+            print(f"[DEBUG] Data déduite (après header):\n{data_str[:150]}")  # Affiche les 150 premiers caractères
+        data = _parse_body(data_str, dialect)
+    last = _fragment_row(fragment, data.shape[1] if data is not None else None)
+    offset = len(body)
+    if last is not None:
+        data = last if data is None else np.vstack([data, last])
+        offset = len(text)
+    start = _signature_start(offset)
+    return data, offset, _signature(text[:min(config.APPEND_CHECK_BYTES, offset)].encode('latin1'),
+                                    text[start:offset].encode('latin1'))
+
+def _signature_start(offset):
+    # Début de la fenêtre de fin (jamais avant la fin de la fenêtre de début)
+    return max(config.APPEND_CHECK_BYTES, offset - config.APPEND_CHECK_BYTES)
+
+def _signature(head, tail):
+    return zlib.crc32(tail, zlib.crc32(head))
+
+def _read_signature(f, offset):
+    """
+    Signature des offset premiers octets d'un fichier ouvert en binaire : CRC32 des config.APPEND_CHECK_BYTES
+    premiers et derniers octets de cette partie (lecture bornée, quelle que soit la taille du fichier).
+    """
+    f.seek(0)
+    head = f.read(min(config.APPEND_CHECK_BYTES, offset))
+    start = _signature_start(offset)
+    f.seek(start)
+    return _signature(head, f.read(max(0, offset - start)))
+
+def _parse_tail_text(text, ncol):
+    """
+    Convertit la fin ajoutée d'un fichier en lignes de données.
+
+    Sortie :
+        (rows, consumed) : lignes (tableau (k, ncol)) et nombre de caractères (= octets) consommés,
+                           jusqu'à la dernière ligne complète.
+    """
+    body, fragment = _split_complete(text)
+    rows = []
+    for line in body.splitlines():
+        values = _data_tokens(line)
+        if values is not None and len(values) == ncol:
+            rows.append(values)
+    consumed = len(body)
+    last = _fragment_row(fragment, ncol)
+    if last is not None:
+        rows.append(last[0])
+        consumed = len(text)
+    return np.array(rows, dtype=float).reshape(-1, ncol), consumed
+
+def _column_stats(data):
+    """
+    Statistiques par colonne d'un tableau 2D (valeurs finies seulement) : 'min', 'max' et 'posmin'
+    (plus petite valeur strictement positive, utile en échelle log). Une colonne sans valeur exploitable
+    a pour min/posmin +inf et pour max -inf. Retourne None si le tableau est vide.
+    """
+    if data is None or data.shape[0] == 0:
+        return None
+    finite = np.isfinite(data)
+    return {
+        'min': np.where(finite, data, np.inf).min(axis=0),
+        'max': np.where(finite, data, -np.inf).max(axis=0),
+        'posmin': np.where(finite & (data > 0), data, np.inf).min(axis=0),
+    }
+
+def _merge_stats(stats, new):
+    """
+    Combine les statistiques d'un fichier et celles de lignes ajoutées (voir _column_stats).
+    """
+    if stats is None or new is None:
+        return stats if new is None else new
+    return {'min': np.minimum(stats['min'], new['min']), 'max': np.maximum(stats['max'], new['max']),
+            'posmin': np.minimum(stats['posmin'], new['posmin'])}
+
+def _append_to_entry(filepath, entry, st):
+    """
+    Ajoute à une entrée du cache les lignes écrites dans le fichier depuis sa dernière lecture.
+    Les lignes sont copiées dans un tampon pré-alloué dont la capacité double quand il est plein
+    (coût amorti constant par ligne, au lieu de réallouer tout le tableau à chaque rechargement).
+
+    Seule la fin ajoutée est lue (à partir de offset). Une réécriture sur place, même à taille égale ou plus
+    grande, est détectée sur une signature bornée de la partie déjà lue (_read_signature : début et derniers
+    octets avant offset) et force une relecture complète.
+
+    Sortie :
+        nouvelle entrée du cache, ou None si le début du fichier a changé (relecture complète nécessaire).
+    """
+    checksum, offset = entry.get('checksum'), entry['offset']
+    if checksum is None:
+        return None  # Contenu lu d'ailleurs (archive) : pas de comparaison possible avec le fichier
+    with open(filepath, 'rb') as f:
+        if _read_signature(f, offset) != checksum:
+            return None  # Fichier réécrit, pas seulement complété
+        f.seek(offset)
+        rows, consumed = _parse_tail_text(f.read().decode('latin1'), entry['buffer'].shape[1])
+        offset += consumed
+        checksum = _read_signature(f, offset)
+    buffer, nrows = entry['buffer'], entry['nrows']
+    if nrows + len(rows) > buffer.shape[0]:
+        grown = np.empty((max(2 * buffer.shape[0], nrows + len(rows)), buffer.shape[1]))
+        grown[:nrows] = buffer[:nrows]
+        buffer = grown
+    buffer[nrows:nrows + len(rows)] = rows
+    nrows += len(rows)
+    return {'mtime': st.st_mtime_ns, 'size': st.st_size, 'data': buffer[:nrows], 'offset': offset,
+            'nrows': nrows, 'buffer': buffer, 'checksum': checksum,
+            'appended': len(rows), 'stats': _merge_stats(entry.get('stats'), _column_stats(rows))}
+
+def _assemble_archive_entry(entry):
+    """
+    Construit le tableau d'une entrée issue d'une archive à sa première lecture : colonnes communes et colonnes
+    du défaut (vues sur la projection mémoire) sont assemblées en un tableau en mémoire. Seuls les fichiers
+    effectivement lus sont ainsi copiés hors de l'archive.
+    """
+    with _cache_lock:
+        source = entry.pop('archive', None)
+        if source is not None:
+            entry['data'] = entry['buffer'] = np.hstack(source)
+
+def _update_entry(filepath, st):
+    """
+    Met à jour (si besoin) l'entrée du cache d'un fichier : rien si inchangé, lecture de la fin ajoutée
+    si le fichier a seulement grossi, relecture complète sinon.
+
+    Sortie :
+        (data, status) avec status 'unchanged', 'appended' ou 'reloaded'
+    """
+    with _cache_lock:
+        entry = _file_cache.get(filepath)
+    if entry is not None and entry['mtime'] == st.st_mtime_ns and entry['size'] == st.st_size:
+        if entry.get('archive') is not None:
+            _assemble_archive_entry(entry)
+        return entry['data'], 'unchanged'
+    if entry is not None and entry['data'] is not None and entry.get('checksum') is not None \
+            and st.st_size >= entry['offset']:
+        new_entry = _append_to_entry(filepath, entry, st)
+        if new_entry is not None:
+            with _cache_lock:
+                _file_cache[filepath] = new_entry
+            return new_entry['data'], 'appended' if new_entry['appended'] else 'unchanged'
+    if entry is not None:
+        with _cache_lock:
+            _dialect_cache.pop(filepath, None)  # Fichier réécrit : son format peut avoir changé
+    data, offset, checksum = _parse_file(filepath)
+    with _cache_lock:
+        _file_cache[filepath] = {'mtime': st.st_mtime_ns, 'size': st.st_size, 'data': data, 'offset': offset,
+                                 'nrows': 0 if data is None else data.shape[0], 'buffer': data,
+                                 'checksum': checksum, 'appended': 0, 'stats': _column_stats(data)}
+    return data, 'reloaded'
+
+def load_array(filepath, use_cache=True):
+    """
+    Retourne toutes les colonnes d'un fichier de données, en passant par le cache partagé.
+    Le fichier n'est relu que si sa date de modification ou sa taille a changé depuis la dernière lecture ;
+    s'il a seulement grossi, seules les lignes ajoutées sont lues (à partir de l'offset mémorisé).
+
+    Entrée :
+        filepath (str) : chemin du fichier de données.
+        use_cache (bool) : False pour ne pas conserver le tableau lu dans le cache (lecture ponctuelle,
+                           ex : DataManager en mode compact) ; une entrée déjà en cache reste utilisée.
+
+    Sortie :
+        data (np.ndarray) : tableau 2D (n_lignes, n_colonnes), ou None si aucune donnée exploitable.
+        Le tableau est partagé entre les appelants et ne doit pas être modifié en place.
+
+    Exceptions :
+        OSError si le fichier est absent ou illisible, ValueError si son contenu n'est pas numérique.
+    """
+    if not use_cache:
+        with _cache_lock:
+            cached = filepath in _file_cache
+        if not cached:
+            return _parse_file(filepath)[0]
+    return _update_entry(filepath, os.stat(filepath))[0]
+
+def file_stats(filepath):
+    """
+    Retourne les statistiques par colonne d'un fichier (voir _column_stats), calculées une seule fois
+    à la lecture et conservées dans le cache partagé (mises à jour avec les lignes ajoutées).
+
+    Sortie :
+        dict {'min', 'max', 'posmin'} de tableaux (n_colonnes,), ou None si le fichier n'a pas de données.
+
+    Exceptions :
+        OSError si le fichier est absent ou illisible, ValueError si son contenu n'est pas numérique.
+    """
+    data = load_array(filepath)
+    with _cache_lock:
+        entry = _file_cache.get(filepath)
+        stats = entry.get('stats') if entry is not None else None
+    if stats is None and data is not None:
+        # Entrée issue d'une archive : statistiques calculées au premier appel
+        stats = _column_stats(data)
+        if entry is not None:
+            with _cache_lock:
+                entry['stats'] = stats
+    return stats
+
+def _zone_map(data, rows=config.ZONE_MAP_ROWS):
+    """
+    Carte de zones d'un tableau 2D : min et max (valeurs finies) de chaque colonne par bloc de rows lignes.
+    Un bloc sans valeur exploitable dans une colonne a pour min +inf et pour max -inf.
+
+    Sortie :
+        dict {'min', 'max'} de tableaux (n_blocs, n_colonnes), ou None si le tableau est vide.
+    """
+    if data is None or data.shape[0] == 0:
+        return None
+    finite = np.isfinite(data)
+    starts = np.arange(0, data.shape[0], rows)
+    return {'min': np.minimum.reduceat(np.where(finite, data, np.inf), starts, axis=0),
+            'max': np.maximum.reduceat(np.where(finite, data, -np.inf), starts, axis=0)}
+
+_zone_indexes = {}  # dossier -> index des cartes de zones (contenu du fichier config.ZONE_INDEX_NAME)
+
+def _zone_index(folder):
+    """
+    Index des cartes de zones d'un dossier : nom de fichier -> {'mtime', 'size', 'rows', 'min', 'max'}.
+    Lu sur le disque au premier accès puis gardé en mémoire ; un index absent ou illisible est ignoré.
+    """
+    with _cache_lock:
+        index = _zone_indexes.get(folder)
+    if index is None:
+        try:
+            with open(os.path.join(folder, config.ZONE_INDEX_NAME), 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = {}
+        with _cache_lock:
+            index = _zone_indexes.setdefault(folder, index)
+    return index
+
+def _save_zone_index(folder, index):
+    """
+    Écrit l'index des cartes de zones d'un dossier (remplacement atomique). Un dossier en lecture seule
+    n'empêche pas l'élagage : l'index reste simplement en mémoire.
+    """
+    path = os.path.join(folder, config.ZONE_INDEX_NAME)
+    try:
+        with open(path + ".tmp", 'w', encoding='utf-8') as f:
+            json.dump(index, f)
+        os.replace(path + ".tmp", path)
+    except OSError as e:
+        if debug:
+            print(f"[DEBUG] Index des zones non enregistré ({path}) : {e}")
+
+def zone_maps(file_list):
+    """
+    Retourne la carte de zones (voir _zone_map) de chaque fichier, depuis l'index de métadonnées de son dossier
+    si le fichier n'a pas changé (même date de modification et même taille), sans lire ses données ;
+    sinon le fichier est lu (cache partagé), sa carte calculée et l'index du dossier mis à jour sur le disque.
+
+    Entrée :
+        file_list (list of str) : chemins des fichiers.
+
+    Sortie :
+        maps (dict) : chemin -> {'min', 'max'} (tableaux (n_blocs, n_colonnes)), ou None si le fichier
+        est absent, illisible ou vide.
+    """
+    maps, changed = {}, set()
+    for filepath in dict.fromkeys(file_list):
+        folder = os.path.dirname(os.path.abspath(filepath))
+        name = os.path.basename(filepath)
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            maps[filepath] = None
+            continue
+        index = _zone_index(folder)
+        item = index.get(name)
+        if (item is None or item['mtime'] != st.st_mtime_ns or item['size'] != st.st_size
+                or item['rows'] != config.ZONE_MAP_ROWS):
+            try:
+                zmap = _zone_map(load_array(filepath))
+            except (OSError, ValueError) as e:
+                report(f"Erreur lors de la lecture de {filepath} : {str(e)}")
+                maps[filepath] = None
+                continue
+            if zmap is None:
+                maps[filepath] = None
+                continue
+            item = {'mtime': st.st_mtime_ns, 'size': st.st_size, 'rows': config.ZONE_MAP_ROWS,
+                    'min': zmap['min'].tolist(), 'max': zmap['max'].tolist()}
+            with _cache_lock:
+                index[name] = item
+            changed.add(folder)
+        maps[filepath] = {'min': np.asarray(item['min'], dtype=float), 'max': np.asarray(item['max'], dtype=float)}
+    for folder in changed:
+        _save_zone_index(folder, _zone_index(folder))
+    return maps
+
+def zone_max(zmap, x_col, y_col, xmin, xmax):
+    """
+    Majorant de la colonne y_col sur les lignes dont la colonne x_col est dans [xmin, xmax], d'après une carte
+    de zones : maximum des blocs dont l'intervalle de x recoupe [xmin, xmax] (sans lire les données).
+
+    Sortie :
+        float, -inf si aucun bloc ne recoupe l'intervalle.
+    """
+    lo, hi = min(xmin, xmax), max(xmin, xmax)
+    overlap = (zmap['min'][:, x_col] <= hi) & (zmap['max'][:, x_col] >= lo)
+    if not overlap.any():
+        return -np.inf
+    return float(zmap['max'][overlap, y_col].max())
+
+def refresh_file(filepath):
+    """
+    Met à jour l'entrée du cache d'un fichier qui a pu changer sur le disque (ex : ADPI en cours d'écriture).
+    Si le fichier a seulement grossi, seule la fin ajoutée est lue (à partir de l'offset mémorisé)
+    et les nouvelles lignes sont ajoutées au tableau en mémoire ; sinon le fichier est relu entièrement.
+
+    Entrée :
+        filepath (str) : chemin du fichier.
+
+    Sortie :
+        status (str) : 'missing', 'unchanged', 'appended' (nouvelles lignes) ou 'reloaded' (lecture complète).
+    """
+    try:
+        st = os.stat(filepath)
+    except OSError:
+        return 'missing'
+    return _update_entry(filepath, st)[1]
+
+def load_arrays(file_list, max_workers=None):
+    """
+    Lit en parallèle (threads) une liste de fichiers via le cache partagé.
+
+    Entrées :
+        file_list (list of str) : chemins des fichiers (les doublons ne sont lus qu'une fois).
+        max_workers (int, optionnel) : nombre de threads de lecture.
+
+    Sortie :
+        arrays (dict) : chemin -> tableau 2D, ou None si le fichier est absent, illisible ou vide.
+    """
+    def _load(fname):
+        try:
+            return load_array(fname)
+        except Exception as e:
+            report(f"Erreur lors de la lecture de {fname} : {str(e)}")
+            return None
+    unique = list(dict.fromkeys(file_list))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return dict(zip(unique, pool.map(_load, unique)))
+
+# Blocs partagés libérés alors que des vues NumPy existaient encore : fermés dès que ces vues disparaissent
+_unclosed_blocks = []
+
+def _close_pending_blocks():
+    for shm in _unclosed_blocks[:]:
+        try:
+            shm.close()
+            _unclosed_blocks.remove(shm)
+        except BufferError:
+            pass
+
+class SharedBlock:
+    """
+    Bloc de mémoire partagée (float64) de forme (n_fichiers, n_lignes_max, n_colonnes), rempli par les
+    processus de lecture de load_shared. Le processus qui crée le bloc est seul responsable de sa libération.
+    """
+
+    def __init__(self, shape):
+        _close_pending_blocks()
+        self.shape = tuple(int(n) for n in shape)
+        self.shm = shared_memory.SharedMemory(create=True, size=max(1, 8 * int(np.prod(self.shape))))
+        # frombuffer garde un export du tampon : la projection ne peut pas être fermée sous une vue vivante
+        self.array = np.frombuffer(self.shm.buf, dtype=np.float64, count=int(np.prod(self.shape))).reshape(self.shape)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def release(self):
+        """
+        Libère le bloc : le nom est supprimé immédiatement (unlink), la projection est fermée dès qu'aucune
+        vue NumPy ne la référence plus (sinon au ramasse-miettes de la dernière vue).
+        """
+        if self.shm is None:
+            return
+        self.array = None
+        self.shm.unlink()
+        try:
+            self.shm.close()
+        except BufferError:
+            _unclosed_blocks.append(self.shm)  # Des vues existent encore : fermeture différée
+        self.shm = None
+        _close_pending_blocks()
+
+def _count_lines(filepath):
+    """
+    Nombre maximal de lignes de données d'un fichier (nombre de sauts de ligne + 1), lecture par blocs.
+    """
+    n = 1
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            n += chunk.count(b"\n")
+    return n
+
+def _parse_into_block(name, shape, index, filepath):
+    """
+    Processus de lecture : lit un fichier et écrit ses données dans la tranche index du bloc partagé name.
+
+    Sortie :
+        nombre de lignes écrites
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        data = _parse_file(filepath)[0]
+        if data is None:
+            raise ValueError(f"Aucune donnée exploitable dans le fichier: {filepath}")
+        if data.shape[1] != shape[2] or data.shape[0] > shape[1]:
+            raise ValueError(f"Format inattendu ({data.shape[0]} lignes, {data.shape[1]} colonnes) : {filepath}")
+        out = np.frombuffer(shm.buf, dtype=np.float64, count=int(np.prod(shape))).reshape(shape)
+        out[index, :data.shape[0]] = data
+        del out  # Aucune vue ne doit survivre à la fermeture du bloc
+        return data.shape[0]
+    finally:
+        shm.close()
+
+def load_shared(file_list, processes=None):
+    """
+    Lit une liste de fichiers dans un pool de processus. Le bloc partagé est dimensionné d'après le nombre
+    de lignes (borne haute, comptage rapide des sauts de ligne) et de colonnes (sniff_dialect) ; chaque
+    processus y écrit directement son fichier et ne renvoie que le nombre de lignes lues.
+
+    Entrées :
+        file_list (list of str) : chemins des fichiers.
+        processes (int, optionnel) : nombre de processus de lecture.
+
+    Sortie :
+        (block, arrays, errors) :
+            block (SharedBlock) : bloc à libérer par l'appelant (block.release()), ou None si rien n'a pu être lu
+            arrays (list) : pour chaque fichier, vue (n_lignes, n_colonnes) sur le bloc, ou None en cas d'erreur
+            errors (dict) : chemin -> message d'erreur
+    """
+    errors = {}
+    bounds = []
+    ncol = None
+    for f in file_list:
+        try:
+            bounds.append(_count_lines(f))
+            if ncol is None:
+                with open(f, encoding='latin1', newline='') as fh:
+                    dialect = sniff_dialect(fh.read(_SNIFF_SIZE))
+                ncol = dialect['ncol'] if dialect else None
+        except OSError as e:
+            errors[f] = str(e)
+            bounds.append(0)
+    if ncol is None or not any(bounds):
+        return None, [None] * len(file_list), errors
+
+    # Le suivi des blocs partagés doit être commun à tous les processus (pas de suppression à leur sortie)
+    resource_tracker.ensure_running()
+    block = SharedBlock((len(file_list), max(bounds), ncol))
+    nrows = [0] * len(file_list)
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        futures = {pool.submit(_parse_into_block, block.name, block.shape, i, f): i
+                   for i, f in enumerate(file_list) if f not in errors}
+        for future, i in futures.items():
+            try:
+                nrows[i] = future.result()
+            except (OSError, ValueError) as e:
+                errors[file_list[i]] = str(e)
+    arrays = [None if f in errors else block.array[i, :nrows[i]] for i, f in enumerate(file_list)]
+    return block, arrays, errors
+
+def clear_cache():
+    """
+    Vide le cache partagé des fichiers lus.
+    """
+    with _cache_lock:
+        _file_cache.clear()
+        _dialect_cache.clear()
+        _loaded_archives.clear()
+        _zone_indexes.clear()
+
+# Format d'archive : magic (8 octets), longueur de l'entête JSON (uint64 little-endian), entête JSON,
+# remplissage jusqu'à un multiple de 64 octets, puis les données float64 little-endian :
+# bloc mu/x commun (n_lignes, n_communes) suivi des colonnes x_DP, Hf_DP de chaque défaut (n_fichiers, n_lignes, 2).
+ARCHIVE_MAGIC = b"ADPIPK01"
+_ARCHIVE_ALIGN = 64
+_loaded_archives = {}  # archive -> mtime (ns) déjà chargée dans le cache partagé
+
+def pack_system(base, archive_path=None):
+    """
+    Regroupe tous les fichiers {base}_*_r_* d'un système dans une archive binaire unique :
+    colonnes mu/x communes une seule fois, colonnes x_DP/Hf_DP de chaque défaut empilées,
+    noms d'espèces de l'entête, date de modification et taille de chaque fichier source.
+
+    Entrées :
+        base (str) : préfixe du système (ex : 'TiN_adpi').
+        archive_path (str, optionnel) : chemin de l'archive (défaut : base + config.ARCHIVE_EXTENSION).
+
+    Sortie :
+        archive_path (str) : chemin de l'archive écrite.
+
+    Exception :
+        ValueError si aucun fichier n'est trouvé ou si les fichiers n'ont pas la même grille mu/x.
+    """
+    if archive_path is None:
+        archive_path = base + config.ARCHIVE_EXTENSION
+    files = sorted(f for f in glob.glob(glob.escape(base) + "_*_r_*")
+                   if os.path.isfile(f) and not f.endswith(config.ARCHIVE_EXTENSION))
+    if not files:
+        raise ValueError(f"Aucun fichier {base}_*_r_* trouvé.")
+    stats = [os.stat(f) for f in files]
+    arrays = load_arrays(files)
+    bad = [f for f in files if arrays[f] is None]
+    if bad:
+        raise ValueError("Fichiers illisibles : " + ", ".join(bad))
+    shared = arrays[files[0]][:, :-2]
+    for f in files[1:]:
+        if arrays[f].shape != arrays[files[0]].shape or not np.array_equal(arrays[f][:, :-2], shared):
+            raise ValueError(f"Grille mu/x différente dans {f} : archivage impossible.")
+
+    archive_dir = os.path.dirname(os.path.abspath(archive_path))
+    header = {
+        'version': 1,
+        'n_rows': shared.shape[0],
+        'n_shared': shared.shape[1],
+        'species': get_colnames(files[0]),
+        'files': [os.path.relpath(os.path.abspath(f), archive_dir) for f in files],
+        'mtimes': [st.st_mtime_ns for st in stats],
+        'sizes': [st.st_size for st in stats],
+    }
+    header_bytes = json.dumps(header).encode("utf-8")
+    offset = len(ARCHIVE_MAGIC) + 8 + len(header_bytes)
+    padding = (-offset) % _ARCHIVE_ALIGN
+    defects = np.stack([arrays[f][:, -2:] for f in files])
+    tmp_path = archive_path + ".tmp"
+    with open(tmp_path, "wb") as out:
+        out.write(ARCHIVE_MAGIC)
+        out.write(struct.pack("<Q", len(header_bytes)))
+        out.write(header_bytes)
+        out.write(b"\0" * padding)
+        out.write(np.ascontiguousarray(shared, dtype="<f8").tobytes())
+        out.write(np.ascontiguousarray(defects, dtype="<f8").tobytes())
+    os.replace(tmp_path, archive_path)  # l'archive n'est jamais visible à moitié écrite
+    return archive_path
+
+def load_archive(archive_path, use_mmap=True):
+    """
+    Lit une archive créée par pack_system, en une seule ouverture de fichier.
+
+    Entrées :
+        archive_path (str) : chemin de l'archive.
+        use_mmap (bool) : si True, les tableaux sont des vues en lecture seule sur une projection mémoire
+                          du fichier (rien n'est copié tant qu'on n'y accède pas) ; sinon le fichier est lu en entier.
+
+    Sortie :
+        archive (dict) : 'files' (chemins des sources), 'mtimes', 'sizes', 'species',
+                         'shared' (n_lignes, n_communes), 'defects' (n_fichiers, n_lignes, 2).
+
+    Exception :
+        OSError si l'archive est illisible, ValueError si son format n'est pas reconnu.
+    """
+    with open(archive_path, "rb") as f:
+        if use_mmap:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            buf = f.read()
+    if bytes(buf[:len(ARCHIVE_MAGIC)]) != ARCHIVE_MAGIC:
+        raise ValueError(f"Format d'archive non reconnu : {archive_path}")
+    start = len(ARCHIVE_MAGIC) + 8
+    (header_len,) = struct.unpack("<Q", buf[len(ARCHIVE_MAGIC):start])
+    header = json.loads(bytes(buf[start:start + header_len]).decode("utf-8"))
+    offset = start + header_len
+    offset += (-offset) % _ARCHIVE_ALIGN
+    n_rows, n_shared, n_files = header['n_rows'], header['n_shared'], len(header['files'])
+    shared = np.frombuffer(buf, dtype="<f8", count=n_rows * n_shared, offset=offset).reshape(n_rows, n_shared)
+    offset += shared.nbytes
+    defects = np.frombuffer(buf, dtype="<f8", count=n_files * n_rows * 2, offset=offset).reshape(n_files, n_rows, 2)
+    # Chemins relatifs au dossier de l'archive, tel qu'il est donné (mêmes clés que generate_file_list_and_labels)
+    archive_dir = os.path.dirname(archive_path)
+    return {
+        'files': [os.path.normpath(os.path.join(archive_dir, f)) for f in header['files']],
+        'mtimes': header['mtimes'],
+        'sizes': header['sizes'],
+        'species': header['species'],
+        'shared': shared,
+        'defects': defects,
+    }
+
+def archive_fresh_indices(archive):
+    """
+    Retourne les indices des fichiers de l'archive dont la source n'a pas changé (même date et même taille).
+    Une source absente est considérée comme périmée : read_data et load_array vérifient le fichier sur le disque
+    avant le cache, une entrée sans fichier ne serait jamais servie.
+    """
+    fresh = []
+    for i, f in enumerate(archive['files']):
+        try:
+            st = os.stat(f)
+        except OSError:
+            continue
+        if st.st_mtime_ns == archive['mtimes'][i] and st.st_size == archive['sizes'][i]:
+            fresh.append(i)
+    return fresh
+
+def load_from_archive(archive_path, use_mmap=True):
+    """
+    Alimente le cache partagé (load_array/read_data) avec le contenu d'une archive.
+    Seules les entrées encore à jour sont utilisées : les fichiers modifiés depuis l'archivage
+    seront relus normalement depuis les fichiers texte, les fichiers supprimés ne sont pas repris.
+    Les entrées gardent des vues sur l'archive : le tableau d'un fichier (colonnes communes + colonnes du défaut)
+    n'est assemblé en mémoire qu'à sa première lecture (load_array).
+
+    Sortie :
+        stale (list of str) : fichiers de l'archive périmés (relus depuis le texte) ou absents.
+    """
+    mtime = os.stat(archive_path).st_mtime_ns
+    if _loaded_archives.get(archive_path) == mtime:
+        return []
+    archive = load_archive(archive_path, use_mmap=use_mmap)
+    fresh = archive_fresh_indices(archive)
+    shared = archive['shared']
+    with _cache_lock:
+        for i in fresh:
+            _file_cache[archive['files'][i]] = {'mtime': archive['mtimes'][i], 'size': archive['sizes'][i],
+                                                'data': None, 'archive': (shared, archive['defects'][i]),
+                                                'offset': archive['sizes'][i], 'nrows': shared.shape[0],
+                                                'buffer': None, 'checksum': None, 'appended': 0}
+    _loaded_archives[archive_path] = mtime
+    fresh_set = set(fresh)
+    return [f for i, f in enumerate(archive['files']) if i not in fresh_set]
+
 def read_data(filepath, x_col=None, y_col=None, n_species=None):
     """
     Ouvre et lit les colonnes utiles d'un fichier de données.
@@ -94,32 +900,10 @@ def read_data(filepath, x_col=None, y_col=None, n_species=None):
         report(f"Fichier de données absent: {filepath}")
         return None, None
     try:
-        with open(filepath, encoding='latin1') as f:
-            lines = f.readlines()
-        start_index = None
-        for i, line in enumerate(lines):
-            tokens = line.strip().split()
-            if not tokens or tokens[0].startswith("#"):
-                continue  # Ignore les lignes vides ou commentaires
-            # On prend la première ligne de données
-            try:
-                floats = [float(tok) for tok in tokens]
-                start_index = i
-                break
-            except ValueError:
-                continue
-        if start_index is None:
+        data = load_array(filepath)
+        if data is None:
             report(f"Aucune donnée exploitable dans le fichier: {filepath}")
             return None, None
-        data_str = "".join(lines[start_index:])
-        
-        if debug:
-            print(f"[DEBUG] Première ligne de données pour {filepath}: {lines[start_index]}")
-            print(f"[DEBUG] Data déduite (après header):\n{data_str[:150]}")  # Affiche les 150 premiers caractères
-
-        data = np.loadtxt(StringIO(data_str))
-        if data.ndim == 1:
-            data = np.expand_dims(data, axis=0)
         ncol = data.shape[1]
         n = n_species or ((ncol - 2) // 2)
         # Par défaut : X = dernière x_at (H si présent), Y = concentration de config (x_DP)
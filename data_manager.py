@@ -1,4 +1,101 @@
+import csv
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
+import data_loader
+
+
+def make_grid(xmin, xmax, n_points=500, scale="linear"):
+    """
+    Construit une grille d'abscisses commune pour le rééchantillonnage des courbes.
+
+    Paramètres
+    ----------
+    xmin, xmax : float
+        Bornes de la grille (incluses).
+    n_points : int
+        Nombre de points de la grille.
+    scale : str
+        'linear' (points régulièrement espacés) ou 'log' (espacement logarithmique, bornes > 0).
+
+    Retour :
+    -------
+    grid : np.ndarray
+        Grille croissante, shape (n_points,)
+    """
+    if scale == "log":
+        if xmin <= 0 or xmax <= 0:
+            raise ValueError(f"Grille log impossible avec des bornes <= 0 : [{xmin}, {xmax}]")
+        return np.logspace(np.log10(xmin), np.log10(xmax), int(n_points))
+    return np.linspace(xmin, xmax, int(n_points))
+
+
+class MonotonicIndex:
+    """
+    Index de recherche inverse entre deux colonnes d'un même balayage (ex : x_H -> mu_H) : pour une valeur cible
+    de la colonne clé, retrouve par interpolation linéaire la valeur de l'autre colonne.
+
+    La colonne clé est découpée une fois en segments monotones (croissants ou décroissants, les paliers restant
+    dans le segment courant) ; chaque segment est stocké trié. Une requête groupée de n cibles coûte
+    O(n log N) par segment (np.searchsorted). Quand la clé n'est pas monotone (ex : x_H qui repasse par
+    les mêmes valeurs), une cible peut avoir plusieurs solutions : la première dans l'ordre du balayage
+    est retournée et le nombre de solutions est indiqué.
+    """
+
+    def __init__(self, key, value):
+        """
+        Paramètres
+        ----------
+        key, value : array-like
+            Colonne clé et colonne cherchée (même longueur) ; les lignes non finies sont ignorées.
+        """
+        key = np.asarray(key, dtype=float)
+        value = np.asarray(value, dtype=float)
+        keep = np.isfinite(key) & np.isfinite(value)
+        key, value = key[keep], value[keep]
+        # Changements de sens de variation de la clé (paliers ignorés) : bornes des segments monotones
+        sign = np.sign(np.diff(key))
+        moving = np.flatnonzero(sign)
+        turns = moving[1:][sign[moving[1:]] != sign[moving[:-1]]]
+        bounds = np.concatenate(([0], turns, [key.size - 1])) if key.size else np.array([], dtype=int)
+        self.segments = []
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            k, v = key[start:stop + 1], value[start:stop + 1]
+            if k[-1] < k[0]:
+                k, v = k[::-1], v[::-1]
+            self.segments.append((k, v))
+        self.monotonic = len(self.segments) <= 1
+
+    def query(self, targets):
+        """
+        Valeurs de l'autre colonne aux valeurs cibles de la clé.
+
+        Paramètres
+        ----------
+        targets : float ou array-like
+            Valeurs cibles de la colonne clé.
+
+        Retour :
+        -------
+        values, n_solutions : np.ndarray
+            Valeur interpolée (première solution dans l'ordre du balayage, NaN si la cible est hors domaine)
+            et nombre de segments contenant la cible (> 1 : solution ambiguë, clé non monotone).
+        """
+        targets = np.atleast_1d(np.asarray(targets, dtype=float))
+        values = np.full(targets.shape, np.nan)
+        n_solutions = np.zeros(targets.shape, dtype=int)
+        for k, v in self.segments:
+            inside = (targets >= k[0]) & (targets <= k[-1])
+            j = np.clip(np.searchsorted(k, targets, side="right") - 1, 0, max(k.size - 2, 0))
+            j1 = np.minimum(j + 1, k.size - 1)
+            dk = k[j1] - k[j]
+            w = np.where(dk > 0, (targets - k[j]) / np.where(dk > 0, dk, 1.0), 0.0)
+            found = inside & (n_solutions == 0)
+            values[found] = (v[j] * (1.0 - w) + v[j1] * w)[found]
+            n_solutions += inside
+        return values, n_solutions
+
 
 class DataManager:
     """
@@ -10,15 +107,50 @@ class DataManager:
     def __init__(self):
         """
         Initialise les structures de données.
-        - self.data : tableau numpy à 3 dimensions (n_fichiers, n_lignes, n_colonnes)
+        - self.data : tableau numpy à 3 dimensions (n_fichiers, n_lignes, n_colonnes),
+          ou liste de tableaux 2D si les fichiers n'ont pas tous le même nombre de lignes
         - self.colnames : liste ordonnée des noms de colonnes (str)
         - self.files : liste des fichiers chargés (pour référence)
+        - self.temperatures : températures chargées en mode multi-températures (voir load_temperatures)
+        - en mode paresseux (load_data(..., lazy=True)), self.data n'est construit qu'au premier accès
+          et get_column ne lit que le fichier/la colonne demandés
+        - en mode compact (compact=True), self.data est stocké en float32 avec la colonne x_DP en log10 ;
+          get_column, get_columns, resample et export_table retournent toujours des valeurs float64 décodées
         """
-        self.data = None         # Tableau des données [n_fichiers, n_lignes, n_colonnes]
+        self._data = None        # Tableau des données [n_fichiers, n_lignes, n_colonnes] (voir la propriété data)
+        self._lazy = False       # True : fichiers enregistrés mais pas encore lus (mode paresseux)
+        self._packed = {}        # fichier -> (archive, indice) pour les fichiers lus depuis une archive (mode paresseux)
+        self._column_cache = {}  # (file_idx, indice de colonne) -> colonne déjà lue (mode paresseux)
+        self.compact = False     # Mode compact : stockage float32, x_DP en log10 (voir load_data)
+        self._shared_block = None  # Bloc de mémoire partagée portant self.data (lecture multi-processus)
         self.colnames = []       # Noms des colonnes (générés dynamiquement)
+        self.col_index = {}      # Nom de colonne -> indice dans self.colnames
         self.files = []          # Liste des noms de fichiers lus
+        self.temperatures = []   # Axe température (vide en mode simple)
+        self.temperature = None  # Température actuellement sélectionnée (data/files)
+        self._layers = {}        # température -> (fichiers, données) en mode multi-températures
+        self._sort_cache = {}      # (file_idx, x_label) -> permutation triant x (None si déjà croissant)
+        self._resample_cache = {}  # (fichiers, grille, colonnes, mode) -> matrice rééchantillonnée
+        self._inverse_cache = {}   # (colonne clé, colonne cherchée) -> MonotonicIndex sur le bloc commun
 
-    def load_data(self, atom_names, file_list):
+    @property
+    def data(self):
+        """
+        Données chargées (voir __init__). En mode paresseux, le premier accès lit tous les fichiers
+        (nécessaire pour le rééchantillonnage ou l'export) ; les colonnes déjà lues ne sont pas relues.
+        """
+        if self._lazy:
+            self._data = self._stack([self._file_array(i) for i in range(len(self.files))])
+            self._lazy = False
+        return self._data
+
+    @data.setter
+    def data(self, value):
+        self._data = value
+        self._lazy = False
+
+    def load_data(self, atom_names, file_list, archive=None, use_mmap=True, lazy=False, compact=False,
+                  processes=None):
         """
         Charge tous les fichiers de données en mémoire, et génère la liste ordonnée des noms de colonnes.
 
@@ -32,25 +164,308 @@ class DataManager:
             Liste des chemins de fichiers de données à lire.
             Chaque fichier doit avoir le même nombre et ordre de colonnes.
 
+        archive : str, optionnel
+            Archive créée par data_loader.pack_system. Les fichiers présents et à jour dans l'archive
+            y sont lus (une seule ouverture), les autres (absents ou modifiés depuis) depuis les fichiers texte.
+
+        use_mmap : bool
+            Lecture de l'archive par projection mémoire.
+
+        lazy : bool
+            Mode paresseux : les fichiers sont seulement enregistrés (aucune lecture). get_column lit
+            le fichier (ou la colonne de l'archive) demandé au premier accès et mémorise le résultat ;
+            self.data n'est construit qu'au premier accès direct. Les fichiers absents ou illisibles
+            ne sont alors signalés qu'à leur première lecture.
+
+        compact : bool
+            Mode compact : les colonnes sont stockées en float32 et x_DP sous forme de log10(x_DP) (float32),
+            soit la moitié de la mémoire du stockage float64. Les valeurs sont reconverties en float64 à la lecture
+            (get_column, get_columns...). Précision : erreur relative sur x_DP <= ln(10) * |log10 x_DP| * 2**-24,
+            soit environ 4e-6 pour 1e-30 <= x_DP <= 1 ; erreur relative <= 2**-24 (6e-8) sur les autres colonnes.
+            Les valeurs x_DP nulles sont conservées (log10 = -inf), les valeurs négatives deviennent NaN.
+
+        processes : int, optionnel
+            Lecture des fichiers texte dans un pool de processus (data_loader.load_shared) : les processus
+            écrivent directement dans un bloc de mémoire partagée, que self.data enveloppe sans copie.
+            Le bloc est libéré par release() (appelée aussi au chargement suivant, ou en sortie de `with`).
+            Ignoré en mode paresseux et avec une archive.
+
         Effet :
         -------
         - self.colnames est généré : ['mu_Al_1', 'mu_Al_2', 'mu_H_1', 'x_Al_1', 'x_Al_2', 'x_H_1', 'x_DP', 'Hf_DP']
-        - self.data est un tableau numpy (n_files, n_rows, n_cols)
+        - self.data est un tableau numpy (n_files, n_rows, n_cols), ou une liste de tableaux
+          (n_rows_i, n_cols) si les grilles en mu diffèrent d'un fichier à l'autre
         - self.files est mis à jour
         """
+        self.release()
+        self._set_colnames(atom_names)
+        self.files = file_list[:]
+        self.temperatures = []
+        self.temperature = None
+        self._layers = {}
+        self._sort_cache.clear()
+        self._resample_cache.clear()
+        self._inverse_cache.clear()
+        self._column_cache.clear()
+        self.compact = compact
+        self._packed = self._archive_sources(archive, use_mmap) if archive else {}
+        if lazy:
+            self._data = None
+            self._lazy = True
+            return
+        if processes and processes > 1 and not self._packed and file_list:
+            self._load_shared(file_list, processes)
+            return
+        self.data = self._stack([self._file_array(i) for i in range(len(file_list))])
+        self._packed = {}
+
+    def _load_shared(self, file_list, processes):
+        """
+        Lecture multi-processus via un bloc de mémoire partagée (voir load_data, paramètre processes).
+        """
+        block, arrays, errors = data_loader.load_shared(file_list, processes)
+        if errors:
+            if block is not None:
+                block.release()
+            f = next(f for f in file_list if f in errors)
+            raise OSError(f"Lecture impossible de {f} : {errors[f]}")
+        if self.compact:
+            # Conversion float32 : le bloc partagé n'est plus utile après la copie compacte
+            self.data = self._stack([self._encode(arr) for arr in arrays])
+            del arrays
+            block.release()
+            return
+        nrows = {arr.shape[0] for arr in arrays}
+        # Même nombre de lignes : vue 3D sur le bloc, sinon une vue par fichier
+        self.data = block.array[:, :nrows.pop()] if len(nrows) == 1 else arrays
+        self._shared_block = block
+
+    def release(self):
+        """
+        Libère le bloc de mémoire partagée des données lues en multi-processus (voir load_data).
+        Les données chargées et les résultats en cache qui en dépendent sont oubliés.
+        """
+        if self._shared_block is None:
+            return
+        self._data = None
+        self._sort_cache.clear()
+        self._resample_cache.clear()
+        self._inverse_cache.clear()
+        self._shared_block.release()
+        self._shared_block = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+    @staticmethod
+    def _archive_sources(archive, use_mmap=True):
+        """
+        Retourne {fichier: (archive, indice)} pour les fichiers à jour d'une archive, ou {} si l'archive est illisible.
+        """
+        try:
+            packed = data_loader.load_archive(archive, use_mmap=use_mmap)
+        except (OSError, ValueError) as e:
+            print(f"[INFO] Archive ignorée ({archive}) : {e}")
+            return {}
+        return {packed['files'][i]: (packed, i) for i in data_loader.archive_fresh_indices(packed)}
+
+    def _file_array(self, file_idx):
+        """
+        Lit toutes les colonnes du fichier file_idx (depuis l'archive s'il y est à jour, sinon depuis le fichier texte).
+        """
+        f = self.files[file_idx]
+        if f in self._packed:
+            packed, i = self._packed[f]
+            return self._encode(np.hstack([packed['shared'], packed['defects'][i]]))
+        return self._encode(self._read_file(f, use_cache=not self.compact))
+
+    def _lazy_column(self, file_idx, idx):
+        """
+        Mode paresseux : lit (au premier accès seulement) la colonne idx du fichier file_idx.
+        Depuis une archive, seule la colonne demandée est extraite (vue sur la projection mémoire).
+        """
+        file_idx = range(len(self.files))[file_idx]  # IndexError si hors limite, indices négatifs normalisés
+        key = (file_idx, idx)
+        col = self._column_cache.get(key)
+        if col is None:
+            f = self.files[file_idx]
+            if f in self._packed:
+                packed, i = self._packed[f]
+                n_shared = packed['shared'].shape[1]
+                col = packed['shared'][:, idx] if idx < n_shared else packed['defects'][i][:, idx - n_shared]
+            else:
+                col = self._read_file(f, use_cache=not self.compact)[:, idx]
+            self._column_cache[key] = self._encode_column(col, idx) if self.compact else col
+        return self._column_cache[key]
+
+    def _encode_column(self, col, idx):
+        """
+        Mode compact : convertit une colonne en float32 (log10 pour x_DP).
+        """
+        if idx != self.col_index.get("x_DP"):
+            return col.astype(np.float32)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.log10(col).astype(np.float32)
+
+    def _encode(self, arr):
+        """
+        Mode compact : convertit un tableau lu (n_rows, n_cols) en float32, avec x_DP en log10.
+        Hors mode compact, le tableau est retourné tel quel.
+        """
+        if not self.compact or arr is None:
+            return arr
+        out = arr.astype(np.float32)
+        k = self.col_index["x_DP"]
+        if arr.shape[1] > k:
+            out[:, k] = self._encode_column(arr[:, k], k)
+        return out
+
+    def _decode(self, block, cols):
+        """
+        Reconvertit en float64 des colonnes lues en mode compact (10**valeur pour x_DP).
+
+        block : np.ndarray
+            Colonnes extraites, l'avant-dernier axe correspond à cols (ex : (n_fichiers, n_labels, n_rows)),
+            ou une seule colonne si cols est un entier.
+        """
+        if not self.compact:
+            return block
+        k = self.col_index["x_DP"]
+        if np.isscalar(cols):
+            return np.power(10.0, block, dtype=np.float64) if cols == k else block.astype(np.float64)
+        out = block.astype(np.float64)
+        for j, col in enumerate(cols):
+            if col == k:
+                out[..., j, :] = np.power(10.0, out[..., j, :])
+        return out
+
+    def load_temperatures(self, atom_names, file_lists, max_workers=None, compact=False):
+        """
+        Charge en parallèle un jeu de fichiers par température (mode multi-températures).
+
+        Paramètres
+        ----------
+        atom_names : list of str
+            Liste des noms d'atomes (voir load_data).
+        file_lists : dict
+            {température (str) : liste des chemins de fichiers}. Les listes doivent décrire les mêmes
+            défauts dans le même ordre pour toutes les températures.
+        max_workers : int, optionnel
+            Nombre de threads de lecture (None = valeur par défaut de ThreadPoolExecutor).
+        compact : bool
+            Stockage float32 avec x_DP en log10 (voir load_data) ; chaque fichier est converti dès sa lecture.
+
+        Retour :
+        -------
+        missing : list of str
+            Fichiers absents ou illisibles (remplacés par un tableau vide pour garder l'alignement).
+
+        Effet :
+        -------
+        - self.temperatures est l'axe température (ordre de file_lists)
+        - la première température est sélectionnée (self.data, self.files), voir select_temperature
+        """
+        self.release()
+        self._set_colnames(atom_names)
+        self._sort_cache.clear()
+        self._resample_cache.clear()
+        self._inverse_cache.clear()
+        self.compact = compact
+        jobs = [f for files in file_lists.values() for f in files]
+        # Lecture de tous les fichiers de toutes les températures en une seule passe parallèle
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            results = iter(list(pool.map(lambda f: self._encode(self._try_read_file(f, use_cache=not compact)), jobs)))
+
+        missing = []
+        self._layers = {}
+        for temperature, files in file_lists.items():
+            arrays = []
+            for f in files:
+                arr = next(results)
+                if arr is None:
+                    missing.append(f)
+                    arr = np.empty((0, len(self.colnames)), dtype=np.float32 if compact else float)
+                arrays.append(arr)
+            self._layers[temperature] = (files[:], self._stack(arrays))
+        self.temperatures = list(file_lists)
+        if self.temperatures:
+            self.select_temperature(self.temperatures[0])
+        return missing
+
+    def select_temperature(self, temperature):
+        """
+        Sélectionne la température active : self.data et self.files pointent vers le jeu chargé
+        pour cette température, sans relecture des fichiers.
+
+        Exception :
+        -----------
+        - KeyError si la température n'a pas été chargée
+        """
+        self.files, self.data = self._layers[temperature]
+        self.temperature = temperature
+        self._sort_cache.clear()
+        self._inverse_cache.clear()
+
+    def get_files(self, temperature=None):
+        """
+        Retourne la liste des fichiers chargés pour une température (None = température sélectionnée).
+        """
+        return self.files if temperature is None else self._layers[temperature][0]
+
+    def _set_colnames(self, atom_names):
+        """
+        Génère la liste ordonnée des noms de colonnes à partir des noms d'atomes.
+        """
         mu_labels = [f"mu_{a}" for a in atom_names]
         x_labels = [f"x_{a}" for a in atom_names]
         self.colnames = mu_labels + x_labels + ["x_DP", "Hf_DP"]
-        self.files = file_list[:]
-        self.data = []
+        self.col_index = {label: i for i, label in enumerate(self.colnames)}
+
+    def column_index(self, col_label):
+        """
+        Retourne l'indice de la colonne col_label (ValueError si le label n'est pas dans self.colnames).
+        """
+        try:
+            return self.col_index[col_label]
+        except KeyError:
+            raise ValueError(f"Colonne inconnue : {col_label}") from None
+
+    @staticmethod
+    def _read_file(f, use_cache=True):
+        """
+        Lit un fichier de données via le chargeur unique de data_loader (séparateur et entête détectés
+        automatiquement, cache partagé avec le Plotter ; use_cache=False pour ne pas y conserver le tableau).
+        """
+        data = data_loader.load_array(f, use_cache=use_cache)
+        if data is None:
+            raise ValueError(f"Aucune donnée exploitable dans le fichier: {f}")
+        return data
+
+    @classmethod
+    def _try_read_file(cls, f, use_cache=True):
+        """
+        Comme _read_file, mais retourne None (et affiche l'erreur) si le fichier est absent ou illisible.
+        """
+        try:
+            return cls._read_file(f, use_cache=use_cache)
+        except (OSError, ValueError) as e:
+            print(f"[ERREUR] Lecture impossible de {f} : {e}")
+            return None
 
-        for f in file_list:
-            # Lecture du fichier en ignorant la première ligne (header)
-            arr = np.loadtxt(f, delimiter=',', skiprows=1)
-            self.data.append(arr)
-        self.data = np.array(self.data)  # shape: (n_files, n_rows, n_cols)
+    @staticmethod
+    def _stack(arrays):
+        """
+        Empile les tableaux en un tableau 3D (n_files, n_rows, n_cols) s'ils ont tous la même forme,
+        sinon retourne la liste telle quelle.
+        """
+        if len({arr.shape for arr in arrays}) <= 1:
+            return np.array(arrays)
+        return arrays
 
-    def get_column(self, file_idx, col_label):
+    def get_column(self, file_idx, col_label, temperature=None):
         """
         Retourne la colonne désirée sous forme d'un tableau numpy, pour un fichier donné.
 
@@ -60,6 +475,8 @@ class DataManager:
             Index du fichier dans self.files (même ordre que file_list lors du chargement)
         col_label : str
             Nom de la colonne désirée (doit figurer dans self.colnames)
+        temperature : str, optionnel
+            Température à lire en mode multi-températures (None = température sélectionnée)
 
         Retour :
         -------
@@ -70,6 +487,419 @@ class DataManager:
         -----------
         - ValueError si le label n'est pas dans self.colnames
         - IndexError si le file_idx est hors limite
+        - KeyError si la température n'a pas été chargée
+        - OSError si, en mode paresseux, le fichier est absent ou illisible
+        """
+        idx = self.column_index(col_label)
+        if temperature is None and self._lazy:
+            return self._decode(self._lazy_column(file_idx, idx), idx)
+        data = self.data if temperature is None else self._layers[temperature][1]
+        return self._decode(data[file_idx][:, idx], idx)
+
+    def get_columns(self, file_indices, labels, temperature=None):
+        """
+        Retourne en un seul bloc plusieurs colonnes de plusieurs fichiers (indexation avancée, sans boucle Python
+        sur les fichiers quand les données sont empilées).
+
+        Paramètres
+        ----------
+        file_indices : list of int, slice ou None
+            Fichiers à extraire (None = tous).
+        labels : str ou list of str
+            Colonne(s) désirée(s).
+        temperature : str, optionnel
+            Température à lire en mode multi-températures (None = température sélectionnée)
+
+        Retour :
+        -------
+        block : np.ndarray
+            Tableau (n_fichiers, n_labels, n_rows), ou (n_fichiers, n_rows) si labels est un seul label.
+            Si les fichiers n'ont pas tous le même nombre de lignes : liste de tableaux par fichier.
+
+        Exception :
+        -----------
+        - ValueError si un label n'est pas dans self.colnames
+        - IndexError si un indice de fichier est hors limite
+        """
+        single = isinstance(labels, str)
+        cols = [self.column_index(label) for label in ([labels] if single else labels)]
+        if file_indices is None:
+            file_indices = slice(None)
+        if temperature is None and self._lazy:
+            # Mode paresseux : seules les colonnes demandées des fichiers demandés sont lues
+            indices = range(len(self.files))[file_indices] if isinstance(file_indices, slice) else file_indices
+            arrays = [self._decode(np.array([self._lazy_column(i, k) for k in cols]), cols) for i in indices]
+            data = self._stack(arrays)
+            if isinstance(data, np.ndarray) and data.ndim == 3:
+                return data[:, 0] if single else data
+            return [arr[0] for arr in arrays] if single else arrays
+        data = self.data if temperature is None else self._layers[temperature][1]
+        if isinstance(data, np.ndarray):
+            if isinstance(file_indices, slice):
+                files = np.arange(len(data))[file_indices]
+            else:
+                files = np.asarray(file_indices, dtype=int)
+            # Un seul passage d'indexation avancée : (n_fichiers, n_labels, n_rows)
+            block = self._decode(data[files[:, np.newaxis], :, cols], cols)
+            return block[:, 0] if single else block
+        indices = range(len(data))[file_indices] if isinstance(file_indices, slice) else file_indices
+        arrays = [self._decode(data[i][:, cols].T, cols) for i in indices]
+        return [arr[0] for arr in arrays] if single else arrays
+
+    def __getitem__(self, key):
+        """
+        Accès par label sur les données empilées :
+        - manager['x_DP'] : colonne x_DP de tous les fichiers, (n_fichiers, n_rows) (vue sans copie, sauf en mode compact)
+        - manager[file_indices, labels] : équivalent à get_columns(file_indices, labels)
+        """
+        if isinstance(key, tuple):
+            return self.get_columns(*key)
+        data = self.data
+        if isinstance(data, np.ndarray):
+            idx = self.column_index(key)
+            return self._decode(data[:, :, idx], idx)
+        return self.get_columns(None, key)
+
+    def _sort_order(self, file_idx, x_label):
+        """
+        Retourne la permutation qui trie la colonne x_label du fichier file_idx par ordre croissant.
+        Le tri n'est calculé qu'une fois par (fichier, colonne) ; None signifie que la colonne est déjà croissante.
+        """
+        key = (file_idx, x_label)
+        if key not in self._sort_cache:
+            x = self.get_column(file_idx, x_label)
+            if np.all(np.diff(x) >= 0):
+                order = None
+            else:
+                # Colonne décroissante ou non monotone (ex : balayage aller-retour en mu)
+                order = np.argsort(x, kind="stable")
+            self._sort_cache[key] = order
+        return self._sort_cache[key]
+
+    def resample(self, x_label, grid, y_label="x_DP", mode="linear"):
+        """
+        Rééchantillonne la colonne y_label de tous les fichiers chargés sur une grille commune de x_label.
+
+        Paramètres
+        ----------
+        x_label : str
+            Colonne servant d'abscisse (mu_* ou x_*).
+        grid : array-like
+            Grille commune d'abscisses (voir make_grid).
+        y_label : str
+            Colonne à interpoler (par défaut x_DP).
+        mode : str
+            'linear' : interpolation linéaire de y en fonction de x.
+            'log' : interpolation de log10(y) (et de log10(x) pour une colonne x_* strictement positive),
+            adaptée aux concentrations qui couvrent plusieurs décades.
+
+        Retour :
+        -------
+        matrix : np.ndarray
+            Matrice dense (n_files, n_grid). Les points hors du domaine d'un fichier valent NaN.
+            Le résultat est mis en cache (clé : liste de fichiers, grille, colonnes, mode) ;
+            il ne doit pas être modifié en place.
+        """
+        if mode not in ("linear", "log"):
+            raise ValueError(f"Mode d'interpolation inconnu : {mode}")
+        grid = np.ascontiguousarray(grid, dtype=float)
+        key = (tuple(self.files), x_label, y_label, mode, grid.size,
+               hashlib.sha1(grid.tobytes()).hexdigest())
+        if key in self._resample_cache:
+            return self._resample_cache[key]
+
+        log_x = mode == "log" and x_label.startswith("x_") and np.all(grid > 0)
+        xg = np.log10(grid) if log_x else grid
+        matrix = np.full((len(self.files), grid.size), np.nan)
+
+        # Cas courant : grille mu/x identique pour tous les fichiers -> un seul calcul des poids
+        shared = isinstance(self.data, np.ndarray) and len(self.files) > 0
+        if shared:
+            x_idx = self.column_index(x_label)
+            shared = np.array_equal(self.data[:, :, x_idx], np.broadcast_to(self.data[:1, :, x_idx], self.data.shape[:2]))
+        if shared:
+            order = self._sort_order(0, x_label)
+            y_idx = self.column_index(y_label)
+            x = self._decode(self.data[0, :, x_idx], x_idx)
+            ys = self._decode(self.data[:, :, y_idx], y_idx)
+            if order is not None:
+                x, ys = x[order], ys[:, order]
+            matrix[:] = self._interp_rows(x, ys, xg, log_x, mode == "log")
+        else:
+            for i in range(len(self.files)):
+                order = self._sort_order(i, x_label)
+                x = self.get_column(i, x_label)
+                y = self.get_column(i, y_label)
+                if order is not None:
+                    x, y = x[order], y[order]
+                matrix[i] = self._interp_rows(x, y[np.newaxis, :], xg, log_x, mode == "log")[0]
+
+        self._resample_cache[key] = matrix
+        return matrix
+
+    def inverse_index(self, key_label, value_label):
+        """
+        Index de recherche inverse (MonotonicIndex) entre deux colonnes du bloc mu/x commun (ex : x_H -> mu_H),
+        construit une fois par couple de colonnes et par chargement.
+
+        Exception :
+        -----------
+        - ValueError si un label est inconnu ou si les fichiers n'ont pas la même grille mu/x (voir shared_block)
+        """
+        cache_key = (key_label, value_label)
+        if cache_key not in self._inverse_cache:
+            block = self.shared_block()
+            self._inverse_cache[cache_key] = MonotonicIndex(block[:, self.column_index(key_label)],
+                                                            block[:, self.column_index(value_label)])
+        return self._inverse_cache[cache_key]
+
+    def convert(self, values, from_label, to_label):
+        """
+        Conversion groupée de valeurs d'une colonne du balayage vers une autre (ex : compositions x_H visées ->
+        potentiels chimiques mu_H), par recherche dans l'index monotone (voir inverse_index).
+
+        Retour :
+        -------
+        converted, n_solutions : np.ndarray (voir MonotonicIndex.query)
+        """
+        return self.inverse_index(from_label, to_label).query(values)
+
+    def snapshot(self, x_label, value, y_labels=("x_DP", "Hf_DP")):
+        """
+        Valeurs de plusieurs colonnes de tous les fichiers chargés en un point de l'abscisse (ex : x_H = 0.01),
+        par interpolation vectorisée sur tous les fichiers (voir resample ; en log pour x_DP, linéaire sinon).
+
+        Paramètres
+        ----------
+        x_label : str
+            Colonne servant d'abscisse (mu_* ou x_*).
+        value : float
+            Abscisse du point.
+        y_labels : list of str
+            Colonnes à interpoler.
+
+        Retour :
+        -------
+        table : np.ndarray
+            Tableau (n_fichiers, n_colonnes) ; NaN pour un fichier dont le domaine ne contient pas value.
+        """
+        grid = np.array([float(value)])
+        return np.column_stack([self.resample(x_label, grid, y_label, "log" if y_label == "x_DP" else "linear")[:, 0]
+                                for y_label in y_labels])
+
+    def export_snapshot(self, path, x_label, value, labels, y_labels=("x_DP", "Hf_DP")):
+        """
+        Exporte en CSV le tableau de snapshot (voir snapshot) : une ligne par défaut (label, fichier, valeurs),
+        triée par valeur décroissante de la première colonne (les défauts hors domaine en dernier).
+
+        Paramètres
+        ----------
+        path : str
+            Fichier CSV de sortie.
+        x_label, value : abscisse et point du snapshot (rappelés en commentaire en tête du fichier).
+        labels : list of str
+            Label de chaque fichier chargé (même ordre que self.files).
+        y_labels : list of str
+            Colonnes exportées.
+
+        Retour :
+        -------
+        path : str
+            Chemin écrit.
+
+        Exception :
+        -----------
+        - ValueError si le nombre de labels ne correspond pas aux fichiers
+        """
+        if len(labels) != len(self.files):
+            raise ValueError(f"{len(labels)} labels pour {len(self.files)} fichiers chargés.")
+        table = self.snapshot(x_label, value, y_labels)
+        order = np.argsort(-table[:, 0], kind="stable")  # NaN placés en dernier par argsort
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(f"# {x_label} = {float(value):.10g}\n")
+            writer = csv.writer(f)
+            writer.writerow(["defect", "file"] + list(y_labels))
+            writer.writerows([labels[i], self.files[i]] + [f"{v:.10e}" for v in table[i]] for i in order)
+        return path
+
+    def top_k(self, k, x_label, y_label="x_DP", xmin=None, xmax=None, at=None):
+        """
+        Sélectionne les k fichiers (défauts) dont la colonne y_label est la plus élevée, en un seul passage vectorisé
+        sur les données empilées.
+
+        Paramètres
+        ----------
+        k : int
+            Nombre de fichiers à retenir.
+        x_label : str
+            Colonne servant d'abscisse (mu_* ou x_*).
+        y_label : str
+            Colonne classée (par défaut x_DP).
+        xmin, xmax : float, optionnel
+            Intervalle d'abscisse sur lequel le maximum est pris (None = sans limite).
+        at : float, optionnel
+            Si donné, classement sur la valeur interpolée en x = at (voir resample ; en log pour x_DP)
+            au lieu du maximum sur l'intervalle.
+
+        Retour :
+        -------
+        indices, scores : np.ndarray
+            Indices des fichiers retenus (valeur décroissante) et valeurs correspondantes. Les fichiers sans
+            valeur finie dans l'intervalle (ou hors domaine en x = at) ne sont jamais retenus.
+        """
+        if at is not None:
+            mode = "log" if y_label == "x_DP" else "linear"
+            scores = self.resample(x_label, np.array([float(at)]), y_label, mode)[:, 0]
+        else:
+            lo = -np.inf if xmin is None else min(xmin, xmax if xmax is not None else xmin)
+            hi = np.inf if xmax is None else max(xmax, xmin if xmin is not None else xmax)
+            block = self.get_columns(None, [x_label, y_label])
+            if isinstance(block, np.ndarray):
+                x, y = block[:, 0], block[:, 1]
+                inside = (x >= lo) & (x <= hi) & np.isfinite(y)
+                scores = np.where(inside, y, -np.inf).max(axis=1, initial=-np.inf)
+            else:
+                # Fichiers de longueurs différentes : un passage vectorisé par fichier
+                scores = np.array([np.where((b[0] >= lo) & (b[0] <= hi) & np.isfinite(b[1]), b[1], -np.inf)
+                                   .max(initial=-np.inf) for b in block])
+        scores = np.where(np.isfinite(scores), scores, -np.inf)
+        k = min(int(k), scores.size)
+        if k <= 0:
+            return np.array([], dtype=int), np.array([])
+        # argpartition : sélection en O(n), seul le sous-ensemble retenu est trié
+        candidates = np.argpartition(-scores, k - 1)[:k] if k < scores.size else np.arange(scores.size)
+        indices = candidates[np.argsort(-scores[candidates], kind="stable")]
+        indices = indices[np.isfinite(scores[indices])]
+        return indices, scores[indices]
+
+    @staticmethod
+    def _interp_rows(x, ys, xg, log_x, log_y):
+        """
+        Interpolation linéaire vectorisée de plusieurs courbes ys (n_curves, n_rows) partageant
+        la même abscisse triée x, sur la grille xg (déjà passée en log10 si log_x).
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            if log_x:
+                x = np.log10(x)
+            if log_y:
+                ys = np.log10(ys)
+            j = np.clip(np.searchsorted(x, xg, side="right") - 1, 0, max(x.size - 2, 0))
+            x0, x1 = x[j], x[np.minimum(j + 1, x.size - 1)]
+            dx = x1 - x0
+            w = np.where(dx > 0, (xg - x0) / np.where(dx > 0, dx, 1.0), 0.0)
+            y0, y1 = ys[:, j], ys[:, np.minimum(j + 1, x.size - 1)]
+            # Aux noeuds exacts on reprend la valeur tabulée (évite -inf * 0 en échelle log)
+            out = np.where(w == 0, y0, np.where(w == 1, y1, y0 * (1.0 - w) + y1 * w))
+            out[:, (xg < x[0]) | (xg > x[-1])] = np.nan
+            if log_y:
+                out = np.power(10.0, out)
+        return out
+
+    def shared_block(self):
+        """
+        Retourne le bloc des colonnes mu_*/x_* commun à tous les fichiers chargés.
+
+        Retour :
+        -------
+        block : np.ndarray
+            Vue (n_rows, n_shared) sur le premier fichier (copie float64 en mode compact).
+
+        Exception :
+        -----------
+        - ValueError si les fichiers n'ont pas la même grille mu/x (voir resample)
+        """
+        n_shared = len(self.colnames) - 2
+        if not isinstance(self.data, np.ndarray) or self.data.ndim != 3 or len(self.files) == 0:
+            raise ValueError("Les fichiers chargés n'ont pas tous la même grille mu/x (utiliser resample).")
+        block = self.data[0, :, :n_shared]
+        if not np.array_equal(self.data[:, :, :n_shared], np.broadcast_to(block, self.data[:, :, :n_shared].shape)):
+            raise ValueError("Les fichiers chargés n'ont pas tous la même grille mu/x (utiliser resample).")
+        return block.astype(np.float64) if self.compact else block
+
+    def export_table(self, path, labels, chunk_rows=10000):
+        """
+        Exporte les données chargées sous forme de table : le bloc mu/x commun une seule fois,
+        puis une colonne x_DP et une colonne Hf_DP par défaut.
+
+        Le format est choisi d'après l'extension : .parquet (pyarrow), .h5/.hdf5 (h5py), sinon CSV.
+        Si la bibliothèque nécessaire n'est pas installée, l'export se fait en CSV (extension remplacée).
+        L'écriture se fait par blocs de chunk_rows lignes (Parquet, CSV) ou colonne par colonne (HDF5),
+        sans construire de copie complète de la table en mémoire.
+
+        Paramètres
+        ----------
+        path : str
+            Fichier de sortie.
+        labels : list of str
+            Label de chaque fichier chargé (même ordre que self.files), ex : generate_file_list_and_labels.
+        chunk_rows : int
+            Nombre de lignes écrites par bloc.
+
+        Retour :
+        -------
+        path : str
+            Chemin réellement écrit.
+
+        Exception :
+        -----------
+        - ValueError si le nombre de labels ne correspond pas aux fichiers, ou si la grille mu/x n'est pas commune
+        """
+        if len(labels) != len(self.files):
+            raise ValueError(f"{len(labels)} labels pour {len(self.files)} fichiers chargés.")
+        block = self.shared_block()
+        dp_cols = [self.col_index["x_DP"], self.col_index["Hf_DP"]]
+        names = self.colnames[:-2] + [f"{col}[{label}]" for label in labels for col in ("x_DP", "Hf_DP")]
+        root, ext = os.path.splitext(path)
+        ext = ext.lower()
+        if ext == ".parquet":
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError:
+                print("[INFO] pyarrow absent : export en CSV.")
+            else:
+                schema = pa.schema([(name, pa.float64()) for name in names])
+                with pq.ParquetWriter(path, schema) as writer:
+                    for start, stop in self._row_chunks(chunk_rows):
+                        columns = [block[start:stop, j] for j in range(block.shape[1])]
+                        per_defect = self._decode(self.data[:, start:stop, dp_cols].transpose(0, 2, 1), dp_cols)
+                        columns += [per_defect[i, j] for i in range(len(self.files)) for j in range(2)]
+                        writer.write_batch(pa.record_batch([pa.array(c) for c in columns], schema=schema))
+                return path
+        elif ext in (".h5", ".hdf5"):
+            try:
+                import h5py
+            except ImportError:
+                print("[INFO] h5py absent : export en CSV.")
+            else:
+                with h5py.File(path, "w") as h5:
+                    shared = h5.create_group("shared")
+                    for j, name in enumerate(self.colnames[:-2]):
+                        shared.create_dataset(name, data=block[:, j])
+                    defects = h5.create_group("defects")
+                    for i, label in enumerate(labels):
+                        group = defects.create_group(label.replace("/", "_"))
+                        group.attrs["file"] = self.files[i]
+                        group.create_dataset("x_DP", data=self.get_column(i, "x_DP"))
+                        group.create_dataset("Hf_DP", data=self.get_column(i, "Hf_DP"))
+                return path
+
+        if ext != ".csv":
+            path = root + ".csv"
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(",".join(names) + "\n")
+            for start, stop in self._row_chunks(chunk_rows):
+                # Bloc (lignes, défauts, 2) -> (lignes, 2 * défauts) : x_DP, Hf_DP pour chaque défaut
+                per_defect = self._decode(self.data[:, start:stop, dp_cols].transpose(0, 2, 1), dp_cols)
+                per_defect = per_defect.transpose(2, 0, 1).reshape(stop - start, -1)
+                np.savetxt(f, np.hstack([block[start:stop], per_defect]), delimiter=",", fmt="%.10e")
+        return path
+
+    def _row_chunks(self, chunk_rows):
+        """
+        Itère sur les bornes (début, fin) des blocs de lignes à écrire.
         """
-        idx = self.colnames.index(col_label)
-        return self.data[file_idx][:, idx]
+        n_rows = self.data.shape[1]
+        step = max(1, int(chunk_rows))
+        for start in range(0, n_rows, step):
+            yield start, min(start + step, n_rows)
@@ -6,8 +6,11 @@ Responsabilités principales :
 - Calcule les labels et indices associés selon les options d'affichage et la configuration utilisateur
 - Fournit les listes d’atomes/sites actifs pour le plotter et le data_loader
 - Filtre la génération des courbes selon la sélection de l'utilisateur (atomes/sites à tracer)
+- Décline la liste de fichiers pour chaque température en mode multi-températures
+- Mode « K défauts les plus concentrés » : sélection automatique à la place des listes atomes/sites
 """
 
+import os
 import tkinter as tk
 import config
 
@@ -123,7 +126,7 @@ class DefectLogic:
             sites += inter_sites
         return network_atoms, added_atoms, network_sites, inter_sites, atoms, sites
 
-    def generate_file_list_and_labels(self):
+    def generate_file_list_and_labels(self, base=None, use_selection=True):
         """
         Génère la liste (fichier, label) pour chaque courbe à afficher, en tenant compte des options cochées,
         et de la sélection utilisateur (atomes/sites à tracer).
@@ -131,10 +134,14 @@ class DefectLogic:
         - Substitutions (i ≠ k) pour tous atomes/sites sélectionnés
         - Défauts interstitiels pour atomes ajoutés et sites interstitiels sélectionnés
 
+        Paramètres :
+            base : préfixe des fichiers (None = nom du système saisi dans l'interface)
+            use_selection : False pour ignorer la sélection atomes/sites des listes (ex : mode top-K)
         Retour :
             file_labels : liste de tuples (nom_fichier, label) pour chaque courbe à afficher
         """
-        base = self.app.system_name.get()
+        if base is None:
+            base = self.app.system_name.get()
         show_vac = self.app.show_vacancies.get()
         show_sub = self.app.show_substitutions.get()
 
@@ -144,8 +151,8 @@ class DefectLogic:
         n_all_sites = len(all_sites)
 
         # Prise en compte de la sélection utilisateur (listes vides = tout sélectionner)
-        selected_atoms = getattr(self.app, 'selected_atoms', []) or all_atoms
-        selected_sites = getattr(self.app, 'selected_sites', []) or all_sites
+        selected_atoms = (getattr(self.app, 'selected_atoms', []) if use_selection else []) or all_atoms
+        selected_sites = (getattr(self.app, 'selected_sites', []) if use_selection else []) or all_sites
 
         file_labels = []
 
@@ -176,3 +183,79 @@ class DefectLogic:
 
         return file_labels
 
+    def top_k_file_labels(self, file_labels, k, x_label, y_label="x_DP", xmin=None, xmax=None, at=None):
+        """
+        Mode « K défauts les plus concentrés » : retient parmi file_labels les k défauts dont y_label est
+        la plus élevée sur [xmin, xmax] (ou en x_label = at), voir DataManager.top_k.
+
+        Paramètres :
+            file_labels : liste de tuples (fichier, label) candidats (ex : generate_file_list_and_labels
+                          sans sélection atomes/sites)
+            k : nombre de défauts à retenir
+            x_label, y_label : colonnes d'abscisse et de classement
+            xmin, xmax, at : intervalle d'abscisse ou point de classement (voir DataManager.top_k)
+        Retour :
+            liste de tuples (fichier, label), du plus concentré au moins concentré
+            (les fichiers absents ou illisibles sont ignorés)
+        """
+        from data_manager import DataManager  # NumPy importé au premier usage (démarrage rapide de l'interface)
+        candidates = [(f, label) for f, label in file_labels if os.path.isfile(f)]
+        if not candidates:
+            return []
+        network_atoms, added_atoms = self.get_active_atoms_sites()[:2]
+        manager = DataManager()
+        try:
+            manager.load_data(network_atoms + added_atoms, [f for f, _ in candidates])
+            indices, scores = manager.top_k(k, x_label, y_label, xmin, xmax, at)
+        except (OSError, ValueError) as e:
+            print(f"[ERREUR] Sélection des {k} défauts les plus concentrés impossible : {e}")
+            return list(file_labels)
+        finally:
+            manager.release()
+        if self.debug:
+            print("[DEBUG] top-k =", [(candidates[i][1], s) for i, s in zip(indices, scores)])
+        return [candidates[i] for i in indices]
+
+    def get_temperatures(self):
+        """
+        Retourne la liste des températures saisies dans le champ température (chaînes, ex : ['800', '1000']).
+        Formats acceptés :
+        - une seule valeur : "1000"
+        - une liste : "800, 1000, 1200"
+        - une plage début:fin:pas (fin incluse) : "800:1600:200"
+        Exception :
+            ValueError si le champ ne peut pas être interprété
+        """
+        text = self.app.temperature.get().strip()
+        if ":" in text:
+            parts = [float(p) for p in text.split(":")]
+            if len(parts) != 3 or parts[2] <= 0:
+                raise ValueError(f"Plage de températures invalide : {text} (attendu début:fin:pas)")
+            start, stop, step = parts
+            temps = []
+            t = start
+            while t <= stop + 1e-9 * step:
+                temps.append(t)
+                t += step
+            return [f"{t:g}" for t in temps]
+        return [t.strip() for t in text.replace(";", ",").split(",") if t.strip()]
+
+    def generate_temperature_file_lists(self):
+        """
+        Génère la liste (fichier, label) de chaque température, en remplaçant le motif
+        config.TEMPERATURE_PLACEHOLDER du nom du système par la température.
+        Les labels (et donc l'ordre des courbes) sont identiques d'une température à l'autre.
+
+        Retour :
+            temp_file_labels : liste de tuples (température, file_labels)
+            (une seule entrée si le nom du système ne contient pas le motif)
+        """
+        template = self.app.system_name.get()
+        temperatures = self.get_temperatures()
+        if config.TEMPERATURE_PLACEHOLDER not in template:
+            temperature = temperatures[0] if temperatures else ""
+            return [(temperature, self.generate_file_list_and_labels(template))]
+        return [
+            (t, self.generate_file_list_and_labels(template.replace(config.TEMPERATURE_PLACEHOLDER, t)))
+            for t in temperatures
+        ]
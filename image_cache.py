@@ -0,0 +1,116 @@
+"""
+Cache disque des images rendues (PNG), indexé par une empreinte du tracé.
+
+Responsabilités principales :
+- Associe à chaque clé (empreinte de la spécification de tracé et des fichiers de données, voir
+  Plotter.plot_fingerprint) l'image déjà rendue, conservée dans un fichier <clé>.png du dossier de cache
+- Politique LRU : la date de modification d'un fichier du cache est mise à jour à chaque lecture,
+  les images les moins récemment utilisées sont supprimées quand la taille totale dépasse la limite
+- Compteurs de succès/échecs (hits/misses) pour suivre l'efficacité du cache
+"""
+
+import os
+
+
+class ImageCache:
+    def __init__(self, directory, max_bytes):
+        """
+        Paramètres :
+            directory : dossier du cache (créé au premier enregistrement)
+            max_bytes : taille totale maximale des images conservées (octets)
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.png")
+
+    def get(self, key):
+        """
+        Retourne l'image associée à key (bytes), ou None si elle n'est pas en cache.
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)  # Image la plus récemment utilisée
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data
+
+    def put(self, key, data):
+        """
+        Enregistre l'image data (bytes) sous la clé key, puis applique la limite de taille.
+        Les erreurs d'écriture (disque plein, dossier en lecture seule) sont signalées sans interrompre le tracé.
+        """
+        path = self._path(key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            tmp = path + ".tmp"
+            with open(tmp, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, path)  # Jamais d'image à moitié écrite sous le nom définitif
+        except OSError as e:
+            print(f"[INFO] Image non mise en cache ({path}) : {e}")
+            return
+        self.evict()
+
+    def entries(self):
+        """
+        Retourne la liste [(date d'utilisation, taille, chemin), ...] des images en cache, la plus ancienne en premier.
+        """
+        entries = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return entries
+        for name in names:
+            if not name.endswith(".png"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, path))
+        entries.sort()
+        return entries
+
+    def evict(self):
+        """
+        Supprime les images les moins récemment utilisées jusqu'à repasser sous max_bytes.
+        """
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self):
+        """
+        Vide le cache et remet les compteurs à zéro.
+        """
+        for _, _, path in self.entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self):
+        """
+        Retourne un dictionnaire {'hits', 'misses', 'entries', 'bytes'} décrivant l'état du cache.
+        """
+        entries = self.entries()
+        return {'hits': self.hits, 'misses': self.misses,
+                'entries': len(entries), 'bytes': sum(size for _, size, _ in entries)}
@@ -0,0 +1,170 @@
+"""
+Inspecteur au survol : valeurs de toutes les courbes tracées à l'abscisse du curseur.
+
+Responsabilités principales :
+- Indexe une fois les courbes d'une figure (abscisses triées, concaténées avec un décalage par courbe)
+  pour trouver le point le plus proche du curseur sur toutes les courbes en un seul appel à searchsorted
+- Suit les mouvements de la souris sur la figure matplotlib, avec une mise à jour limitée à la fréquence
+  d'affichage (config.HOVER_REFRESH_MS) : les événements intermédiaires sont ignorés
+- Affiche un petit tableau Tk (label, x, valeur), trié par valeur décroissante
+"""
+
+import numpy as np
+import config
+
+
+class CurveIndex:
+    """
+    Index des points de plusieurs courbes (x, y) pour des requêtes « point le plus proche en x » vectorisées.
+    Les abscisses de chaque courbe sont triées puis décalées de k * (étendue + 1) (k = numéro de courbe) et
+    concaténées : le tableau obtenu est croissant, et les K requêtes d'une abscisse (une par courbe)
+    se résolvent par un seul np.searchsorted.
+    """
+
+    def __init__(self, curves):
+        """
+        Paramètres :
+            curves : liste de (x, y) (tableaux 1D de même longueur par courbe) ; les points non finis sont ignorés
+        """
+        xs, ys = [], []
+        for x, y in curves:
+            x = np.asarray(x, dtype=float)
+            y = np.asarray(y, dtype=float)
+            keep = np.isfinite(x) & np.isfinite(y)
+            order = np.argsort(x[keep], kind="stable")
+            xs.append(x[keep][order])
+            ys.append(y[keep][order])
+        self.n_curves = len(xs)
+        sizes = np.array([x.size for x in xs], dtype=int)
+        self.start = np.concatenate(([0], np.cumsum(sizes)))[:-1]
+        self.stop = self.start + sizes
+        flat_x = np.concatenate(xs) if xs else np.empty(0)
+        self.y = np.concatenate(ys) if ys else np.empty(0)
+        self.x = flat_x
+        lo = flat_x.min() if flat_x.size else 0.0
+        self.span = (flat_x.max() - lo if flat_x.size else 0.0) + 1.0
+        # Abscisses ramenées à partir de 0 puis décalées par courbe : tableau croissant unique
+        curve_of_point = np.repeat(np.arange(self.n_curves), sizes)
+        self._lo = lo
+        self._keys = (flat_x - lo) + curve_of_point * self.span
+        self.xmin = np.array([x[0] if x.size else np.inf for x in xs])
+        self.xmax = np.array([x[-1] if x.size else -np.inf for x in xs])
+
+    def query(self, x):
+        """
+        Point le plus proche de l'abscisse x sur chaque courbe dont le domaine contient x.
+
+        Retour :
+            curves, xs, ys : indices des courbes concernées, abscisses et ordonnées des points retenus
+        """
+        inside = np.flatnonzero((self.xmin <= x) & (self.xmax >= x))
+        if inside.size == 0:
+            return inside, np.empty(0), np.empty(0)
+        keys = (x - self._lo) + inside * self.span
+        right = np.searchsorted(self._keys, keys)
+        right = np.clip(right, self.start[inside], self.stop[inside] - 1)
+        left = np.maximum(right - 1, self.start[inside])
+        nearest = np.where(np.abs(self.x[left] - x) <= np.abs(self.x[right] - x), left, right)
+        return inside, self.x[nearest], self.y[nearest]
+
+
+class HoverInspector:
+    """
+    Tableau des valeurs de toutes les courbes d'un axe matplotlib au point survolé, dans une fenêtre Tk.
+    """
+
+    def __init__(self, root, ax, title="", refresh_ms=config.HOVER_REFRESH_MS):
+        """
+        Paramètres :
+            root : fenêtre Tkinter principale (planification des mises à jour, fenêtre du tableau)
+            ax : axe matplotlib dont les courbes (Line2D) sont inspectées
+            title : titre de la fenêtre du tableau
+            refresh_ms : délai minimal entre deux mises à jour du tableau (ms)
+        """
+        self.root = root
+        self.ax = ax
+        self.title = title
+        self.refresh_ms = refresh_ms
+        self.debug = False  # Mettre à True pour afficher les requêtes traitées
+        self.rebuild()
+        self._pending_x = None
+        self._after_id = None
+        self._cid = None
+        self._window = None
+        self._table = None
+
+    def rebuild(self):
+        """
+        (Re)construit l'index des courbes de l'axe : à appeler quand des courbes sont ajoutées ou leurs données
+        modifiées (mode suivi). Le tableau affiché reste ouvert et est mis à jour au prochain survol.
+        """
+        lines = [line for line in self.ax.get_lines() if not line.get_label().startswith("_")]
+        self.labels = [line.get_label() for line in lines]
+        self.index = CurveIndex([(line.get_xdata(), line.get_ydata()) for line in lines])
+
+    def connect(self):
+        """
+        Commence à suivre les mouvements de la souris sur la figure (arrêt automatique à sa fermeture).
+        """
+        canvas = self.ax.figure.canvas
+        self._cid = canvas.mpl_connect('motion_notify_event', self._on_motion)
+        canvas.mpl_connect('close_event', lambda event: self.disconnect())
+
+    def disconnect(self):
+        """
+        Arrête le suivi de la souris et ferme le tableau.
+        """
+        if self._cid is not None:
+            self.ax.figure.canvas.mpl_disconnect(self._cid)
+            self._cid = None
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        if self._window is not None:
+            self._window.destroy()
+            self._window = self._table = None
+
+    def _on_motion(self, event):
+        # On ne garde que la dernière position : au plus une mise à jour par période d'affichage
+        if event.inaxes is not self.ax or event.xdata is None:
+            return
+        self._pending_x = event.xdata
+        if self._after_id is None:
+            self._after_id = self.root.after(self.refresh_ms, self._refresh)
+
+    def rows(self, x):
+        """
+        Lignes du tableau à l'abscisse x : [(label, x du point, valeur), ...] triées par valeur décroissante.
+        """
+        curves, xs, ys = self.index.query(x)
+        order = np.argsort(-ys, kind="stable")
+        return [(self.labels[curves[i]], float(xs[i]), float(ys[i])) for i in order]
+
+    def _refresh(self):
+        self._after_id = None
+        if self._pending_x is None:
+            return
+        x, self._pending_x = self._pending_x, None
+        rows = self.rows(x)
+        if self.debug:
+            print(f"[DEBUG] Survol x = {x:g} : {len(rows)} courbes")
+        self._show(x, rows)
+
+    def _show(self, x, rows):
+        import tkinter as tk
+        from tkinter import ttk
+        if self._window is None or not self._window.winfo_exists():
+            self._window = tk.Toplevel(self.root)
+            self._window.title(self.title)
+            self._table = ttk.Treeview(self._window, columns=("x", "value"), height=12)
+            self._table.heading("#0", text="")
+            self._table.heading("x", text="x")
+            self._table.heading("value", text="y")
+            self._table.column("#0", width=160)
+            self._table.column("x", width=100, anchor='e')
+            self._table.column("value", width=100, anchor='e')
+            self._table.pack(fill='both', expand=True)
+        self._window.title(f"{self.title} (x = {x:.4g})")
+        self._table.delete(*self._table.get_children())
+        for label, xp, yp in rows:
+            self._table.insert('', 'end', text=label, values=(f"{xp:.4g}", f"{yp:.3e}"))
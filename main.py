@@ -2,12 +2,64 @@
 Point d'entrée de l'application.
 - Initialise la fenêtre Tkinter.
 - Crée l'instance principale de l'application.
+- Importe en arrière-plan les modules lourds (NumPy, matplotlib, plotter) une fois la fenêtre affichée.
 - Lance la boucle principale.
+
+Option :
+    python main.py --startup-time
+        Affiche le temps d'ouverture de la fenêtre et le détail des temps d'import, puis quitte
+        (mesure reproductible pour suivre les régressions du démarrage).
 """
-from ui_widgets import DefectPlotterApp
+import time
+_START = time.perf_counter()
+
+import importlib
+import sys
+import threading
 import tkinter as tk
 
+# Modules importés en arrière-plan, dans l'ordre (chacun inclut le temps de ses dépendances non encore chargées)
+WARM_MODULES = ("numpy", "matplotlib.pyplot", "data_loader", "plotter")
+
+
+def warm_imports(timings=None):
+    """
+    Importe les modules lourds (sans toucher à Tkinter) pour que le premier tracé ne paie pas leur chargement.
+    Si le thread principal a besoin d'un module en cours d'import, il attend simplement la fin de l'import.
+
+    timings : dict, optionnel
+        Rempli avec {module: durée d'import en secondes}
+    """
+    for name in WARM_MODULES:
+        start = time.perf_counter()
+        importlib.import_module(name)
+        if timings is not None:
+            timings[name] = time.perf_counter() - start
+
+
+def report_startup(root, timings, warm, window_time):
+    """
+    Affiche le détail des temps de démarrage dès la fin des imports en arrière-plan, puis ferme l'application.
+    """
+    if warm.is_alive():
+        root.after(20, report_startup, root, timings, warm, window_time)
+        return
+    print(f"[INFO] Fenêtre affichée en {window_time * 1000:.0f} ms")
+    for name, seconds in timings.items():
+        print(f"[INFO]   import {name:<18} {seconds * 1000:7.0f} ms")
+    print(f"[INFO] Démarrage complet (imports inclus) en {(time.perf_counter() - _START) * 1000:.0f} ms")
+    root.destroy()
+
+
 if __name__ == "__main__":
     root = tk.Tk()
+    from ui_widgets import DefectPlotterApp
     app = DefectPlotterApp(root)
+    root.update()  # Affiche la fenêtre avant les imports lourds
+    window_time = time.perf_counter() - _START
+    timings = {}
+    warm = threading.Thread(target=warm_imports, args=(timings,), daemon=True)
+    warm.start()
+    if "--startup-time" in sys.argv:
+        root.after(20, report_startup, root, timings, warm, window_time)
     root.mainloop()
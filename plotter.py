@@ -8,13 +8,302 @@ Responsabilités principales :
 - Prend en compte les bornes et échelles des axes configurées par l'utilisateur.
 - Trace uniquement les atomes/sites sélectionnés (via defect_logic).
 - Permet de tracer la concentration selon n'importe quel mu_atX ou x_atX choisi par l'utilisateur.
+- Mode multi-températures : superposition, une vignette par température, ou défilement des températures.
+- Export d'animations (MP4/GIF) d'un balayage en température, rendu éventuellement en parallèle.
+- Comparaison de plusieurs systèmes en grille de vignettes (lecture parallèle via le cache partagé).
+- Export des données de la sélection courante (Parquet, HDF5 ou CSV).
+- Mode suivi : mise à jour incrémentale de la figure pendant qu'ADPI écrit encore les fichiers.
+- Élagage optionnel des défauts qui n'entrent jamais dans la fenêtre visible (cartes de zones de data_loader).
+- Inspecteur au survol (inspector.py) : valeurs de toutes les courbes à l'abscisse du curseur.
+- Snapshot : concentrations et énergies de formation de tous les défauts en un point (tableau, export CSV).
+- Bascule de l'abscisse composition x_* <-> potentiel mu_* de la figure affichée, sans relecture (touche m).
+- Analyse des régimes de Brouwer (analysis.py) : pentes et ruptures par défaut, droites ajustées superposées.
+- Aperçu rapide : images PNG mises en cache sur disque (image_cache), indexées par l'empreinte du tracé.
 """
 
+import hashlib
+import math
+import shutil
+import subprocess
+import tempfile
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 import matplotlib.pyplot as plt
-from data_loader import read_data, check_files_exist, get_n_species, get_colnames
+import numpy as np
+from data_loader import (read_data, check_files_exist, get_n_species, get_colnames, load_arrays, load_from_archive,
+                         file_stats, zone_maps, zone_max)
+from data_manager import DataManager
+from watcher import DataWatcher
+from render_worker import RenderWorker
+from image_cache import ImageCache
+from inspector import HoverInspector
+from analysis import brouwer_analysis
 import config
 import os
 
+def apply_axes_spec(ax, spec):
+    """
+    Applique à un axe matplotlib la grille, les bornes, les échelles et les libellés d'une
+    spécification de tracé (dictionnaire picklable, voir Plotter.get_plot_spec).
+    """
+    ax.grid(color="#C0C0C0")
+    ax.set_xscale(spec['xscale'])
+    ax.set_yscale(spec['yscale'])
+    ax.set_xlim(*spec['xlim'])
+    ax.set_ylim(*spec['ylim'])
+    ax.set_xlabel(spec['xlabel'], fontsize=15, fontweight='bold')
+    ax.set_ylabel(spec['ylabel'], fontsize=15, fontweight='bold')
+    ax.tick_params(axis='both', which='both', direction='in', top=True, right=True)
+
+
+def simplify_polyline(points, tolerance):
+    """
+    Simplification de Ramer-Douglas-Peucker d'une polyligne.
+
+    Paramètres :
+        points : np.ndarray (n, 2), coordonnées finies (ex : coordonnées d'affichage en pixels)
+        tolerance : écart maximal toléré entre la courbe d'origine et la courbe simplifiée (mêmes unités)
+    Retour :
+        indices (croissants) des points conservés ; le premier et le dernier point sont toujours conservés
+    """
+    n = len(points)
+    if n < 3 or tolerance <= 0:
+        return np.arange(n)
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        i, j = stack.pop()
+        if j <= i + 1:
+            continue
+        a, b, inner = points[i], points[j], points[i + 1:j]
+        dx, dy = b - a
+        norm = math.hypot(dx, dy)
+        if norm == 0:
+            dist = np.hypot(inner[:, 0] - a[0], inner[:, 1] - a[1])
+        else:
+            # Distance de chaque point intermédiaire à la droite (a, b), calcul vectorisé
+            dist = np.abs(dx * (inner[:, 1] - a[1]) - dy * (inner[:, 0] - a[0])) / norm
+        k = int(np.argmax(dist))
+        if dist[k] > tolerance:
+            m = i + 1 + k
+            keep[m] = True
+            stack.append((i, m))
+            stack.append((m, j))
+    return np.flatnonzero(keep)
+
+
+def prepare_export_figure(fig, tolerance_pt=None, rasterize=False):
+    """
+    Prépare une figure (bornes et mise en page déjà fixées) pour un export publication :
+    - simplifie chaque courbe (Ramer-Douglas-Peucker) en coordonnées d'affichage, avec une tolérance
+      en points typographiques (1/72 pouce) : l'écart n'est pas visible à l'impression
+    - rastérise éventuellement les courbes seulement (textes, axes et légende restent vectoriels en PDF/SVG)
+    Les points non finis (ex : x_DP = 0 en échelle log) coupent la courbe : un seul est conservé par coupure.
+
+    Retour :
+        (n_before, n_after) : nombre total de points avant et après simplification
+    """
+    n_before = n_after = 0
+    tolerance_px = (tolerance_pt or 0) * fig.dpi / 72.0
+    for ax in fig.axes:
+        for line in ax.get_lines():
+            x, y = (np.asarray(v, dtype=float) for v in line.get_data())
+            n_before += x.size
+            if tolerance_px > 0 and x.size > 2:
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    xy = line.get_transform().transform(np.column_stack([x, y]))
+                finite = np.isfinite(xy).all(axis=1)
+                runs = np.split(np.arange(x.size), np.flatnonzero(np.diff(finite.astype(np.int8))) + 1)
+                idx = np.concatenate([run[simplify_polyline(xy[run], tolerance_px)] if finite[run[0]] else run[:1]
+                                      for run in runs])
+                x, y = x[idx], y[idx]
+                line.set_data(x, y)
+            n_after += x.size
+            if rasterize:
+                line.set_rasterized(True)
+    return n_before, n_after
+
+
+def save_figure(fig, savepath, dpi=300):
+    """
+    Enregistre une figure et mesure le rendu.
+
+    Retour :
+        dict {'path', 'size' (octets), 'seconds' (temps de rendu et d'écriture)}
+    """
+    start = time.perf_counter()
+    fig.savefig(savepath, dpi=dpi)
+    return {'path': savepath, 'size': os.path.getsize(savepath), 'seconds': time.perf_counter() - start}
+
+
+def file_fingerprints(paths):
+    """
+    Empreinte de chaque fichier : (date de modification en ns, taille), ou None si le fichier est absent
+    (son apparition change alors l'empreinte).
+    """
+    fingerprints = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+            fingerprints.append((st.st_mtime_ns, st.st_size))
+        except OSError:
+            fingerprints.append(None)
+    return fingerprints
+
+
+def format_size(n_bytes):
+    """
+    Taille de fichier lisible (o, Ko, Mo, Go).
+    """
+    for unit in ("o", "Ko", "Mo"):
+        if n_bytes < 1024:
+            return f"{n_bytes:.0f} {unit}" if unit == "o" else f"{n_bytes:.1f} {unit}"
+        n_bytes /= 1024.0
+    return f"{n_bytes:.1f} Go"
+
+
+VECTOR_FORMATS = ("pdf", "svg", "svgz", "eps", "ps")
+
+
+def _build_export_figure(spec):
+    """
+    Construit (sans pyplot, donc utilisable dans un processus fils) la figure complète d'un export :
+    axes, titre, courbes et légende (voir Plotter.get_export_spec).
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    fig = Figure(figsize=spec['figsize'])
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    apply_axes_spec(ax, spec)
+    ax.text(0.03, 0.2, spec['title'], fontsize=14, fontweight='bold', ha='center')
+    for (x, y), label, color, style in zip(spec['curves'], spec['labels'], spec['colors'], spec['styles']):
+        ax.plot(x, y, label=label, color=color, linestyle=style, linewidth=2)
+    ax.legend(loc='center left', bbox_to_anchor=(1.02, 0.5), fontsize=12, frameon=True)
+    fig.tight_layout()
+    return fig
+
+
+def _save_export_targets(spec, targets, tolerance=None, rasterize=False):
+    """
+    Construit la figure d'export une seule fois, puis l'enregistre pour chaque cible (chemin, dpi).
+    Utilisable dans un processus fils.
+
+    Retour :
+        liste des résultats de save_figure, complétés par 'points' (avant, après simplification)
+    """
+    fig = _build_export_figure(spec)
+    points = prepare_export_figure(fig, tolerance, rasterize)
+    return [dict(save_figure(fig, path, dpi=dpi), points=points) for path, dpi in targets]
+
+
+def _build_animation_figure(spec):
+    """
+    Construit (sans pyplot, donc utilisable dans un processus fils) la figure réutilisée pour toutes
+    les images d'une animation : axes, courbes vides, titre et légende.
+
+    Retour :
+        fig, lines, title : figure Agg, liste des Line2D (une par courbe), Text du titre
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    fig = Figure(figsize=spec['figsize'], dpi=spec['dpi'])
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    apply_axes_spec(ax, spec)
+    lines = [
+        ax.plot([], [], label=label, color=color, linestyle=style, linewidth=2)[0]
+        for label, color, style in zip(spec['labels'], spec['colors'], spec['styles'])
+    ]
+    title = ax.text(0.03, 0.2, "", fontsize=14, fontweight='bold', ha='center')
+    ax.legend(loc='center left', bbox_to_anchor=(1.02, 0.5), fontsize=12, frameon=True)
+    fig.tight_layout()
+    return fig, lines, title
+
+
+def _set_animation_frame(lines, title, frame):
+    """
+    Met à jour les courbes existantes (set_data) et le titre pour une image ; retourne les artistes modifiés.
+
+    frame : tuple (curves, text) avec curves la liste des (x, y) de chaque courbe
+    """
+    curves, text = frame
+    for line, (x, y) in zip(lines, curves):
+        line.set_data(x, y)
+    title.set_text(text)
+    return lines + [title]
+
+
+def _render_animation_frames(spec, frames):
+    """
+    Rend une suite d'images dans un processus fils, en réutilisant une seule figure.
+
+    Retour :
+        (width, height), images : taille en pixels et liste des images RGBA brutes (bytes)
+    """
+    fig, lines, title = _build_animation_figure(spec)
+    images = []
+    for frame in frames:
+        _set_animation_frame(lines, title, frame)
+        fig.canvas.draw()
+        images.append(bytes(fig.canvas.buffer_rgba()))
+    return fig.canvas.get_width_height(), images
+
+
+
+def _ordered_results(pool, func, spec, chunks, window):
+    """
+    Résultats de func(spec, chunk) pour chaque bloc, dans l'ordre, avec au plus window blocs soumis au pool
+    et non encore consommés (contrairement à pool.map, qui soumet tout d'un coup).
+    """
+    pending = deque()
+    for chunk in chunks:
+        pending.append(pool.submit(func, spec, chunk))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _encode_with_ffmpeg(ffmpeg, results, savepath, fps):
+    """
+    Envoie des blocs d'images RGBA brutes ((width, height), images) à ffmpeg, qui écrit savepath (MP4 ou GIF).
+
+    Exception :
+        RuntimeError si ffmpeg s'arrête en erreur (y compris en cours d'écriture), avec son message d'erreur
+    """
+    if savepath.lower().endswith(".gif"):
+        # Une palette par image : l'encodage reste en flux (pas de palette globale calculée sur toute la vidéo)
+        output = ["-vf", "split[a][b];[a]palettegen=stats_mode=single[p];[b][p]paletteuse=new=1"]
+    else:
+        output = ["-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2", "-pix_fmt", "yuv420p"]
+    proc = None
+    with tempfile.TemporaryFile() as errors:
+        try:
+            for (w, h), chunk in results:
+                if proc is None:
+                    proc = subprocess.Popen(
+                        [ffmpeg, "-y", "-loglevel", "error", "-f", "rawvideo", "-pix_fmt", "rgba",
+                         "-s", f"{w}x{h}", "-r", str(fps), "-i", "-"] + output + [savepath],
+                        stdin=subprocess.PIPE, stderr=errors)
+                for rgba in chunk:
+                    proc.stdin.write(rgba)
+        except BrokenPipeError:
+            pass  # ffmpeg s'est arrêté : son code de retour et son message sont traités ci-dessous
+        finally:
+            if proc is not None:
+                try:
+                    proc.stdin.close()
+                except BrokenPipeError:
+                    pass
+                proc.wait()
+        if proc is not None and proc.returncode != 0:
+            errors.seek(0)
+            message = errors.read().decode(errors='replace').strip()
+            raise RuntimeError(f"Échec de l'encodage ffmpeg ({savepath}, code {proc.returncode}) : {message}")
+
 class Plotter:
     def __init__(self, app):
         """
@@ -22,13 +311,30 @@ class Plotter:
         """
         self.app = app
         self.debug = False  # Mettre à True pour activer les prints de debug
+        self.temp_manager = None  # DataManager multi-températures (réutilisé tant que les fichiers sont inchangés)
+        self.temp_labels = []
+        self._temp_key = None
+        self._step = None         # État du mode défilement (figure, courbes, index courant)
+        self._lines = {}          # fichier -> courbe de la dernière figure interactive
+        self._live = None         # Figure suivie en mode suivi (watch)
+        self.watcher = None
+        self.inspector = None     # Inspecteur au survol de la dernière figure interactive
+        self._regime_artist = None  # Droites des régimes de Brouwer superposées à la figure interactive
+        self._axis_manager = None   # DataManager du fichier de référence pour la bascule x <-> mu (index inverses)
+        self._axis_key = None
+        self.render_worker = RenderWorker() if config.USE_RENDER_WORKER else None  # Rendu hors interface
+        self.image_cache = ImageCache(config.IMAGE_CACHE_DIR, config.IMAGE_CACHE_MAX_MB * 1024 ** 2)
 
-    def get_plot_limits_and_scales(self, xaxis_type='x'):
+    def get_plot_limits_and_scales(self, xaxis_type='x', files=None):
         """
         Récupère et vérifie les bornes et échelles des axes depuis l'UI utilisateur.
+        Si l'option « bornes automatiques » est cochée, les bornes couvrent toutes les courbes tracées
+        (voir get_auto_limits) ; les bornes de l'UI ne servent que si elles ne peuvent pas être déterminées.
 
         xaxis_type : str
             'x' pour tracer en fonction de x_*, 'mu' pour mu_*
+        files : list of str, optionnel
+            Fichiers tracés, pour les bornes automatiques (None = sélection courante)
         Retour :
             xmin, xmax, ymin, ymax, xscale, yscale : valeurs prêtes à passer à matplotlib
         """
@@ -49,8 +355,105 @@ class Plotter:
         ymin = safe_float(self.app.ymin.get(), 1e-12)
         ymax = safe_float(self.app.ymax.get(), 1)
         yscale = self.app.yscale.get() if self.app.yscale.get() in ("linear", "log") else "log"
+        auto = getattr(self.app, 'auto_limits', None)
+        if auto is not None and auto.get():
+            limits = self.get_auto_limits(files, xscale, yscale)
+            xmin, xmax, ymin, ymax = [a if a is not None else m for a, m in zip(limits, (xmin, xmax, ymin, ymax))]
         return xmin, xmax, ymin, ymax, xscale, yscale
 
+    def get_auto_limits(self, files=None, xscale="linear", yscale="log"):
+        """
+        Calcule les bornes couvrant toutes les courbes sélectionnées, par union des statistiques
+        par fichier du cache (data_loader.file_stats) : coût proportionnel au nombre de courbes,
+        sans parcourir les données. En échelle log, la borne basse est la plus petite valeur positive.
+
+        files : list of str, optionnel
+            Fichiers tracés (None = sélection courante) ; les fichiers absents ou vides sont ignorés
+        Retour :
+            xmin, xmax, ymin, ymax : None pour une borne impossible à déterminer
+        """
+        if files is None:
+            files = [fname for fname, _ in self.app.logic.generate_file_list_and_labels()]
+        x_col, y_col = self.get_xcol_ycol(None)[:2]
+        stats = []
+        for fname in dict.fromkeys(files):
+            try:
+                s = file_stats(fname)
+            except (OSError, ValueError):
+                continue
+            if s is not None and s['min'].size > max(x_col, y_col):
+                stats.append(s)
+        if not stats:
+            return None, None, None, None
+        # Tableaux (n_courbes, 2) : colonnes x et y de chaque fichier
+        bounds = {key: np.array([s[key][[x_col, y_col]] for s in stats]) for key in ('min', 'max', 'posmin')}
+        xmin = bounds['posmin' if xscale == "log" else 'min'][:, 0].min()
+        ymin = bounds['posmin' if yscale == "log" else 'min'][:, 1].min()
+        xmax, ymax = bounds['max'].max(axis=0)
+        return tuple(float(v) if np.isfinite(v) else None for v in (xmin, xmax, ymin, ymax))
+
+    def get_top_k(self):
+        """
+        Réglages du mode « K défauts les plus concentrés » saisis dans l'interface.
+
+        Retour :
+            (k, at) : k = 0 si le mode est désactivé (champ vide ou invalide) ; at = abscisse de classement,
+            ou None pour classer sur le maximum dans l'intervalle [xmin, xmax] affiché
+        """
+        top_k = getattr(self.app, 'top_k', None)
+        try:
+            k = max(0, int(top_k.get())) if top_k is not None else 0
+        except (ValueError, TypeError):
+            k = 0
+        try:
+            at = float(self.app.top_k_at.get())
+        except (AttributeError, ValueError, TypeError):
+            at = None
+        return k, at
+
+    def get_file_labels(self):
+        """
+        Liste (fichier, label) des courbes à tracer : sélection atomes/sites de l'interface, ou en mode top-K
+        les K défauts les plus concentrés parmi tous les défauts (DefectLogic.top_k_file_labels), classés
+        sur le maximum de la colonne y dans l'intervalle affiché ou sur sa valeur au point choisi.
+        """
+        logic = self.app.logic
+        k, at = self.get_top_k()
+        if not k:
+            return logic.generate_file_list_and_labels()
+        self.use_archive(self.app.system_name.get())
+        file_labels = logic.generate_file_list_and_labels(use_selection=False)
+        x_label = self.app.xaxis_choice_var.get()
+        xmin, xmax = self.get_plot_limits_and_scales(x_label, [f for f, _ in file_labels])[:2]
+        return logic.top_k_file_labels(file_labels, k, x_label, self.app.yaxis_choice_var.get(), xmin, xmax, at)
+
+    def prune_files(self, file_labels, x_col, y_col, xaxis_type):
+        """
+        Élagage des défauts invisibles (option « Ignorer les défauts hors fenêtre ») : un fichier dont le maximum
+        de la colonne y sur l'intervalle [xmin, xmax] est inférieur à ymin n'est ni lu ni tracé. Le maximum est
+        majoré par les cartes de zones de data_loader (index de métadonnées), sans lire les données du fichier.
+        Les fichiers absents ou illisibles sont conservés (signalés ensuite comme manquants).
+
+        Retour :
+            kept, pruned : listes de (fichier, label) à tracer et de fichiers ignorés
+        """
+        prune = getattr(self.app, 'prune_invisible', None)
+        if prune is None or not prune.get() or not file_labels:
+            return list(file_labels), []
+        xmin, xmax, ymin = self.get_plot_limits_and_scales(xaxis_type, [f for f, _ in file_labels])[:3]
+        maps = zone_maps([fname for fname, _ in file_labels])
+        kept, pruned = [], []
+        for fname, label in file_labels:
+            zmap = maps.get(fname)
+            if zmap is not None and zmap['max'].shape[1] > max(x_col, y_col) \
+                    and zone_max(zmap, x_col, y_col, xmin, xmax) < ymin:
+                pruned.append(fname)
+            else:
+                kept.append((fname, label))
+        if self.debug:
+            print(f"[DEBUG] Défauts ignorés (max < {ymin} sur [{xmin}, {xmax}]) : {pruned}")
+        return kept, pruned
+
     def get_xcol_ycol(self, fname):
         """
         Retourne les indices de colonnes sélectionnées via l'interface utilisateur.
@@ -67,22 +470,95 @@ class Plotter:
         x_label = self.app.xaxis_choice_var.get()
         y_label = self.app.yaxis_choice_var.get()
         all_colnames = self.app.all_colnames  # Liste des noms de colonnes (UI)
-        if x_label not in all_colnames or y_label not in all_colnames:
+        col_index = self.app.col_index        # Nom de colonne -> indice (calculé avec all_colnames)
+        x_col = col_index.get(x_label)
+        y_col = col_index.get(y_label)
+        if x_col is None or y_col is None:
             raise ValueError(f"Colonne inconnue: {x_label} ou {y_label}. Vérifiez les atomes définis.")
-        x_col = all_colnames.index(x_label)
-        y_col = all_colnames.index(y_label)
         return x_col, y_col, x_label, all_colnames
 
-    def generate_plot(self):
+    def use_archive(self, base):
+        """
+        Si une archive du système existe (data_loader.pack_system), alimente le cache partagé avec
+        son contenu à jour : les fichiers correspondants ne sont alors plus ouverts un par un.
+        """
+        archive = base + config.ARCHIVE_EXTENSION
+        if not os.path.isfile(archive):
+            return
+        try:
+            stale = load_from_archive(archive)
+        except (OSError, ValueError) as e:
+            print(f"[INFO] Archive ignorée ({archive}) : {e}")
+            return
+        if stale and self.debug:
+            print(f"[DEBUG] Fichiers modifiés ou supprimés depuis l'archivage (non repris) : {stale}")
+
+    def get_xlabel(self):
+        """
+        Retourne le libellé de l'abscisse selon la colonne choisie (fraction x_* ou potentiel chimique mu_*).
+        """
+        absc_label = self.app.xaxis_choice.get()
+        if absc_label.startswith("x_"):
+            at_name = absc_label[2:]
+            return f"Fraction {at_name}" if self.app.language == "fr" else f"Fraction {at_name}"
+        if absc_label.startswith("mu_"):
+            at_name = absc_label[3:]
+            return fr"$\mu_{{{at_name}}}$ (eV)"
+        return absc_label
+
+    def get_full_title(self, temperature=None):
+        """
+        Construit le titre automatique : nom du système, atomes ajoutés et température.
+
+        temperature : str, optionnel
+            Température à afficher (None = valeur du champ température de l'interface)
+        """
+        base_title = self.app.title_text.get().strip() or config.DEFAULT_TITLE
+        if temperature is None:
+            temperature = self.app.temperature.get().strip()
+        added_atoms = [e.get().strip() for e in self.app.added_atom_entries if e.get().strip()]
+        added_atoms_str = ""
+        if self.app.show_added_atoms.get() and added_atoms:
+            added_atoms_str = " + " + " + ".join(added_atoms)
+        if self.app.language == "fr":
+            return f"{base_title}{added_atoms_str} à {temperature}K"
+        return f"{base_title}{added_atoms_str} at {temperature}K"
+
+    def get_plot_spec(self, xaxis_type, files=None):
+        """
+        Rassemble dans un dictionnaire picklable les réglages d'axes choisis dans l'interface
+        (bornes, échelles, libellés), pour tracer sans accès à l'interface (ex : processus fils).
+        files : fichiers tracés, pour les bornes automatiques (None = sélection courante).
+        """
+        xmin, xmax, ymin, ymax, xscale, yscale = self.get_plot_limits_and_scales(xaxis_type, files)
+        return {
+            'xlim': (xmin, xmax), 'ylim': (ymin, ymax),
+            'xscale': xscale, 'yscale': yscale,
+            'xlabel': self.get_xlabel(), 'ylabel': self.app.tr('ylabel_defects'),
+        }
+
+    def format_axes(self, ax, xaxis_type, files=None):
+        """
+        Applique à un axe matplotlib la grille, les bornes, les échelles et les libellés choisis dans l'interface.
+        """
+        apply_axes_spec(ax, self.get_plot_spec(xaxis_type, files))
+
+    def generate_plot(self, watch=False):
         """
         Gère l'affichage interactif du graphique :
         - Récupère la liste de fichiers/labels à tracer
         - Récupère le choix utilisateur pour les axes
         - Lit les données (x, y) à tracer pour chaque courbe
         - Met en forme la figure, affiche la légende, gère les erreurs et l'aperçu
+
+        watch : bool
+            Mode suivi : les fichiers encore absents ne bloquent pas le tracé, et les fichiers sont
+            surveillés pendant qu'ADPI écrit (lignes ajoutées, nouveaux fichiers) pour mettre à jour
+            les courbes de la figure sans tout relire (voir start_watch).
         """
-        logic = self.app.logic
-        file_labels = logic.generate_file_list_and_labels()
+        self.stop_watch()
+        file_labels = self.get_file_labels()
+        self.use_archive(self.app.system_name.get())
         premier_fichier = file_labels[0][0] if file_labels else None
         if premier_fichier:
             # Met à jour dynamiquement la liste des axes si besoin
@@ -92,50 +568,32 @@ class Plotter:
         styles = iter(config.STYLES * 50)
 
         plt.figure(figsize=(13, 8))
-        plt.grid(color="#C0C0C0")
 
         # Détermine la nature de l'abscisse pour le scaling
         ref_fname = file_labels[0][0] if file_labels else None
         x_col, y_col, xaxis_type, all_names = self.get_xcol_ycol(ref_fname)
-
-        xmin, xmax, ymin, ymax, xscale, yscale = self.get_plot_limits_and_scales(xaxis_type)
-        plt.xscale(xscale)
-        plt.yscale(yscale)
-        plt.xlim(xmin, xmax)
-        plt.ylim(ymin, ymax)
-
-        # Labels axes
-        absc_label = self.app.xaxis_choice.get()
-        if absc_label.startswith("x_"):
-            at_name = absc_label[2:]
-            xlabel = f"Fraction {at_name}" if self.app.language == "fr" else f"Fraction {at_name}"
-        elif absc_label.startswith("mu_"):
-            at_name = absc_label[3:]
-            xlabel = fr"$\mu_{{{at_name}}}$ (eV)"
-        else:
-            xlabel = absc_label
-        plt.xlabel(xlabel, fontsize=15, fontweight='bold')
-        plt.ylabel(self.app.tr('ylabel_defects'), fontsize=15, fontweight='bold')
-        plt.tick_params(axis='both', which='both', direction='in', top=True, right=True)
+        self.format_axes(plt.gca(), xaxis_type)
 
         # Titre automatique
-        base_title = self.app.title_text.get().strip() or config.DEFAULT_TITLE
-        temperature = self.app.temperature.get().strip()
-        added_atoms = [e.get().strip() for e in self.app.added_atom_entries if e.get().strip()]
-        added_atoms_str = ""
-        if self.app.show_added_atoms.get() and added_atoms:
-            added_atoms_str = " + " + " + ".join(added_atoms)
-        full_title = f"{base_title}{added_atoms_str} à {temperature}K" if self.app.language == "fr" else f"{base_title}{added_atoms_str} at {temperature}K"
-        plt.text(0.03, 0.2, full_title, fontsize=14, fontweight='bold', ha='center')
+        plt.text(0.03, 0.2, self.get_full_title(), fontsize=14, fontweight='bold', ha='center')
 
         # Aperçu des fichiers lus dans la fenêtre application
         self.app.preview_text.config(state='normal')
         self.app.preview_text.delete(1.0, 'end')
+        if self.get_top_k()[0]:
+            self.app.preview_text.insert('end', self.app.tr('top_k_selected').format(k=len(file_labels)) + "\n")
         found_data = False
         missing_files = []
+        self._lines = {}
+        # En mode suivi, les courbes peuvent encore entrer dans la fenêtre : pas d'élagage
+        visible, pruned = self.prune_files(file_labels, x_col, y_col, xaxis_type) if not watch else (file_labels, [])
+        visible = set(visible)
 
         print("[DEBUG] file_labels dans plotter =", file_labels)
         for fname, label in file_labels:
+            if (fname, label) not in visible:
+                next(colors), next(styles)  # Couleurs inchangées pour les courbes tracées
+                continue
             if self.debug:
                 print(f"[DEBUG] Cherche fichier: {fname}")
                 print(f"[DEBUG] Présent ? {os.path.exists(fname)}")
@@ -152,14 +610,18 @@ class Plotter:
             style = next(styles)
             if x is not None and y is not None and len(x) > 0 and len(y) > 0:
                 found_data = True
-                plt.plot(x, y, label=label, color=color, linestyle=style, linewidth=2)
+                self._lines[fname] = plt.plot(x, y, label=label, color=color, linestyle=style, linewidth=2)[0]
             else:
                 missing_files.append(fname)
+        if pruned:
+            self.app.preview_text.insert('end', f"{self.app.tr('pruned_files')} ({len(pruned)})\n")
+            for fname in pruned:
+                self.app.preview_text.insert('end', f"  - {fname}\n")
 
         self.app.preview_text.config(state='disabled')
 
-        # Gestion des fichiers manquants
-        if missing_files:
+        # Gestion des fichiers manquants (en mode suivi, ils seront tracés dès leur apparition)
+        if missing_files and not watch:
             import tkinter.messagebox as mb
             msg = self.app.tr('missing_files') + "\n" + "\n".join(missing_files)
             mb.showerror(self.app.tr('missing_files_title'), msg)
@@ -167,7 +629,7 @@ class Plotter:
             return
 
         # Gestion du cas où aucune donnée n'a pu être tracée
-        if not found_data:
+        if not found_data and not watch:
             import tkinter.messagebox as mb
             mb.showwarning(self.app.tr('no_file_title'), self.app.tr('no_file'))
             plt.close()
@@ -177,10 +639,250 @@ class Plotter:
             print("[DEBUG] file_labels =", file_labels)
             for fname, label in file_labels:
                 print(f"[DEBUG] Fichier {fname} avec label {label}")
-        plt.legend(loc='center left', bbox_to_anchor=(1.02, 0.5), fontsize=12, frameon=True)
+        if found_data:
+            plt.legend(loc='center left', bbox_to_anchor=(1.02, 0.5), fontsize=12, frameon=True)
         plt.tight_layout()
+        if watch:
+            self.start_watch(file_labels, x_col, y_col)
+        self.start_inspector(plt.gca())
+        plt.gcf().canvas.mpl_connect('key_press_event', self._on_axis_key)
         plt.show()
 
+    @staticmethod
+    def partner_axis(label):
+        """
+        Colonne associée à une abscisse : x_H -> mu_H, mu_H -> x_H (None pour une autre colonne).
+        """
+        if label.startswith("x_"):
+            return "mu_" + label[2:]
+        if label.startswith("mu_"):
+            return "x_" + label[3:]
+        return None
+
+    def toggle_xaxis(self):
+        """
+        Bascule l'abscisse de la dernière figure interactive entre la composition x_* et le potentiel chimique mu_*
+        de la même espèce, sans relire les fichiers : les courbes reprennent l'autre colonne des tableaux du cache
+        partagé, et les bornes affichées (ramenées au domaine des données) sont converties par l'index inverse
+        du DataManager de référence (DataManager.convert, index construit une fois, voir _reference_manager).
+        En mode suivi, les mises à jour suivantes utilisent la nouvelle colonne.
+
+        Retour :
+            True si l'abscisse a été basculée
+        """
+        if not self._lines:
+            return False
+        old = self.app.xaxis_choice_var.get()
+        new = self.partner_axis(old)
+        col_index = self.app.col_index
+        if new is None or old not in col_index or new not in col_index:
+            return False
+        old_col, new_col = col_index[old], col_index[new]
+        arrays = load_arrays(list(self._lines))  # Cache partagé : pas de relecture
+        ref = next((f for f, a in arrays.items() if a is not None and a.shape[1] > max(old_col, new_col)), None)
+        if ref is None:
+            return False
+        try:
+            manager = self._reference_manager(ref)
+            key = manager.get_column(0, old)
+        except (OSError, ValueError) as e:
+            print(f"[INFO] Bascule de l'abscisse impossible : {e}")
+            return False
+        ax = next(iter(self._lines.values())).axes
+        # Bornes hors des données (ex : 0 en composition) : ramenées au domaine de la colonne avant conversion
+        bounds = np.clip(sorted(ax.get_xlim()), np.nanmin(key), np.nanmax(key))
+        limits, n_solutions = manager.convert(bounds, old, new)
+        if self.debug and np.any(n_solutions > 1):
+            print(f"[DEBUG] {old} non monotone : bornes converties sur le premier segment")
+        for fname, line in self._lines.items():
+            arr = arrays[fname]
+            if arr is not None and arr.shape[1] > new_col:
+                line.set_xdata(arr[:, new_col])
+        self.app.xaxis_choice_var.set(new)
+        ax.set_xscale("linear" if new.startswith("mu_") else
+                      (self.app.xscale.get() if self.app.xscale.get() in ("linear", "log") else "linear"))
+        ax.set_xlabel(self.get_xlabel())
+        if np.all(np.isfinite(limits)) and limits[0] != limits[1]:
+            ax.set_xlim(sorted(limits))
+        else:
+            ax.relim()
+            ax.autoscale(enable=True, axis='x')
+        if self._live is not None and self._live['ax'] is ax:
+            self._live['x_col'] = new_col  # Mode suivi : lignes ajoutées tracées sur la nouvelle abscisse
+        if self.inspector is not None:
+            self.start_inspector(ax)  # Index du survol reconstruit sur les nouvelles abscisses
+        ax.figure.canvas.draw_idle()
+        return True
+
+    def analyze_slopes(self):
+        """
+        Analyse des régimes de Brouwer de la sélection courante (analysis.brouwer_analysis) : pente de log10(x_DP)
+        en fonction de log10(x_*) ou de mu_* par régime, et points de rupture, pour tous les défauts à la fois.
+        Les pentes et ruptures sont listées dans la zone d'aperçu ; les droites ajustées sont superposées à la
+        figure interactive si elle est ouverte, sinon tracées avec les courbes dans une nouvelle figure.
+
+        Retour :
+            résultat de brouwer_analysis, ou None en cas d'erreur
+        """
+        import tkinter.messagebox as mb
+        x_label = self.app.xaxis_choice_var.get()
+        try:
+            manager, labels = self.load_selection()
+            xmin, xmax = self.get_plot_limits_and_scales(x_label, manager.files)[:2]
+            result = brouwer_analysis(manager, x_label, "x_DP", xmin, xmax)
+        except (OSError, ValueError) as e:
+            mb.showerror(self.app.tr('error_title'), str(e))
+            return None
+        regimes, breaks = result['regimes'], result['breakpoints']
+        to_x = (lambda v: 10.0 ** v) if result['log_x'] else (lambda v: v)
+
+        self.app.preview_text.config(state='normal')
+        self.app.preview_text.insert('end', self.app.tr('slope_report_title').format(
+            x=f"log10({x_label})" if result['log_x'] else x_label) + "\n")
+        for i, label in enumerate(labels):
+            slopes = " | ".join(f"{s:+.2f}" for s in regimes['slope'][regimes['curve'] == i])
+            points = ", ".join(f"{to_x(x):.4g}" for x in breaks['x'][breaks['curve'] == i])
+            self.app.preview_text.insert('end', f"{label} : {slopes or '-'}" + (f" ; {x_label} = {points}" if points
+                                                                              else "") + "\n")
+        self.app.preview_text.config(state='disabled')
+
+        live = bool(self._lines) and plt.fignum_exists(next(iter(self._lines.values())).figure.number)
+        if live:
+            ax = next(iter(self._lines.values())).axes
+            colors = [self._lines[f].get_color() if f in self._lines else 'black' for f in manager.files]
+        else:
+            plt.figure(figsize=(13, 8))
+            ax = plt.gca()
+            self.format_axes(ax, x_label, manager.files)
+            colors = [c for c, _ in zip(config.COLORS * 20, labels)]
+            for i, label in enumerate(labels):
+                ax.plot(manager.get_column(i, x_label), manager.get_column(i, "x_DP"), label=label,
+                        color=colors[i], linewidth=1)
+            ax.legend(loc='center left', bbox_to_anchor=(1.02, 0.5), fontsize=12, frameon=True)
+        self.overlay_regimes(ax, result, colors)
+        if not live:
+            plt.tight_layout()
+            plt.show()
+        return result
+
+    def overlay_regimes(self, ax, result, colors):
+        """
+        Superpose à l'axe ax les droites ajustées de chaque régime (une seule LineCollection pour toutes les courbes),
+        en pointillés de la couleur de la courbe ; remplace la superposition précédente.
+        """
+        from matplotlib.collections import LineCollection
+        if self._regime_artist is not None:
+            try:
+                self._regime_artist.remove()
+            except ValueError:
+                pass  # Figure fermée depuis
+            self._regime_artist = None
+        regimes = result['regimes']
+        if regimes['curve'].size == 0:
+            return
+        # 20 points par régime : droite en log-log, courbe si l'axe des x est linéaire
+        t = np.linspace(0.0, 1.0, 20)
+        xs = regimes['xstart'][:, None] + t * (regimes['xstop'] - regimes['xstart'])[:, None]
+        ys = 10.0 ** (regimes['slope'][:, None] * xs + regimes['intercept'][:, None])
+        if result['log_x']:
+            xs = 10.0 ** xs
+        segments = np.stack([xs, ys], axis=-1)
+        self._regime_artist = LineCollection(segments, colors=[colors[c] for c in regimes['curve']],
+                                             linestyles='dotted', linewidths=2.5, zorder=5)
+        ax.add_collection(self._regime_artist)
+        ax.figure.canvas.draw_idle()
+
+    def _reference_manager(self, fname):
+        """
+        DataManager contenant le seul fichier de référence de la figure (le bloc mu/x est commun à toutes les courbes),
+        conservé tant que le fichier (date, taille) et les atomes sont inchangés : ses index inverses
+        (DataManager.inverse_index) ne sont construits qu'une fois par couple de colonnes.
+        """
+        network_atoms, added_atoms = self.app.logic.get_active_atoms_sites()[:2]
+        st = os.stat(fname)
+        key = (fname, st.st_mtime_ns, st.st_size, tuple(network_atoms + added_atoms))
+        if key != self._axis_key:
+            manager = DataManager()
+            manager.load_data(network_atoms + added_atoms, [fname])
+            self._axis_manager, self._axis_key = manager, key
+        return self._axis_manager
+
+    def _on_axis_key(self, event):
+        """
+        Callback clavier de la figure interactive : touche m pour basculer l'abscisse x_* <-> mu_*.
+        """
+        if event.key == 'm':
+            self.toggle_xaxis()
+
+    def start_inspector(self, ax):
+        """
+        Si l'option « inspecteur au survol » est cochée, affiche dans une fenêtre Tk les valeurs de toutes
+        les courbes de ax au point survolé (voir inspector.HoverInspector).
+        """
+        if self.inspector is not None:
+            self.inspector.disconnect()
+            self.inspector = None
+        hover = getattr(self.app, 'hover_inspector', None)
+        if hover is None or not hover.get():
+            return
+        self.inspector = HoverInspector(self.app.root, ax, title=self.app.tr('inspector_title'))
+        self.inspector.connect()
+
+    def start_watch(self, file_labels, x_col, y_col):
+        """
+        Surveille les fichiers de la figure courante (watcher.DataWatcher) : les lignes ajoutées sont lues
+        à partir du dernier offset connu et ajoutées aux tableaux en mémoire, puis les courbes existantes
+        sont mises à jour (set_data) et les nouveaux fichiers ajoutés à la figure.
+        La surveillance s'arrête à la fermeture de la figure.
+        """
+        self.stop_watch()
+        fig = plt.gcf()
+        self._live = {
+            'fig': fig, 'ax': plt.gca(), 'x_col': x_col, 'y_col': y_col,
+            'order': [fname for fname, _ in file_labels], 'labels': dict(file_labels),
+        }
+        self.watcher = DataWatcher(self.app.root, self._live['order'], self._on_data_change)
+        self.watcher.start()
+        fig.canvas.mpl_connect('close_event', lambda event: self.stop_watch())
+
+    def stop_watch(self):
+        """
+        Arrête la surveillance des fichiers, si elle est active.
+        """
+        if self.watcher is not None:
+            self.watcher.stop()
+            self.watcher = None
+
+    def _on_data_change(self, appended, created):
+        """
+        Callback du DataWatcher : met à jour la figure suivie avec les données déjà en mémoire (cache partagé).
+        """
+        live = self._live
+        ax = live['ax']
+        new_lines = changed = False
+        self.app.preview_text.config(state='normal')
+        for fname in appended + created:
+            x, y = read_data(fname, x_col=live['x_col'], y_col=live['y_col'])
+            if x is None or len(x) == 0:
+                continue
+            line = self._lines.get(fname)
+            if line is None:
+                i = live['order'].index(fname)
+                line = ax.plot(x, y, label=live['labels'][fname], color=config.COLORS[i % len(config.COLORS)],
+                               linestyle=config.STYLES[i % len(config.STYLES)], linewidth=2)[0]
+                self._lines[fname] = line
+                new_lines = True
+            else:
+                line.set_data(x, y)
+            changed = True
+            self.app.preview_text.insert('end', f"[+] {fname} ({len(x)})\n")
+        self.app.preview_text.config(state='disabled')
+        if new_lines:
+            ax.legend(loc='center left', bbox_to_anchor=(1.02, 0.5), fontsize=12, frameon=True)
+        if changed and self.inspector is not None and self.inspector.ax is ax:
+            self.inspector.rebuild()  # Index du survol à jour avec les lignes ajoutées et les nouvelles courbes
+        live['fig'].canvas.draw_idle()
+
     def save_plot_dialog(self):
         """
         Boîte de dialogue pour sauvegarder le plot affiché (PNG, JPG, PDF).
@@ -188,73 +890,701 @@ class Plotter:
         """
         from tkinter import filedialog, messagebox
         fmt = filedialog.asksaveasfilename(defaultextension=".png",
-                                           filetypes=[("PNG", "*.png"), ("JPG", "*.jpg"), ("PDF", "*.pdf")],
+                                           filetypes=[("PNG", "*.png"), ("JPG", "*.jpg"), ("PDF", "*.pdf"),
+                                                      ("SVG", "*.svg")],
                                            title=self.app.tr('save_dialog_title'),
                                            initialfile=self.app.output_basename.get())
         if fmt:
             ext = fmt.split('.')[-1]
-            if ext in ["png", "jpg", "pdf"]:
-                self._save_plot(fmt)
-                messagebox.showinfo(self.app.tr('save_success_title'), f"{self.app.tr('save_success_msg')} {fmt}")
+            if ext in ["png", "jpg", "pdf", "svg"]:
+                tolerance, rasterize = self.get_export_options()
+                result = self._save_plot(fmt, tolerance, rasterize)
+                if result is None:
+                    messagebox.showwarning(self.app.tr('no_file_title'), self.app.tr('no_file'))
+                    return
+                messagebox.showinfo(self.app.tr('save_success_title'),
+                                    f"{self.app.tr('save_success_msg')} {fmt}\n{self.format_export_report(result)}")
             else:
                 messagebox.showerror(self.app.tr('error_title'), self.app.tr('unsupported_format'))
 
-    def _save_plot(self, savepath):
+    def get_export_options(self):
+        """
+        Options d'export publication choisies dans l'interface.
+
+        Retour :
+            tolerance, rasterize : tolérance de simplification des courbes en points (None = pas de simplification),
+                                   rastérisation des courbes (textes et axes restent vectoriels)
+        """
+        tolerance = getattr(self.app, 'export_simplify', None)
+        try:
+            tolerance = float(tolerance.get()) if tolerance is not None else None
+        except ValueError:
+            tolerance = None
+        if tolerance is not None and tolerance <= 0:
+            tolerance = None
+        rasterize = getattr(self.app, 'export_rasterize', None)
+        return tolerance, bool(rasterize.get()) if rasterize is not None else False
+
+    def format_export_report(self, result):
+        """
+        Résumé d'un export (voir save_figure) : taille du fichier, temps de rendu, points tracés.
+        """
+        return self.app.tr('export_report').format(size=format_size(result['size']), seconds=result['seconds'],
+                                                   after=result['points'][1], before=result['points'][0])
+
+    def _save_plot(self, savepath, tolerance=None, rasterize=False):
         """
         Génère le plot et le sauvegarde à l'emplacement désigné.
         (quasiment identique à generate_plot mais sans interaction UI)
+
+        tolerance : float, optionnel
+            Tolérance (en points) de simplification des courbes, voir prepare_export_figure
+        rasterize : bool
+            Rastérise les courbes (utile en PDF/SVG pour les balayages denses)
+        Retour :
+            dict {'path', 'size', 'seconds', 'points'} (voir save_figure), ou None si aucune donnée
         """
-        logic = self.app.logic
-        file_labels = logic.generate_file_list_and_labels()
-        colors = iter(config.COLORS * 20)
-        styles = iter(config.STYLES * 50)
+        spec = self.get_export_spec()
+        if spec is None:
+            return None
+        result = None
+        if self.render_worker is not None:
+            try:
+                result = self.render_worker.render(spec, savepath=savepath, dpi=300,
+                                                   tolerance=tolerance, rasterize=rasterize)
+            except RuntimeError as e:
+                print(f"[INFO] Rendu dans le processus principal ({e})")
+        if result is None:
+            result = _save_export_targets(spec, [(savepath, 300)], tolerance, rasterize)[0]
+        points = result['points']
+        print(f"[INFO] {savepath} : {format_size(result['size'])}, rendu en {result['seconds']:.2f} s, "
+              f"{points[1]}/{points[0]} points")
+        return result
 
-        plt.figure(figsize=(13, 8))
-        plt.grid(color="#C0C0C0")
+    def render_png(self, dpi=100):
+        """
+        Rend la figure de la sélection courante en PNG (bytes), dans le processus de rendu persistant
+        s'il est activé (config.USE_RENDER_WORKER), sinon dans ce processus.
 
-        ref_fname = file_labels[0][0] if file_labels else None
-        x_col, y_col, xaxis_type, all_names = self.get_xcol_ycol(ref_fname) if ref_fname else (0, 0, 'x', [])
+        Retour :
+            bytes de l'image PNG, ou None si aucune donnée
+        """
+        spec = self.get_export_spec()
+        if spec is None:
+            return None
+        if self.render_worker is not None:
+            try:
+                return self.render_worker.render(spec, fmt="png", dpi=dpi)
+            except RuntimeError as e:
+                print(f"[INFO] Rendu dans le processus principal ({e})")
+        import io
+        buf = io.BytesIO()
+        _build_export_figure(spec).savefig(buf, format="png", dpi=dpi)
+        return buf.getvalue()
 
-        xmin, xmax, ymin, ymax, xscale, yscale = self.get_plot_limits_and_scales(xaxis_type)
-        plt.xscale(xscale)
-        plt.yscale(yscale)
-        plt.xlim(xmin, xmax)
-        plt.ylim(ymin, ymax)
+    def plot_fingerprint(self, dpi=100):
+        """
+        Empreinte (sha1 hexadécimal) de tout ce qui détermine l'image de la sélection courante, sans lire les données :
+        fichiers et labels tracés, axes choisis, bornes saisies, échelles, bornes automatiques, titre, langue,
+        couleurs/styles et résolution, plus la date de modification (ns) et la taille de chaque fichier de données
+        (et de l'archive du système). Toute modification d'un fichier change donc l'empreinte.
+        """
+        app = self.app
+        # En mode top-K, la sélection dépend des données : empreinte de tous les candidats (et de leurs fichiers)
+        top_k = self.get_top_k()
+        file_labels = app.logic.generate_file_list_and_labels(use_selection=not top_k[0])
+        auto = getattr(app, 'auto_limits', None)
+        settings = (
+            tuple(file_labels), app.xaxis_choice_var.get(), app.yaxis_choice_var.get(),
+            app.xmin.get(), app.xmax.get(), app.ymin.get(), app.ymax.get(), app.xscale.get(), app.yscale.get(),
+            auto is not None and auto.get(), self.get_full_title(), app.language,
+            getattr(app, 'prune_invisible', None) is not None and app.prune_invisible.get(),
+            tuple(config.COLORS), tuple(config.STYLES), dpi, top_k,
+        )
+        archive = app.system_name.get() + config.ARCHIVE_EXTENSION
+        data = file_fingerprints([fname for fname, _ in file_labels] + [archive])
+        return hashlib.sha1(repr((settings, data)).encode('utf-8')).hexdigest()
 
-        absc_label = self.app.xaxis_choice.get()
-        if absc_label.startswith("x_"):
-            at_name = absc_label[2:]
-            xlabel = f"Fraction {at_name}" if self.app.language == "fr" else f"Fraction {at_name}"
-        elif absc_label.startswith("mu_"):
-            at_name = absc_label[3:]
-            xlabel = fr"$\mu_{{{at_name}}}$ (eV)"
-        else:
-            xlabel = absc_label
-        plt.xlabel(xlabel, fontsize=15, fontweight='bold')
-        plt.ylabel(self.app.tr('ylabel_defects'), fontsize=15, fontweight='bold')
-        plt.tick_params(axis='both', which='both', direction='in', top=True, right=True)
+    def cached_png(self, dpi=100):
+        """
+        Retourne l'image PNG de la sélection courante : depuis le cache disque si la même configuration
+        (voir plot_fingerprint) a déjà été rendue, sinon rendue par render_png puis mise en cache.
 
-        base_title = self.app.title_text.get().strip() or config.DEFAULT_TITLE
-        temperature = self.app.temperature.get().strip()
-        added_atoms = [e.get().strip() for e in self.app.added_atom_entries if e.get().strip()]
-        added_atoms_str = ""
-        if self.app.show_added_atoms.get() and added_atoms:
-            added_atoms_str = " + " + " + ".join(added_atoms)
-        full_title = f"{base_title}{added_atoms_str} à {temperature}K" if self.app.language == "fr" else f"{base_title}{added_atoms_str} at {temperature}K"
-        plt.text(0.03, 0.2, full_title, fontsize=14, fontweight='bold', ha='center')
+        Retour :
+            bytes de l'image PNG, ou None si aucune donnée
+        """
+        key = self.plot_fingerprint(dpi)
+        data = self.image_cache.get(key)
+        if data is None:
+            data = self.render_png(dpi)
+            if data is not None:
+                self.image_cache.put(key, data)
+        if self.debug:
+            print(f"[DEBUG] Cache d'aperçus : {self.image_cache.hits} trouvés, {self.image_cache.misses} rendus")
+        return data
 
-        found_data = False
+    def show_preview(self, dpi=100):
+        """
+        Affiche l'aperçu PNG de la sélection courante dans une fenêtre Tkinter (instantané si la configuration
+        est déjà en cache) et ajoute l'état du cache dans la zone d'aperçu.
+        """
+        import base64
+        import tkinter as tk
+        data = self.cached_png(dpi)
+        if data is None:
+            import tkinter.messagebox as mb
+            mb.showwarning(self.app.tr('no_file_title'), self.app.tr('no_file'))
+            return
+        stats = self.image_cache.stats()
+        report = self.app.tr('image_cache_report').format(
+            hits=stats['hits'], misses=stats['misses'], entries=stats['entries'], size=format_size(stats['bytes']))
+        self.app.preview_text.config(state='normal')
+        self.app.preview_text.insert('end', report + "\n")
+        self.app.preview_text.config(state='disabled')
+        window = tk.Toplevel(self.app.root)
+        window.title(self.app.tr('preview_title'))
+        image = tk.PhotoImage(master=window, data=base64.b64encode(data))
+        label = tk.Label(window, image=image)
+        label.image = image  # Garde une référence : sinon l'image est libérée par Python
+        label.pack()
+
+    def get_export_spec(self):
+        """
+        Rassemble dans un dictionnaire picklable tout ce qu'il faut pour tracer la sélection courante
+        sans l'interface (réglages d'axes, titre, courbes avec labels, couleurs et styles), voir _build_export_figure.
+
+        Retour :
+            spec (dict), ou None si aucune donnée n'a pu être lue
+        """
+        file_labels = self.get_file_labels()
+        self.use_archive(self.app.system_name.get())
+        colors = iter(config.COLORS * 20)
+        styles = iter(config.STYLES * 50)
+
+        ref_fname = file_labels[0][0] if file_labels else None
+        x_col, y_col, xaxis_type, all_names = self.get_xcol_ycol(ref_fname) if ref_fname else (0, 0, 'x', [])
+        spec = self.get_plot_spec(xaxis_type, [fname for fname, _ in file_labels])
+        spec.update({'figsize': (13, 8), 'title': self.get_full_title(),
+                     'curves': [], 'labels': [], 'colors': [], 'styles': []})
+        visible = set(self.prune_files(file_labels, x_col, y_col, xaxis_type)[0])
         for fname, label in file_labels:
-            x, y = read_data(fname, x_col=x_col, y_col=y_col)
             color = next(colors)
             style = next(styles)
+            if (fname, label) not in visible:
+                continue
+            x, y = read_data(fname, x_col=x_col, y_col=y_col)
             if x is not None and y is not None and len(x) > 0 and len(y) > 0:
-                found_data = True
-                plt.plot(x, y, label=label, color=color, linestyle=style, linewidth=2)
-        if not found_data:
-            plt.close()
+                spec['curves'].append((x, y))
+                spec['labels'].append(label)
+                spec['colors'].append(color)
+                spec['styles'].append(style)
+        return spec if spec['curves'] else None
+
+    def export_batch(self, formats, dpis=(300,), directory=".", tolerance=None, rasterize=False, processes=0):
+        """
+        Exporte la figure de la sélection courante dans plusieurs formats/résolutions en un seul tracé :
+        la figure est construite une fois, puis enregistrée pour chaque cible (savefig).
+        Les fichiers sont nommés d'après output_basename : <nom>.<ext>, ou <nom>_<dpi>dpi.<ext> si plusieurs
+        résolutions sont demandées. Les formats vectoriels (pdf, svg, eps) ne sont écrits qu'une fois,
+        sauf si les courbes sont rastérisées (la résolution compte alors).
+
+        formats : list of str
+            Extensions (ex : ['png', 'pdf', 'svg'])
+        dpis : list of int
+            Résolutions
+        directory : str
+            Dossier de sortie
+        tolerance, rasterize :
+            Options d'export publication (voir prepare_export_figure)
+        processes : int
+            Nombre de processus (0 ou 1 = tout dans ce processus) ; chaque processus construit la figure
+            une seule fois et enregistre sa part des cibles.
+
+        Retour :
+            liste des résultats (voir save_figure, avec 'points'), ou None si aucune donnée
+        Exception :
+            ValueError si un format n'est pas supporté par matplotlib
+        """
+        from matplotlib.backend_bases import FigureCanvasBase
+        supported = FigureCanvasBase.get_supported_filetypes()
+        formats = [fmt.strip().lower().lstrip('.') for fmt in formats if fmt.strip()]
+        unsupported = [fmt for fmt in formats if fmt not in supported]
+        if unsupported:
+            raise ValueError(f"{self.app.tr('unsupported_format')} : {', '.join(unsupported)}")
+        dpis = [int(dpi) for dpi in dpis] or [300]
+        base = os.path.join(directory, self.app.output_basename.get().strip() or "conc_plot")
+        targets = []
+        for fmt in formats:
+            vector = fmt in VECTOR_FORMATS and not rasterize
+            for dpi in dpis[:1] if vector else dpis:
+                suffix = f"_{dpi}dpi" if len(dpis) > 1 and not vector else ""
+                targets.append((f"{base}{suffix}.{fmt}", dpi))
+
+        spec = self.get_export_spec()
+        if spec is None or not targets:
+            return None
+        if processes and processes > 1 and len(targets) > 1:
+            # Répartition des cibles ; chaque processus trace la figure une seule fois
+            chunks = [targets[i::processes] for i in range(min(processes, len(targets)))]
+            with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+                done = {r['path']: r for results in pool.map(_save_export_targets, [spec] * len(chunks), chunks,
+                                                               [tolerance] * len(chunks), [rasterize] * len(chunks))
+                        for r in results}
+            results = [done[path] for path, _ in targets]
+        else:
+            results = _save_export_targets(spec, targets, tolerance, rasterize)
+        for r in results:
+            print(f"[INFO] {r['path']} : {format_size(r['size'])}, rendu en {r['seconds']:.2f} s")
+        return results
+
+    def export_batch_dialog(self):
+        """
+        Boîte de dialogue d'export multi-formats : choix du dossier, formats et résolutions lus dans l'interface
+        (batch_formats, batch_dpis), puis résumé des fichiers écrits.
+        """
+        from tkinter import filedialog, messagebox
+        directory = filedialog.askdirectory(title=self.app.tr('batch_export_dialog_title'))
+        if not directory:
             return
-        plt.legend(loc='center left', bbox_to_anchor=(1.02, 0.5), fontsize=12, frameon=True)
-        plt.tight_layout()
-        plt.savefig(savepath, dpi=300)
-        plt.close()
+        formats = self.app.batch_formats.get().replace(";", ",").split(",")
+        try:
+            dpis = [int(v) for v in self.app.batch_dpis.get().replace(";", ",").split(",") if v.strip()]
+        except ValueError:
+            messagebox.showerror(self.app.tr('error_title'), self.app.tr('invalid_dpi'))
+            return
+        tolerance, rasterize = self.get_export_options()
+        n_targets = len([fmt for fmt in formats if fmt.strip()]) * max(len(dpis), 1)
+        processes = config.BATCH_EXPORT_PROCESSES if n_targets >= config.BATCH_EXPORT_PARALLEL_MIN else 0
+        try:
+            results = self.export_batch(formats, dpis, directory, tolerance, rasterize, processes)
+        except (OSError, ValueError) as e:
+            messagebox.showerror(self.app.tr('error_title'), str(e))
+            return
+        if results is None:
+            messagebox.showwarning(self.app.tr('no_file_title'), self.app.tr('no_file'))
+            return
+        summary = "\n".join(f"{os.path.basename(r['path'])} : {self.format_export_report(r)}" for r in results)
+        messagebox.showinfo(self.app.tr('save_success_title'), f"{self.app.tr('save_success_msg')}\n{summary}")
+
+    def load_temperature_data(self):
+        """
+        Charge en parallèle, dans un seul DataManager, les fichiers de toutes les températures
+        (nom du système contenant le motif config.TEMPERATURE_PLACEHOLDER).
+        Le DataManager est réutilisé sans relecture tant que la liste des fichiers, leur date de modification
+        et leur taille, les atomes (noms des colonnes) et le mode de stockage sont inchangés.
+
+        Retour :
+            manager, labels, missing : DataManager chargé, labels des courbes, fichiers manquants
+        """
+        logic = self.app.logic
+        temp_file_labels = logic.generate_temperature_file_lists()
+        file_lists = {t: [fname for fname, _ in file_labels] for t, file_labels in temp_file_labels}
+        compact = getattr(self.app, 'compact_storage', None)
+        compact = bool(compact.get()) if compact is not None else False
+        network_atoms, added_atoms = logic.get_active_atoms_sites()[:2]
+        key = (compact, tuple(network_atoms + added_atoms)) + tuple(
+            (t, tuple(files), tuple(file_fingerprints(files))) for t, files in file_lists.items())
+        if key == self._temp_key and self.temp_manager is not None:
+            return self.temp_manager, self.temp_labels, []
+
+        manager = DataManager()
+        missing = manager.load_temperatures(network_atoms + added_atoms, file_lists, compact=compact)
+        labels = [label for _, label in temp_file_labels[0][1]] if temp_file_labels else []
+        if not missing:
+            self.temp_manager, self.temp_labels, self._temp_key = manager, labels, key
+        return manager, labels, missing
+
+    def generate_temperature_plot(self, mode="overlay"):
+        """
+        Trace les concentrations pour toutes les températures chargées.
+
+        mode : str
+            'overlay' : toutes les températures sur le même graphique (couleur = défaut, style = température)
+            'facet'   : une vignette par température, axes partagés
+            'step'    : une seule figure dont les courbes sont mises à jour température par température
+                        (flèches gauche/droite, ou step_temperature)
+        """
+        import tkinter.messagebox as mb
+        try:
+            manager, labels, missing = self.load_temperature_data()
+        except ValueError as e:
+            mb.showerror(self.app.tr('error_title'), str(e))
+            return
+
+        self.app.preview_text.config(state='normal')
+        self.app.preview_text.delete(1.0, 'end')
+        for t in manager.temperatures:
+            self.app.preview_text.insert('end', f"[{t} K]\n")
+            for fname in manager.get_files(t):
+                self.app.preview_text.insert('end', f"{fname}\n")
+        self.app.preview_text.config(state='disabled')
+
+        if missing:
+            msg = self.app.tr('missing_files') + "\n" + "\n".join(missing)
+            mb.showerror(self.app.tr('missing_files_title'), msg)
+            return
+        if not labels or not manager.temperatures:
+            mb.showwarning(self.app.tr('no_file_title'), self.app.tr('no_file'))
+            return
+
+        x_label = self.get_xcol_ycol(None)[2]
+        y_label = self.app.yaxis_choice_var.get()
+        if mode == "facet":
+            self._plot_temperature_facets(manager, labels, x_label, y_label)
+        elif mode == "step":
+            self._plot_temperature_steps(manager, labels, x_label, y_label)
+        else:
+            self._plot_temperature_overlay(manager, labels, x_label, y_label)
+        plt.show()
+
+    def _plot_temperature_overlay(self, manager, labels, x_label, y_label):
+        """
+        Superpose toutes les températures : une couleur par défaut, un style de trait par température.
+        """
+        from matplotlib.lines import Line2D
+        fig, ax = plt.subplots(figsize=(13, 8))
+        self.format_axes(ax, x_label, self._temperature_files(manager))
+        for it, t in enumerate(manager.temperatures):
+            style = config.STYLES[it % len(config.STYLES)]
+            for i, label in enumerate(labels):
+                ax.plot(manager.get_column(i, x_label, t), manager.get_column(i, y_label, t),
+                        label=label if it == 0 else None,
+                        color=config.COLORS[i % len(config.COLORS)], linestyle=style, linewidth=2)
+        ax.text(0.03, 0.2, self.get_full_title(", ".join(manager.temperatures)),
+                fontsize=14, fontweight='bold', ha='center')
+        # Légende : défauts (couleurs) puis températures (styles)
+        handles, names = ax.get_legend_handles_labels()
+        for it, t in enumerate(manager.temperatures):
+            handles.append(Line2D([], [], color='black', linewidth=2,
+                                  linestyle=config.STYLES[it % len(config.STYLES)]))
+            names.append(f"{t} K")
+        ax.legend(handles, names, loc='center left', bbox_to_anchor=(1.02, 0.5), fontsize=12, frameon=True)
+        fig.tight_layout()
+
+    def _plot_temperature_facets(self, manager, labels, x_label, y_label):
+        """
+        Une vignette par température, axes partagés, légende commune.
+        """
+        n = len(manager.temperatures)
+        ncols = math.ceil(math.sqrt(n))
+        nrows = math.ceil(n / ncols)
+        fig, axes = plt.subplots(nrows, ncols, figsize=(13, 8), sharex=True, sharey=True, squeeze=False)
+        spec = self.get_plot_spec(x_label, self._temperature_files(manager))
+        for ax, t in zip(axes.flat, manager.temperatures):
+            apply_axes_spec(ax, spec)
+            for i, label in enumerate(labels):
+                ax.plot(manager.get_column(i, x_label, t), manager.get_column(i, y_label, t), label=label,
+                        color=config.COLORS[i % len(config.COLORS)],
+                        linestyle=config.STYLES[i % len(config.STYLES)], linewidth=2)
+            ax.set_title(self.get_full_title(t), fontsize=12, fontweight='bold')
+            ax.label_outer()
+        for ax in axes.flat[n:]:
+            ax.set_visible(False)
+        handles, names = axes.flat[0].get_legend_handles_labels()
+        fig.legend(handles, names, loc='center right', fontsize=12, frameon=True)
+        fig.tight_layout(rect=(0, 0, 0.85, 1))
+
+    def _plot_temperature_steps(self, manager, labels, x_label, y_label):
+        """
+        Crée une figure unique dont les courbes sont mises à jour (set_data) à chaque changement de température.
+        """
+        fig, ax = plt.subplots(figsize=(13, 8))
+        self.format_axes(ax, x_label, self._temperature_files(manager))
+        lines = [
+            ax.plot([], [], label=label, color=config.COLORS[i % len(config.COLORS)],
+                    linestyle=config.STYLES[i % len(config.STYLES)], linewidth=2)[0]
+            for i, label in enumerate(labels)
+        ]
+        title = ax.text(0.03, 0.2, "", fontsize=14, fontweight='bold', ha='center')
+        ax.legend(loc='center left', bbox_to_anchor=(1.02, 0.5), fontsize=12, frameon=True)
+        fig.tight_layout()
+        self._step = {'fig': fig, 'lines': lines, 'title': title, 'manager': manager,
+                      'x_label': x_label, 'y_label': y_label, 'index': 0}
+        fig.canvas.mpl_connect('key_press_event', self._on_step_key)
+        self.show_temperature(0)
+
+    @staticmethod
+    def _temperature_files(manager):
+        """
+        Fichiers de toutes les températures chargées (bornes automatiques communes à toutes les températures).
+        """
+        return [fname for t in manager.temperatures for fname in manager.get_files(t)]
+
+    def show_temperature(self, index):
+        """
+        Affiche la température d'index donné dans la figure du mode défilement, sans relecture ni nouvelle figure.
+        """
+        if self._step is None:
+            return
+        step = self._step
+        manager = step['manager']
+        index %= len(manager.temperatures)
+        t = manager.temperatures[index]
+        for i, line in enumerate(step['lines']):
+            line.set_data(manager.get_column(i, step['x_label'], t), manager.get_column(i, step['y_label'], t))
+        step['title'].set_text(self.get_full_title(t))
+        step['index'] = index
+        step['fig'].canvas.draw_idle()
+
+    def step_temperature(self, delta=1):
+        """
+        Passe à la température suivante (delta=1) ou précédente (delta=-1) en mode défilement.
+        """
+        if self._step is not None:
+            self.show_temperature(self._step['index'] + delta)
+
+    def _on_step_key(self, event):
+        """
+        Callback clavier du mode défilement : flèches gauche/droite pour changer de température.
+        """
+        if event.key == 'right':
+            self.step_temperature(1)
+        elif event.key == 'left':
+            self.step_temperature(-1)
+
+    def generate_system_grid(self, systems):
+        """
+        Trace plusieurs systèmes côte à côte (une vignette par système, axes partagés).
+
+        Tous les fichiers de tous les systèmes sont lus en une seule passe parallèle via le cache
+        partagé de data_loader (temps total ~ lecture la plus lente), puis la grille est mise en page une fois.
+        La configuration atomes/sites de l'interface s'applique à chaque système.
+
+        systems : list of str
+            Préfixes des systèmes à comparer (ex : ['TiN_adpi', 'TiO2_adpi'])
+        """
+        import tkinter.messagebox as mb
+        logic = self.app.logic
+        for system in systems:
+            self.use_archive(system)
+        system_labels = [(system, logic.generate_file_list_and_labels(system)) for system in systems]
+        all_files = [fname for _, file_labels in system_labels for fname, _ in file_labels]
+        if not all_files:
+            mb.showwarning(self.app.tr('no_file_title'), self.app.tr('no_file'))
+            return
+        x_col, y_col, xaxis_type, _ = self.get_xcol_ycol(all_files[0])
+        arrays = load_arrays(all_files)
+
+        self.app.preview_text.config(state='normal')
+        self.app.preview_text.delete(1.0, 'end')
+        for fname in dict.fromkeys(all_files):
+            self.app.preview_text.insert('end', f"{fname}\n")
+        self.app.preview_text.config(state='disabled')
+
+        missing_files = [fname for fname, arr in arrays.items()
+                         if arr is None or max(x_col, y_col) >= arr.shape[1]]
+        if missing_files:
+            msg = self.app.tr('missing_files') + "\n" + "\n".join(missing_files)
+            mb.showerror(self.app.tr('missing_files_title'), msg)
+            return
+
+        n = len(systems)
+        ncols = math.ceil(math.sqrt(n))
+        nrows = math.ceil(n / ncols)
+        fig, axes = plt.subplots(nrows, ncols, figsize=(13, 8), sharex=True, sharey=True, squeeze=False)
+        spec = self.get_plot_spec(xaxis_type, all_files)
+        legend = {}
+        for ax, (system, file_labels) in zip(axes.flat, system_labels):
+            apply_axes_spec(ax, spec)
+            for i, (fname, label) in enumerate(file_labels):
+                arr = arrays[fname]
+                line, = ax.plot(arr[:, x_col], arr[:, y_col], label=label,
+                                color=config.COLORS[i % len(config.COLORS)],
+                                linestyle=config.STYLES[i % len(config.STYLES)], linewidth=2)
+                legend.setdefault(label, line)
+            ax.set_title(system, fontsize=12, fontweight='bold')
+            ax.set_ylabel("")
+            ax.label_outer()
+        for ax in axes.flat[n:]:
+            ax.set_visible(False)
+        fig.supylabel(spec['ylabel'], fontsize=15, fontweight='bold')
+        fig.suptitle(self.get_full_title(), fontsize=14, fontweight='bold')
+        fig.legend(list(legend.values()), list(legend), loc='center right', fontsize=12, frameon=True)
+        fig.tight_layout(rect=(0, 0, 0.85, 1))
+        plt.show()
+
+    def load_selection(self):
+        """
+        Retourne un DataManager contenant les données de la sélection courante, avec les labels des courbes.
+        En mode multi-températures, c'est le DataManager déjà chargé (température sélectionnée).
+
+        Retour :
+            manager, labels
+        """
+        mode = getattr(self.app, 'temperature_mode', None)
+        if self.temp_manager is not None and mode is not None and mode.get() != "single":
+            return self.temp_manager, self.temp_labels
+        logic = self.app.logic
+        file_labels = self.get_file_labels()
+        network_atoms, added_atoms = logic.get_active_atoms_sites()[:2]
+        manager = DataManager()
+        manager.load_data(network_atoms + added_atoms, [fname for fname, _ in file_labels])
+        return manager, [label for _, label in file_labels]
+
+    def export_data_dialog(self):
+        """
+        Boîte de dialogue pour exporter les courbes de la sélection courante (Parquet, HDF5, CSV).
+        """
+        from tkinter import filedialog, messagebox
+        path = filedialog.asksaveasfilename(defaultextension=".csv",
+                                            filetypes=[("CSV", "*.csv"), ("Parquet", "*.parquet"),
+                                                       ("HDF5", "*.h5 *.hdf5")],
+                                            title=self.app.tr('export_data_dialog_title'),
+                                            initialfile=self.app.output_basename.get())
+        if not path:
+            return
+        try:
+            manager, labels = self.load_selection()
+            written = manager.export_table(path, labels)
+        except (OSError, ValueError) as e:
+            messagebox.showerror(self.app.tr('error_title'), str(e))
+            return
+        messagebox.showinfo(self.app.tr('save_success_title'), f"{self.app.tr('export_data_success')} {written}")
+
+    def snapshot_dialog(self):
+        """
+        Snapshot de la sélection courante au point saisi (champ « snapshot ») de l'abscisse choisie (x_* ou mu_*) :
+        x_DP et Hf_DP de tous les défauts interpolés en une opération vectorisée (DataManager.snapshot),
+        affichés dans un tableau trié par concentration décroissante, avec export CSV.
+        """
+        import tkinter as tk
+        from tkinter import filedialog, messagebox, ttk
+        x_label = self.app.xaxis_choice_var.get()
+        try:
+            value = float(self.app.snapshot_value.get())
+        except ValueError:
+            messagebox.showerror(self.app.tr('error_title'), self.app.tr('invalid_snapshot_value'))
+            return
+        try:
+            manager, labels = self.load_selection()
+            table = manager.snapshot(x_label, value)
+        except (OSError, ValueError) as e:
+            messagebox.showerror(self.app.tr('error_title'), str(e))
+            return
+        order = np.argsort(-table[:, 0], kind="stable")  # Défauts hors domaine (NaN) en dernier
+
+        window = tk.Toplevel(self.app.root)
+        window.title(f"{self.app.tr('snapshot_title')} : {x_label} = {value:g}")
+        tree = ttk.Treeview(window, columns=("x_DP", "Hf_DP"), height=20)
+        tree.heading("#0", text=self.app.tr('defect'))
+        tree.heading("x_DP", text="x_DP")
+        tree.heading("Hf_DP", text="Hf_DP (eV)")
+        for i in order:
+            xdp, hf = table[i]
+            tree.insert('', 'end', text=labels[i],
+                        values=("-" if np.isnan(xdp) else f"{xdp:.3e}", "-" if np.isnan(hf) else f"{hf:.4f}"))
+        tree.pack(fill='both', expand=True)
+
+        def export_csv():
+            path = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV", "*.csv")],
+                                                title=self.app.tr('export_data_dialog_title'),
+                                                initialfile=f"{self.app.output_basename.get()}_snapshot")
+            if not path:
+                return
+            try:
+                written = manager.export_snapshot(path, x_label, value, labels)
+            except (OSError, ValueError) as e:
+                messagebox.showerror(self.app.tr('error_title'), str(e))
+                return
+            messagebox.showinfo(self.app.tr('save_success_title'), f"{self.app.tr('export_data_success')} {written}")
+
+        tk.Button(window, text=self.app.tr('export_csv'), command=export_csv).pack(pady=4)
+
+    def export_animation_dialog(self):
+        """
+        Boîte de dialogue pour exporter l'animation du balayage en température (MP4, GIF).
+        """
+        from tkinter import filedialog, messagebox
+        path = filedialog.asksaveasfilename(defaultextension=".mp4",
+                                            filetypes=[("MP4", "*.mp4"), ("GIF", "*.gif")],
+                                            title=self.app.tr('animation_dialog_title'),
+                                            initialfile=self.app.output_basename.get())
+        if not path:
+            return
+        try:
+            if self.export_temperature_animation(path, processes=config.ANIMATION_PROCESSES):
+                messagebox.showinfo(self.app.tr('save_success_title'), f"{self.app.tr('save_success_msg')} {path}")
+        except (RuntimeError, ValueError) as e:
+            messagebox.showerror(self.app.tr('error_title'), str(e))
+
+    def export_temperature_animation(self, savepath, fps=config.ANIMATION_FPS, processes=0):
+        """
+        Exporte une animation (une image par température) du tracé courant.
+
+        Les données de toutes les températures sont chargées une seule fois (load_temperature_data).
+        En mode séquentiel, une seule figure est réutilisée : seules les courbes (set_data) et le titre
+        changent d'une image à l'autre, et les images sont envoyées au fur et à mesure à l'encodeur
+        (ffmpeg pour MP4, Pillow pour GIF).
+
+        Paramètres :
+            savepath : chemin de sortie (.mp4 ou .gif)
+            fps : images par seconde
+            processes : nombre de processus de rendu (0 ou 1 = rendu séquentiel dans ce processus ; rendu
+                        séquentiel aussi en dessous de config.ANIMATION_PARALLEL_MIN températures)
+        Retour :
+            True si l'animation a été écrite, False si aucune donnée
+        Exception :
+            ValueError pour un format non supporté, RuntimeError si ffmpeg est absent pour un MP4
+        """
+        ext = savepath.rsplit('.', 1)[-1].lower()
+        if ext not in ("mp4", "gif"):
+            raise ValueError(self.app.tr('unsupported_format'))
+        ffmpeg = shutil.which(plt.rcParams['animation.ffmpeg_path'])
+        if ext == "mp4" and ffmpeg is None:
+            raise RuntimeError(self.app.tr('ffmpeg_missing'))
+
+        manager, labels, missing = self.load_temperature_data()
+        if missing or not labels or not manager.temperatures:
+            return False
+        x_label = self.get_xcol_ycol(None)[2]
+        y_label = self.app.yaxis_choice_var.get()
+
+        spec = self.get_plot_spec(x_label, self._temperature_files(manager))
+        spec.update({
+            'figsize': (13, 8), 'dpi': config.ANIMATION_DPI, 'labels': labels,
+            'colors': [config.COLORS[i % len(config.COLORS)] for i in range(len(labels))],
+            'styles': [config.STYLES[i % len(config.STYLES)] for i in range(len(labels))],
+        })
+        frames = [
+            ([(manager.get_column(i, x_label, t), manager.get_column(i, y_label, t)) for i in range(len(labels))],
+             self.get_full_title(t))
+            for t in manager.temperatures
+        ]
+
+        if processes and processes > 1 and len(frames) >= config.ANIMATION_PARALLEL_MIN:
+            self._write_frames_parallel(spec, frames, savepath, fps, processes, ffmpeg)
+            return True
+
+        from matplotlib import animation
+        fig, lines, title = _build_animation_figure(spec)
+        anim = animation.FuncAnimation(
+            fig, lambda k: _set_animation_frame(lines, title, frames[k]),
+            frames=len(frames), init_func=lambda: _set_animation_frame(lines, title, frames[0]),
+            blit=True, repeat=False)
+        writer = animation.FFMpegWriter(fps=fps) if ext == "mp4" else animation.PillowWriter(fps=fps)
+        anim.save(savepath, writer=writer, dpi=spec['dpi'])
+        return True
+
+    @staticmethod
+    def _write_frames_parallel(spec, frames, savepath, fps, processes, ffmpeg):
+        """
+        Rend les images par petits blocs (config.ANIMATION_CHUNK_FRAMES) dans un pool de processus et les transmet
+        dans l'ordre à l'encodeur, au fur et à mesure : flux RGBA brut sur l'entrée standard de ffmpeg (MP4 et GIF).
+        Au plus 2 * processes blocs sont en cours : la mémoire utilisée ne dépend pas du nombre d'images.
+        Sans ffmpeg, un GIF est écrit par Pillow, qui garde toutes les images (en palette, 1 octet par pixel).
+
+        Exception :
+            RuntimeError si ffmpeg échoue (message d'erreur de ffmpeg)
+        """
+        size = config.ANIMATION_CHUNK_FRAMES
+        chunks = [frames[i:i + size] for i in range(0, len(frames), size)]
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            results = _ordered_results(pool, _render_animation_frames, spec, chunks, 2 * processes)
+            if ffmpeg is None:
+                from PIL import Image
+                images = [Image.frombytes("RGBA", (w, h), rgba).convert("RGB").quantize()
+                          for (w, h), chunk in results for rgba in chunk]
+                images[0].save(savepath, save_all=True, append_images=images[1:],
+                               duration=int(1000 / fps), loop=0)
+                return
+            _encode_with_ffmpeg(ffmpeg, results, savepath, fps)
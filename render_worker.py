@@ -0,0 +1,175 @@
+"""
+Processus de rendu persistant (matplotlib hors du processus de l'interface).
+
+Responsabilités principales :
+- Lance une seule fois un processus fils qui importe matplotlib (backend Agg), charge les polices
+  et prépare le rendu mathtext (ex : Ti$_{0.51}$N$_{0.49}$) au démarrage
+- Reçoit une spécification de tracé (voir Plotter.get_export_spec) et les courbes via une mémoire partagée
+  (pas de sérialisation des tableaux dans le tube de communication)
+- Réutilise la dernière figure quand seule la donnée change (mêmes axes, titre, légende) : mise à jour
+  des courbes par set_data, sans reconstruire la figure
+- Retourne l'image (PNG ou autre format) en bytes, ou écrit directement le fichier demandé
+"""
+
+import io
+import multiprocessing
+import threading
+from multiprocessing import shared_memory
+import numpy as np
+
+# Clés de la spécification qui déterminent la mise en page (figure reconstruite si l'une change)
+_LAYOUT_KEYS = ('figsize', 'xlim', 'ylim', 'xscale', 'yscale', 'xlabel', 'ylabel', 'title',
+                'labels', 'colors', 'styles')
+
+
+def _pack_curves(curves):
+    """
+    Copie les courbes [(x, y), ...] dans un bloc de mémoire partagée (float64, x puis y pour chaque courbe).
+
+    Retour :
+        shm, layout : bloc de mémoire partagée (à libérer par l'appelant) et taille de chaque courbe
+    """
+    layout = [len(x) for x, _ in curves]
+    shm = shared_memory.SharedMemory(create=True, size=max(1, 16 * sum(layout)))
+    flat = np.ndarray((2 * sum(layout),), dtype=np.float64, buffer=shm.buf)
+    pos = 0
+    for (x, y), n in zip(curves, layout):
+        flat[pos:pos + n] = x
+        flat[pos + n:pos + 2 * n] = y
+        pos += 2 * n
+    del flat  # Aucune vue ne doit survivre à la fermeture du bloc
+    return shm, layout
+
+
+def _unpack_curves(name, layout):
+    """
+    Lit (copie) les courbes d'un bloc de mémoire partagée créé par _pack_curves.
+    """
+    # Contexte spawn : le processus fils partage le resource_tracker du parent, qui reste seul à supprimer le bloc
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        flat = np.array(np.ndarray((2 * sum(layout),), dtype=np.float64, buffer=shm.buf))
+    finally:
+        shm.close()
+    curves, pos = [], 0
+    for n in layout:
+        curves.append((flat[pos:pos + n], flat[pos + n:pos + 2 * n]))
+        pos += 2 * n
+    return curves
+
+
+def _worker_main(conn):
+    """
+    Boucle du processus de rendu : attend les requêtes sur conn, répond ('ok', résultat) ou ('error', message).
+    Une requête None arrête le processus.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    from plotter import _build_export_figure, prepare_export_figure, save_figure
+
+    # Préchauffage : polices et mathtext chargés avant la première vraie requête
+    warm = {'figsize': (4, 3), 'xlim': (0, 1), 'ylim': (1e-3, 1), 'xscale': 'linear', 'yscale': 'log',
+            'xlabel': r'$x_{H}$', 'ylabel': 'x', 'title': r'Ti$_{0.51}$N$_{0.49}$', 'curves': [([0, 1], [1e-2, 1e-1])],
+            'labels': [r'V$_{site}$'], 'colors': ['blue'], 'styles': ['-']}
+    _build_export_figure(warm).canvas.draw()
+
+    fig, key = None, None
+    while True:
+        request = conn.recv()
+        if request is None:
+            break
+        try:
+            spec = dict(request['spec'])
+            spec['curves'] = _unpack_curves(request['shm'], request['layout'])
+            new_key = tuple(repr(spec.get(k)) for k in _LAYOUT_KEYS) + (request['rasterize'],)
+            if fig is None or new_key != key:
+                fig, key = _build_export_figure(spec), new_key
+            else:
+                # Même mise en page : seules les données des courbes changent
+                for line, (x, y) in zip(fig.axes[0].get_lines(), spec['curves']):
+                    line.set_data(x, y)
+            points = prepare_export_figure(fig, request['tolerance'], request['rasterize'])
+            if request['savepath']:
+                result = dict(save_figure(fig, request['savepath'], dpi=request['dpi']), points=points)
+            else:
+                buf = io.BytesIO()
+                fig.savefig(buf, format=request['format'], dpi=request['dpi'])
+                result = buf.getvalue()
+            conn.send(('ok', result))
+        except Exception as e:  # L'erreur est renvoyée à l'interface, le processus reste disponible
+            fig, key = None, None
+            conn.send(('error', f"{type(e).__name__}: {e}"))
+
+
+class RenderWorker:
+    """
+    Client du processus de rendu persistant (démarré au premier rendu, redémarré s'il s'est arrêté).
+    Les requêtes sont traitées une par une (verrou), depuis n'importe quel thread du processus de l'interface.
+    """
+
+    def __init__(self):
+        self._process = None
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """
+        Démarre le processus de rendu (contexte spawn : pas de copie de l'état Tkinter du processus parent).
+        """
+        if self._process is not None and self._process.is_alive():
+            return
+        ctx = multiprocessing.get_context("spawn")
+        self._conn, child_conn = ctx.Pipe()
+        self._process = ctx.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self._process.start()
+        child_conn.close()
+
+    def stop(self):
+        """
+        Arrête le processus de rendu, s'il est actif.
+        """
+        if self._process is None:
+            return
+        try:
+            self._conn.send(None)
+        except (OSError, EOFError):
+            pass
+        self._process.join(timeout=5)
+        if self._process.is_alive():
+            self._process.terminate()
+        self._conn.close()
+        self._process, self._conn = None, None
+
+    def render(self, spec, savepath=None, fmt="png", dpi=100, tolerance=None, rasterize=False):
+        """
+        Rend une figure dans le processus de rendu.
+
+        Paramètres :
+            spec : spécification de tracé avec ses courbes (voir Plotter.get_export_spec)
+            savepath : fichier à écrire (None = retourner l'image en bytes)
+            fmt : format de l'image retournée en bytes (ignoré si savepath est donné : format de l'extension)
+            dpi : résolution
+            tolerance, rasterize : options d'export publication (voir plotter.prepare_export_figure)
+        Retour :
+            bytes de l'image, ou dict {'path', 'size', 'seconds', 'points'} si savepath est donné
+        Exception :
+            RuntimeError si le rendu échoue ou si le processus de rendu s'est arrêté
+        """
+        request = {k: v for k, v in spec.items() if k != 'curves'}
+        shm, layout = _pack_curves(spec['curves'])
+        try:
+            with self._lock:
+                self.start()
+                try:
+                    self._conn.send({'spec': request, 'shm': shm.name, 'layout': layout, 'savepath': savepath,
+                                     'format': fmt, 'dpi': dpi, 'tolerance': tolerance, 'rasterize': rasterize})
+                    status, result = self._conn.recv()
+                except (OSError, EOFError) as e:
+                    self._process = None  # Processus arrêté : relancé à la prochaine requête
+                    raise RuntimeError(f"Processus de rendu interrompu : {e}") from e
+        finally:
+            shm.close()
+            shm.unlink()
+        if status != 'ok':
+            raise RuntimeError(result)
+        return result
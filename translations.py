@@ -62,6 +62,58 @@ translations = {
         'select_atoms': "Sélectionner les atomes à tracer",
         'select_sites': "Sélectionner les sites à tracer",
         'apply_selection': "Appliquer la sélection",
+
+        # Mode multi-températures
+        'temperature_mode': "Mode températures",
+        'temp_mode_single': "Température unique",
+        'temp_mode_overlay': "Superposer",
+        'temp_mode_facet': "Une vignette par température",
+        'temp_mode_step': "Défilement",
+        'prev_temperature': "Température précédente",
+        'next_temperature': "Température suivante",
+        'export_animation': "Exporter l'animation",
+        'animation_dialog_title': "Enregistrer l'animation sous...",
+        'ffmpeg_missing': "ffmpeg est introuvable : export MP4 impossible (utiliser GIF).",
+
+        # Comparaison multi-systèmes
+        'compare_systems': "Systèmes à comparer (séparés par des virgules) :",
+        'generate_comparison': "Comparer les systèmes",
+
+        # Export des données
+        'export_data': "Exporter les données",
+        'export_data_dialog_title': "Exporter les données sous...",
+        'export_data_success': "Données exportées dans",
+        'pack_system': "Archiver le système",
+        'pack_success': "Archive créée :",
+        'watch_mode': "Suivre les fichiers en cours d'écriture",
+        'compact_storage': "Stockage compact (float32, précision ~4e-6)",
+        'auto_limits': "Bornes automatiques",
+        'prune_invisible': "Ignorer les défauts hors fenêtre",
+        'pruned_files': "Défauts ignorés (sous ymin) :",
+        'top_k': "Défauts les plus concentrés (K)",
+        'top_k_at': "Classement en x =",
+        'top_k_selected': "{k} défauts les plus concentrés :",
+        'hover_inspector': "Inspecteur au survol",
+        'inspector_title': "Valeurs au curseur",
+        'snapshot': "Snapshot en",
+        'toggle_xaxis': "Abscisse x <-> mu (touche m)",
+        'analyze_slopes': "Régimes de Brouwer (pentes)",
+        'slope_report_title': "Pentes de log10(x_DP) en fonction de {x} (ruptures) :",
+        'snapshot_title': "Snapshot",
+        'invalid_snapshot_value': "Valeur du snapshot invalide (nombre attendu)",
+        'defect': "Défaut",
+        'export_csv': "Exporter en CSV",
+        'export_simplify': "Simplification des courbes (pt)",
+        'export_rasterize': "Rastériser les courbes",
+        'export_report': "Taille : {size}, rendu : {seconds:.2f} s, points : {after}/{before}",
+        'batch_export': "Export multi-formats",
+        'batch_export_dialog_title': "Dossier de l'export multi-formats",
+        'batch_formats': "Formats",
+        'batch_dpis': "Résolutions (dpi)",
+        'invalid_dpi': "Résolution invalide (entiers séparés par des virgules)",
+        'preview_plot': "Aperçu rapide",
+        'preview_title': "Aperçu",
+        'image_cache_report': "Cache d'aperçus : {hits} trouvés, {misses} rendus, {entries} images ({size})",
     },
     'en': {
         'system_params': "System parameters",
@@ -113,5 +165,57 @@ translations = {
         'select_atoms': "Select atoms to plot",
         'select_sites': "Select sites to plot",
         'apply_selection': "Apply selection",
+
+        # Multi-temperature mode
+        'temperature_mode': "Temperature mode",
+        'temp_mode_single': "Single temperature",
+        'temp_mode_overlay': "Overlay",
+        'temp_mode_facet': "One panel per temperature",
+        'temp_mode_step': "Step through",
+        'prev_temperature': "Previous temperature",
+        'next_temperature': "Next temperature",
+        'export_animation': "Export animation",
+        'animation_dialog_title': "Save animation as...",
+        'ffmpeg_missing': "ffmpeg not found: MP4 export unavailable (use GIF).",
+
+        # Multi-system comparison
+        'compare_systems': "Systems to compare (comma-separated):",
+        'generate_comparison': "Compare systems",
+
+        # Data export
+        'export_data': "Export data",
+        'export_data_dialog_title': "Export data as...",
+        'export_data_success': "Data exported to",
+        'pack_system': "Pack system",
+        'pack_success': "Archive written:",
+        'watch_mode': "Follow files being written",
+        'compact_storage': "Compact storage (float32, ~4e-6 precision)",
+        'auto_limits': "Auto limits",
+        'prune_invisible': "Skip defects outside the window",
+        'pruned_files': "Skipped defects (below ymin):",
+        'top_k': "Most concentrated defects (K)",
+        'top_k_at': "Rank at x =",
+        'top_k_selected': "{k} most concentrated defects:",
+        'hover_inspector': "Hover inspector",
+        'inspector_title': "Values at cursor",
+        'snapshot': "Snapshot at",
+        'toggle_xaxis': "x <-> mu axis (key m)",
+        'analyze_slopes': "Brouwer regimes (slopes)",
+        'slope_report_title': "Slopes of log10(x_DP) versus {x} (breakpoints):",
+        'snapshot_title': "Snapshot",
+        'invalid_snapshot_value': "Invalid snapshot value (number expected)",
+        'defect': "Defect",
+        'export_csv': "Export to CSV",
+        'export_simplify': "Curve simplification (pt)",
+        'export_rasterize': "Rasterize curves",
+        'export_report': "Size: {size}, render: {seconds:.2f} s, points: {after}/{before}",
+        'batch_export': "Multi-format export",
+        'batch_export_dialog_title': "Multi-format export folder",
+        'batch_formats': "Formats",
+        'batch_dpis': "Resolutions (dpi)",
+        'invalid_dpi': "Invalid resolution (comma-separated integers)",
+        'preview_plot': "Quick preview",
+        'preview_title': "Preview",
+        'image_cache_report': "Preview cache: {hits} hits, {misses} renders, {entries} images ({size})",
     }
 }
@@ -7,6 +7,7 @@ Responsabilités principales :
 - Gestion dynamique des widgets (atomes, sites, axes, sélections…)
 - Traduction en temps réel de tous les textes de l’interface via le dictionnaire translations
 - Gestion des interactions utilisateur (tracé, sauvegarde, changement de langue…)
+- Import différé du plotter (matplotlib, NumPy) : la fenêtre s'affiche avant le chargement des modules lourds
 
 Structure :
 - Classe DefectPlotterApp, qui contient tout l’état de l’application et les callbacks de l’UI
@@ -16,9 +17,7 @@ import tkinter as tk
 from tkinter import ttk
 from translations import translations
 from defect_logic import DefectLogic
-from plotter import Plotter
 import config
-import data_loader
 
 class DefectPlotterApp:
     def __init__(self, root):
@@ -45,6 +44,33 @@ class DefectPlotterApp:
         self.output_basename = tk.StringVar(value="conc_plot")
         self.title_text = tk.StringVar(value=config.DEFAULT_TITLE)
         self.temperature = tk.StringVar(value=config.DEFAULT_TEMP)
+        # Mode multi-températures : 'single', 'overlay', 'facet' ou 'step'
+        self.temperature_mode = tk.StringVar(value="single")
+        # Comparaison multi-systèmes : préfixes séparés par des virgules (ex : "TiN_adpi, TiO2_adpi")
+        self.compare_systems = tk.StringVar(value="")
+        # Mode suivi : mise à jour du graphique pendant qu'ADPI écrit encore les fichiers
+        self.watch_mode = tk.BooleanVar(value=False)
+        # Stockage compact (float32, x_DP en log10) des données multi-températures
+        self.compact_storage = tk.BooleanVar(value=False)
+        # Bornes automatiques : union des min/max des courbes tracées (au lieu des bornes saisies)
+        self.auto_limits = tk.BooleanVar(value=False)
+        # Élagage : les défauts dont x_DP reste sous ymin sur l'intervalle affiché ne sont ni lus ni tracés
+        self.prune_invisible = tk.BooleanVar(value=False)
+        # Mode top-K : nombre de défauts les plus concentrés à tracer (vide = sélection atomes/sites)
+        # et abscisse de classement (vide = maximum sur l'intervalle affiché)
+        self.top_k = tk.StringVar(value="")
+        self.top_k_at = tk.StringVar(value="")
+        # Inspecteur au survol : tableau des valeurs de toutes les courbes à l'abscisse du curseur
+        self.hover_inspector = tk.BooleanVar(value=False)
+        # Snapshot : valeur de l'abscisse choisie (x_* ou mu_*) où relever toutes les concentrations
+        self.snapshot_value = tk.StringVar(value="0.01")
+        # Export publication : tolérance de simplification des courbes (points, vide = désactivée)
+        # et rastérisation des courbes seules (textes et axes vectoriels)
+        self.export_simplify = tk.StringVar(value="")
+        self.export_rasterize = tk.BooleanVar(value=False)
+        # Export multi-formats : formats et résolutions séparés par des virgules
+        self.batch_formats = tk.StringVar(value="png, pdf, svg")
+        self.batch_dpis = tk.StringVar(value="300")
 
         # Options d'affichage (cases à cocher)
         self.show_vacancies = tk.BooleanVar(value=True)
@@ -70,10 +96,21 @@ class DefectPlotterApp:
         self.yaxis_choice_var = tk.StringVar()
 
         self.logic = DefectLogic(self)
-        self.plotter = Plotter(self)
+        self._plotter = None  # Créé au premier usage (voir la propriété plotter)
         self.widgets_to_translate = {}
         self.create_widgets()
 
+    @property
+    def plotter(self):
+        """
+        Plotter de l'application, créé au premier usage : matplotlib et NumPy ne sont importés qu'à ce moment
+        (ou plus tôt, en arrière-plan, par main.warm_imports), pas avant l'affichage de la fenêtre.
+        """
+        if self._plotter is None:
+            from plotter import Plotter
+            self._plotter = Plotter(self)
+        return self._plotter
+
     def tr(self, key):
         """Méthode utilitaire pour la traduction dynamique des textes."""
         return translations[self.language].get(key, key)
@@ -111,6 +148,7 @@ class DefectPlotterApp:
         mu_labels = [f"mu_{v}" for v in atom_names]
         x_labels = [f"x_{v}" for v in atom_names]
         self.all_colnames = mu_labels + x_labels + ["x_DP", "Hf_DP"]
+        self.col_index = {label: i for i, label in enumerate(self.all_colnames)}
         absc_choices = mu_labels + x_labels
         if not absc_choices:
             self.xaxis_choice['values'] = []
@@ -134,6 +172,7 @@ class DefectPlotterApp:
         """
         Met à jour dynamiquement les menus ComboBox des axes selon le contenu du fichier (liste des colonnes).
         """
+        import data_loader
         colnames = data_loader.get_colnames(filename)
         self.xaxis_choice['values'] = colnames
         self.yaxis_choice['values'] = colnames
@@ -168,7 +207,27 @@ class DefectPlotterApp:
         Callback pour générer le graphique, après mise à jour de la sélection atomes/sites.
         """
         self.update_selected_atoms_sites()
-        self.plotter.generate_plot()
+        mode = self.temperature_mode.get()
+        if mode in ("overlay", "facet", "step"):
+            self.plotter.generate_temperature_plot(mode)
+        else:
+            self.plotter.generate_plot(watch=self.watch_mode.get())
+
+    def generate_comparison_plot(self):
+        """
+        Callback pour tracer côte à côte les systèmes listés dans le champ de comparaison.
+        """
+        self.update_selected_atoms_sites()
+        systems = [s.strip() for s in self.compare_systems.get().split(",") if s.strip()]
+        if not systems:
+            systems = [self.system_name.get()]
+        self.plotter.generate_system_grid(systems)
+
+    def step_temperature(self, delta=1):
+        """
+        Callback pour passer à la température suivante/précédente en mode défilement (sans relecture).
+        """
+        self.plotter.step_temperature(delta)
 
     def save_plot_dialog(self):
         """
@@ -176,6 +235,69 @@ class DefectPlotterApp:
         """
         self.plotter.save_plot_dialog()
 
+    def show_preview(self):
+        """
+        Callback pour afficher un aperçu PNG du graphique (immédiat si la même configuration a déjà été rendue).
+        """
+        self.update_selected_atoms_sites()
+        self.plotter.show_preview()
+
+    def export_batch_dialog(self):
+        """
+        Callback pour exporter le graphique dans plusieurs formats/résolutions en un seul tracé.
+        """
+        self.update_selected_atoms_sites()
+        self.plotter.export_batch_dialog()
+
+    def pack_system(self):
+        """
+        Callback pour regrouper tous les fichiers du système courant dans une archive unique
+        (lecture ultérieure en une seule ouverture de fichier).
+        """
+        from tkinter import messagebox
+        import data_loader
+        try:
+            path = data_loader.pack_system(self.system_name.get())
+        except (OSError, ValueError) as e:
+            messagebox.showerror(self.tr('error_title'), str(e))
+            return
+        messagebox.showinfo(self.tr('save_success_title'), f"{self.tr('pack_success')} {path}")
+
+    def export_data_dialog(self):
+        """
+        Callback pour exporter les données des courbes sélectionnées (Parquet/HDF5/CSV).
+        """
+        self.update_selected_atoms_sites()
+        self.plotter.export_data_dialog()
+
+    def analyze_slopes(self):
+        """
+        Callback pour l'analyse des régimes de Brouwer (pentes et ruptures) de la sélection courante.
+        """
+        self.update_selected_atoms_sites()
+        self.plotter.analyze_slopes()
+
+    def toggle_xaxis(self):
+        """
+        Callback pour basculer l'abscisse de la figure affichée entre composition x_* et potentiel mu_* (sans relecture).
+        """
+        self.plotter.toggle_xaxis()
+
+    def snapshot_dialog(self):
+        """
+        Callback pour afficher (et exporter en CSV) les concentrations et énergies de formation de tous les défauts
+        au point saisi de l'abscisse.
+        """
+        self.update_selected_atoms_sites()
+        self.plotter.snapshot_dialog()
+
+    def export_animation_dialog(self):
+        """
+        Callback pour exporter l'animation du balayage en température (MP4/GIF).
+        """
+        self.update_selected_atoms_sites()
+        self.plotter.export_animation_dialog()
+
     def change_language(self, lang):
         """
         Change la langue de l’interface et met à jour tous les labels/widgets.
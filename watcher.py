@@ -0,0 +1,100 @@
+"""
+Surveillance des fichiers de données pendant qu'ADPI écrit encore (mode « suivi »).
+
+Responsabilités principales :
+- Vérifie périodiquement (boucle Tkinter `after`) les fichiers de la sélection courante
+- Utilise inotify (module optionnel inotify_simple) quand il est disponible, pour ne consulter
+  que les fichiers réellement modifiés ; sinon simple scrutation par os.stat
+- Détecte les lignes ajoutées et les fichiers nouvellement créés, ne lit que la fin ajoutée
+  (data_loader.refresh_file) et prévient le plotter pour une mise à jour incrémentale du graphique
+"""
+
+import os
+import data_loader
+import config
+
+try:
+    from inotify_simple import INotify, flags
+except ImportError:  # Pas d'inotify : scrutation par os.stat
+    INotify = None
+
+
+class DataWatcher:
+    def __init__(self, root, files, on_change, interval_ms=config.WATCH_INTERVAL_MS):
+        """
+        Paramètres :
+            root : fenêtre Tkinter (pour planifier les vérifications avec root.after)
+            files : liste des fichiers à surveiller (existants ou pas encore créés)
+            on_change : fonction appelée avec (appended, created), listes des fichiers ayant reçu
+                        de nouvelles lignes et des fichiers apparus (ou réécrits)
+            interval_ms : période de vérification en millisecondes
+        """
+        self.root = root
+        self.files = list(files)
+        self.on_change = on_change
+        self.interval_ms = interval_ms
+        self.debug = False  # Mettre à True pour afficher les fichiers modifiés
+        self._after_id = None
+        self._inotify = None
+
+    def start(self):
+        """
+        Démarre la surveillance (vérification toutes les interval_ms millisecondes).
+        """
+        if INotify is not None:
+            self._inotify = INotify()
+            mask = flags.MODIFY | flags.CREATE | flags.MOVED_TO | flags.CLOSE_WRITE
+            for folder in {os.path.dirname(os.path.abspath(f)) for f in self.files}:
+                self._inotify.add_watch(folder, mask)
+        self._schedule()
+
+    def stop(self):
+        """
+        Arrête la surveillance.
+        """
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
+        if self._inotify is not None:
+            self._inotify.close()
+            self._inotify = None
+
+    def poll(self):
+        """
+        Vérifie une fois les fichiers surveillés et met à jour le cache de data_loader.
+
+        Retour :
+            (appended, created) : fichiers ayant reçu de nouvelles lignes, fichiers apparus ou relus entièrement
+        """
+        if self._inotify is not None:
+            names = {event.name for event in self._inotify.read(timeout=0)}
+            if not names:
+                return [], []
+            candidates = [f for f in self.files if os.path.basename(f) in names]
+        else:
+            candidates = self.files
+        appended, created = [], []
+        for f in candidates:
+            try:
+                status = data_loader.refresh_file(f)
+            except (OSError, ValueError) as e:
+                # Fichier en cours de création ou contenu provisoirement illisible : on réessaiera
+                if self.debug:
+                    print(f"[DEBUG] Lecture différée de {f} : {e}")
+                continue
+            if status == 'appended':
+                appended.append(f)
+            elif status == 'reloaded':
+                created.append(f)
+        if self.debug and (appended or created):
+            print(f"[DEBUG] Lignes ajoutées : {appended} ; fichiers nouveaux/relus : {created}")
+        return appended, created
+
+    def _schedule(self):
+        self._after_id = self.root.after(self.interval_ms, self._tick)
+
+    def _tick(self):
+        appended, created = self.poll()
+        if appended or created:
+            self.on_change(appended, created)
+        self._schedule()